@@ -1,20 +1,24 @@
-from PyQt5.uic import loadUi
+import startup_profile
 from PyQt5 import QtWidgets, QtGui, QtCore
-from PyQt5.QtCore import Qt, QSize, QTimer, QResource
-from PyQt5.QtWidgets import QApplication, QMainWindow, QFileDialog, QWidget, QTabWidget, QDialog, QComboBox, QLabel, QLineEdit, QTextEdit, QStackedLayout, QPushButton, QToolButton, QMenu, QScrollArea, QVBoxLayout, QHBoxLayout, QSizePolicy
+from PyQt5.QtCore import Qt, QSize, QTimer, QResource, QThreadPool
+from PyQt5.QtWidgets import QApplication, QMainWindow, QFileDialog, QWidget, QTabWidget, QDialog, QComboBox, QLabel, QLineEdit, QTextEdit, QStackedLayout, QPushButton, QToolButton, QMenu, QScrollArea, QVBoxLayout, QHBoxLayout, QSizePolicy, QProgressBar, QListView, QAbstractItemView, QFrame
 from PyQt5.QtGui import QPixmap, QFont, QIcon
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from pyflora_db import db_engine, Users, Plants, Pots, SensorReadings
-from bs4 import BeautifulSoup
+from sqlalchemy import func, select
+from pyflora_db import get_engine, Users, Plants, Pots, SensorReadings
 import resource_rc
-from sensor_light import measure_light_intensity
-from openweather_temp import current_temperature_ow
-from sensor_moisture import initial_soil_moisture, measure_soil_moisture
-from sensor_ph import measure_soil_ph
+from openweather_temp import get_weather_provider
+from sensor_service import SensorReadingService
+import sensor_service
+import sensor_sync
+import sensor_rollups
+import sensor_retention
+from sensor_worker import SensorSyncWorker, WateringWorker, RetentionWorker, BackfillWorker
+from search_index import SearchIndex
+from image_cache import thumbnail_url
+from ui_loader import load_ui
+from pyflora_models import PlantsListModel, PlantItemDelegate, PotsListModel, PotItemDelegate, ID_ROLE
 import datetime as dt
-import pyqtgraph as pg
-from pyqtgraph import plot
 import random
 import sys
 
@@ -97,6 +101,29 @@ NON_EDITABLE_QLINEEDIT_STYLE = """
             padding-left: 10px
     }
 """
+LIST_VIEW_STYLE = """
+    QListView {
+        background-color: transparent;
+        border: none;
+    }
+"""
+
+SYNC_PROGRESS_STYLE = """
+    QProgressBar {
+        background-color: #E9E5E3;
+        border-radius: 5px;
+        font: 10pt "Candara";
+        text-align: center;
+    }
+
+    QProgressBar::chunk {
+        background-color: #A3BAB4;
+        border-radius: 5px;
+    }
+"""
+
+#with [retention] enabled = yes, old readings are cleaned up (sensor_retention) a minute after login and then every interval_hours
+RETENTION_START_DELAY = 60 * 1000
 
 
 class NotificationWindow(QDialog):
@@ -203,7 +230,7 @@ class LoginScreen(QMainWindow):
 
         self.setWindowFlag(Qt.FramelessWindowHint) 
 
-        loadUi("pyflora_login.ui", self)
+        load_ui("pyflora_login.ui", self)
 
         self.login_button.clicked.connect(self.authenticate)
 
@@ -212,16 +239,20 @@ class LoginScreen(QMainWindow):
 
     def authenticate(self):
 
+        startup_profile.mark("waiting for login")
+
         username = self.username_input.text()
         password = self.password_input.text()
 
-        with Session(bind=db_engine) as session:
+        with Session(bind=get_engine()) as session:
             user = session.query(Users).filter(Users.username == username, Users.password == password).one_or_none()
 
             if user:
                 self.close()
                 self.home_screen = HomeScreen(user, self)
                 self.home_screen.show()
+                startup_profile.mark("home screen shown")
+                QTimer.singleShot(0, startup_profile.first_tab_ready)
             else:
                 self.login_info.setText('Incorrect username or password')
 
@@ -239,7 +270,7 @@ class HomeScreen(QMainWindow):
 
         self.setWindowFlag(Qt.FramelessWindowHint) 
 
-        loadUi("pyflora_app.ui", self)
+        load_ui("pyflora_app.ui", self)
 
         QResource.registerResource('./pyflora.qrc')
 
@@ -252,13 +283,14 @@ class HomeScreen(QMainWindow):
 
         self.login_screen = login_screen
 
-        self.plants_tab = PlantsTab(self)
-        self.pots_tab = PotsTab(self)
+        #the Plants and Pots tabs are built the first time they are opened (build_tab)
+        self.plants_tab = None
+        self.pots_tab = None
         self.notification_tab = NotificationTab(self)
         self.home_tab = self.findChild(QWidget, "home_tab")
 
         self.image_label = self.findChild(QLabel, "image_label")
-        self.image_label.setStyleSheet(f"border-image: url({user.image_path}); \
+        self.image_label.setStyleSheet(f"border-image: url({thumbnail_url(user.image_path)}); \
                             background-position: center; \
                             background-repeat: no-repeat; \
                             background-clip: border-box; \
@@ -287,6 +319,7 @@ class HomeScreen(QMainWindow):
         self.settings_button.clicked.connect(self.home_info_message)
         self.logout_button.clicked.connect(self.logout)
 
+        self.pyflora_tabs.currentChanged.connect(self.build_tab)
         self.pyflora_tabs.currentChanged.connect(self.reset_and_clear)
 
         self.home_info = self.pyflora_tabs.findChild(QLabel, "home_info")
@@ -294,14 +327,33 @@ class HomeScreen(QMainWindow):
         self.home_all = self.pyflora_tabs.findChild(QWidget, "home_all")
 
         self.stacklayout_home = QStackedLayout()
-        self.profile_info = loadUi("profile_info.ui")
-
         self.stacklayout_home.addWidget(self.home_all)
-        self.stacklayout_home.addWidget(self.profile_info)
 
         layout = self.home_layout
         layout.addLayout(self.stacklayout_home)
 
+        #the profile page is built the first time it is opened (create_profile_page)
+        self.profile_info = None
+        self.profile_edit_widgets_created = False
+
+        #not the global pool: Qt converts images for QPixmap on it, and with a long job running there
+        #a pixmap load on the GUI thread waits for a pool thread that waits for the GIL
+        self.retention_pool = QThreadPool()
+        self.retention_pool.setMaxThreadCount(1)
+        self.retention_worker = None
+        self.retention_timer = QTimer(self)
+        self.retention_timer.timeout.connect(self.start_retention_worker)
+        QApplication.instance().aboutToQuit.connect(lambda: self.stop_retention(wait=True))
+
+        if sensor_retention.enabled():
+            self.retention_timer.start(RETENTION_START_DELAY)
+
+
+    def create_profile_page(self):
+
+        self.profile_info = load_ui("profile_info.ui")
+        self.stacklayout_home.addWidget(self.profile_info)
+
         self.verticalLayout_profile = self.profile_info.findChild(QVBoxLayout, "verticalLayout_profile")
 
         self.return_profile = self.profile_info.findChild(QToolButton, "return_profile")
@@ -318,11 +370,12 @@ class HomeScreen(QMainWindow):
         self.edit_profile.triggered.connect(self.edit_profile_triggered)
         self.delete_profile.triggered.connect(self.delete_profile_triggered)
 
-        self.profile_edit_widgets_created = False
-
 
     def logout(self):
-    
+
+        #the window stays alive after logout, its clean-up must not keep running next to the next login's
+        self.stop_retention()
+
         self.close()
         self.login_screen = LoginScreen()
         self.login_screen.show()
@@ -347,7 +400,57 @@ class HomeScreen(QMainWindow):
                 widget.clear()
 
         self.home_info.clear()
-        
+
+
+    def build_tab(self, index):
+
+        if index == 1 and self.plants_tab is None:
+            self.plants_tab = PlantsTab(self)
+        elif index == 2 and self.pots_tab is None:
+            self.pots_tab = PotsTab(self)
+
+
+    def start_retention_worker(self):
+
+        self.retention_timer.setInterval(sensor_retention.configured_interval() * 1000)
+
+        if self.retention_worker is not None:
+            return
+
+        #its own pool, so a sync started meanwhile runs between the short delete batches instead of after the whole job
+        self.retention_worker = RetentionWorker()
+        self.retention_worker.signals.finished.connect(self.retention_finished)
+        self.retention_worker.signals.failed.connect(self.retention_failed)
+
+        self.retention_pool.start(self.retention_worker)
+
+
+    def stop_retention(self, wait=False):
+        #on quit the worker is waited for: it stops after the current batch, and a thread still running
+        #while Python shuts down would emit through signals that are already gone
+
+        self.retention_timer.stop()
+
+        if self.retention_worker is not None:
+            self.retention_worker.cancel()
+
+        if wait:
+            self.retention_pool.waitForDone()
+
+
+    def retention_finished(self, report):
+
+        self.retention_worker = None
+
+        print(sensor_retention.format_report(report))
+
+
+    def retention_failed(self, message):
+
+        self.retention_worker = None
+
+        print(message)
+
 
     def populate_profile_info(self, user):
 
@@ -359,7 +462,7 @@ class HomeScreen(QMainWindow):
 
         if user:
 
-            self.profile_photo.setStyleSheet(f"border-image: url({user.image_path}); \
+            self.profile_photo.setStyleSheet(f"border-image: url({thumbnail_url(user.image_path)}); \
                             background-position: center; \
                             background-repeat: no-repeat; \
                             background-clip: border-box; \
@@ -368,7 +471,7 @@ class HomeScreen(QMainWindow):
 
             self.gardener_name.setText(f"{user.first_name} {user.last_name}")
 
-            with Session(bind=db_engine) as session:
+            with Session(bind=get_engine()) as session:
                 plant_count = session.query(func.count(Plants.id)).scalar()
                 pot_count = session.query(func.count(Pots.id)).scalar()
 
@@ -389,6 +492,9 @@ class HomeScreen(QMainWindow):
 
     def profile_clicked (self, user):
 
+            if self.profile_info is None:
+                self.create_profile_page()
+
             self.stacklayout_home.setCurrentIndex(1)
             self.populate_profile_info(user)
 
@@ -485,7 +591,7 @@ class HomeScreen(QMainWindow):
         edited_full_name = self.gardener_name.text()
         edited_first_name, edited_last_name = edited_full_name.split()
 
-        with Session(bind=db_engine) as local_session:
+        with Session(bind=get_engine()) as local_session:
             user = local_session.query(Users).filter(Users.id == user_id).one_or_none()
 
             if user:
@@ -571,8 +677,8 @@ class PlantsTab(QLabel):
         self.search_plants.setFocus(True)
 
         self.stacklayout = QStackedLayout()
-        self.plants_info = loadUi("plants_info.ui")
-        self.plants_add = loadUi("plants_add.ui")
+        self.plants_info = load_ui("plants_info.ui")
+        self.plants_add = load_ui("plants_add.ui")
 
         self.stacklayout.addWidget(self.plants_all)
         self.stacklayout.addWidget(self.plants_info)
@@ -582,37 +688,27 @@ class PlantsTab(QLabel):
         layout.addLayout(self.stacklayout)
 
         self.scroll_plants = self.home_screen.findChild(QScrollArea, "scroll_plants")
-        self.plants_widget = self.home_screen.findChild(QWidget, "plants_widget")
 
-        with Session(bind=db_engine) as session:
-            plants = session.query(Plants).all()
+        self.plants_model = PlantsListModel(self)
+        self.plants_model.load()
 
-        for plant in plants:
-            self.plant_label = QLabel()
-            self.plant_label.setMinimumSize(260,80)
-            self.plant_label.setProperty("id", str(plant.id))
-            self.plant_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            self.plant_label.setText(f"<span style='font-weight: bold; font-size: 13pt;'>{plant.name}</span><br>{plant.botanical_name}")
-
-            if plant.image_loc is not None:
+        self.plants_index = SearchIndex(loader=self.plant_search_entries)
 
-                self.plant_label.setStyleSheet(f"background-image: url({plant.image_loc}); background-position: center; background-repeat: no-repeat;\
-                                    opacity: 1.0; font-family: Candara; font-size: 12pt; color: white; padding-left: 7px; border-radius: 10px;\
-                                    ")
-            
-            else: 
-                self.plant_label.setStyleSheet(f"background-color: #E9E5E3; font-family: Candara; font-size: 12pt; color: black;\
-                                                padding-left: 7px; border-radius: 10px;")
+        self.plants_view = QListView()
+        self.plants_view.setModel(self.plants_model)
+        self.plants_view.setItemDelegate(PlantItemDelegate(self.plants_view))
+        self.plants_view.setUniformItemSizes(True)
+        self.plants_view.setSpacing(3)
+        self.plants_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.plants_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.plants_view.setFrameShape(QFrame.NoFrame)
+        self.plants_view.setStyleSheet(LIST_VIEW_STYLE)
+        self.plants_view.clicked.connect(self.plant_clicked)
 
+        self.plants_all.layout().replaceWidget(self.scroll_plants, self.plants_view)
+        self.scroll_plants.hide()
 
-            self.plants_widget.layout().addWidget(self.plant_label)
-
-            self.plant_label.mousePressEvent = lambda event, plant_label=self.plant_label: self.plant_label_clicked(event, plant_label)
-
-        self.scroll_plants.setWidget(self.plants_widget)
-        self.plants_widget.layout().setAlignment(QtCore.Qt.AlignTop)
-
-        self.search_plants.textChanged.connect(lambda text: self.filter_plants(text, self.plants_widget))
+        self.search_plants.textChanged.connect(self.filter_plants)
 
         self.add_plant_button = self.home_screen.findChild(QPushButton, "add_plant_button")
         self.add_plant_button.clicked.connect(self.add_plant)
@@ -638,39 +734,6 @@ class PlantsTab(QLabel):
         self.plant_edit_widgets_created = False
 
 
-    def repopulate_plants(self):
-
-        with Session(bind=db_engine) as session:
-            plants = session.query(Plants).all()
-
-        while self.plants_widget.layout().count():
-            item = self.plants_widget.layout().takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-
-        for plant in plants:
-            self.plant_label = QLabel()
-            self.plant_label.setMinimumSize(260,80)
-            self.plant_label.setProperty("id", str(plant.id))
-            self.plant_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            self.plant_label.setText(f"<span style='font-weight: bold; font-size: 13pt;'>{plant.name}</span><br>{plant.botanical_name}")
-
-            if plant.image_loc is not None:
-                
-                self.plant_label.setStyleSheet(f"background-image: url({plant.image_loc}); background-position: center; background-repeat: no-repeat;\
-                                    opacity: 1.0; font-family: Candara; font-size: 12pt; color: white; padding-left: 7px; border-radius: 10px;\
-                                    ")
-                
-            else: 
-                self.plant_label.setStyleSheet(f"background-color: #E9E5E3; font-family: Candara; font-size: 12pt; color: black;\
-                                                padding-left: 7px; border-radius: 10px;")
-
-            self.plants_widget.layout().addWidget(self.plant_label)
-
-            self.plant_label.mousePressEvent = lambda event, plant_label=self.plant_label: self.plant_label_clicked(event, plant_label)
-
-
     def add_plant(self):
 
         self.stacklayout.setCurrentIndex(2)
@@ -698,7 +761,7 @@ class PlantsTab(QLabel):
 
         if self.file_name:
 
-            self.plant_image_add.setStyleSheet(f"border-image: url({self.file_name}) 0 0 0 0 stretch stretch; \
+            self.plant_image_add.setStyleSheet(f"border-image: url({thumbnail_url(self.file_name)}) 0 0 0 0 stretch stretch; \
                             background-position: center; \
                             background-repeat: no-repeat; \
                             background-clip: border-box; \
@@ -710,7 +773,7 @@ class PlantsTab(QLabel):
 
         self.user_id = self.home_screen.user_id
 
-        with Session(bind=db_engine) as local_session:
+        with Session(bind=get_engine()) as local_session:
             existing_plant = local_session.query(Plants).filter_by(name=self.plant_name_add.toPlainText()).one_or_none()
 
             if existing_plant:
@@ -733,7 +796,8 @@ class PlantsTab(QLabel):
                 local_session.add(new_plant)
                 local_session.commit()
 
-                self.repopulate_plants()
+                self.plants_model.add_plant(new_plant)
+                self.plants_index.add(new_plant.id, new_plant.name, new_plant.botanical_name)
 
                 self.stacklayout.setCurrentIndex(0)
                 self.notification1 = NotificationTime(f"You have successfully added <b>{new_plant.name}</b> plant to your database!", 3000)
@@ -820,7 +884,7 @@ class PlantsTab(QLabel):
 
         plant_id = self.current_plant_id
 
-        with Session(bind=db_engine) as session:
+        with Session(bind=get_engine()) as session:
             plant = session.query(Plants).filter(Plants.id == plant_id).one_or_none()
 
             print(plant_id)
@@ -836,6 +900,8 @@ class PlantsTab(QLabel):
 
         plant_id = self.current_plant_id
 
+        from bs4 import BeautifulSoup
+
         html_content = self.plant_name.toHtml()
         soup = BeautifulSoup(html_content, 'html.parser')
 
@@ -845,7 +911,7 @@ class PlantsTab(QLabel):
         self.plant_name_extracted = name_span.get_text(strip=True) if name_span else ''
         self.botanical_name_extracted = botanical_span.get_text(strip=True) if name_span else ''
 
-        with Session(bind=db_engine) as local_session:
+        with Session(bind=get_engine()) as local_session:
             plant = local_session.query(Plants).filter(Plants.id == plant_id).one_or_none()
 
             print(plant_id)
@@ -857,8 +923,10 @@ class PlantsTab(QLabel):
             plant.substrate = self.substrate_info.text()
             local_session.commit()
 
+            self.plants_model.update_plant(plant)
+            self.plants_index.update(plant.id, plant.name, plant.botanical_name)
+
         self.default_plant_info()
-        self.repopulate_plants()
 
 
     def return_plants_btn(self):
@@ -872,30 +940,21 @@ class PlantsTab(QLabel):
 
         plant_id = self.current_plant_id
 
-        with Session(bind=db_engine) as session:
+        with Session(bind=get_engine()) as session:
             plant = session.query(Plants).filter(Plants.id == plant_id).one_or_none()
 
         confirmation1 = NotificationMessage(f"Are you sure you want to delete <b>{plant.name}</b> plant?")
 
         if confirmation1.exec_() == QDialog.Accepted:
 
-            with Session(bind=db_engine) as session:
+            with Session(bind=get_engine()) as session:
                 plant = session.query(Plants).filter(Plants.id == plant_id).one_or_none()
 
             if plant:
 
-                for child in self.plants_widget.children():
-                    if isinstance(child, QLabel) and child.property("id") == plant_id:
-                        plant_label = child
-                        break
-
-                if plant_label:
-
-                    self.stacklayout.setCurrentIndex(0)
-                    self.plants_widget.layout().removeWidget(plant_label)
-                    plant_label.setParent(None)
-                    plant_label.deleteLater()
-                    self.plants_widget.layout().update()
+                self.stacklayout.setCurrentIndex(0)
+                self.plants_model.remove_plant(plant_id)
+                self.plants_index.remove(int(plant_id))
 
                 session.delete(plant)
                 session.commit()
@@ -904,44 +963,25 @@ class PlantsTab(QLabel):
                 self.notification2.show()
 
 
-    def filter_plants(self, text, plants_widget):
-        for i in range(plants_widget.layout().count()):
-            widget = plants_widget.layout().itemAt(i).widget()
-            plants_widget.layout().setAlignment(QtCore.Qt.AlignTop)
-            label_text = widget.text().lower()
-            search_text = text.lower()
-
-            br_index = label_text.find("</span><br>")
-            plant_name = label_text[50:br_index]
-            botanical_name = label_text[br_index + len("</span><br>"):]
+    def plant_search_entries(self):
 
-            if len(search_text) == 1:
+        with Session(bind=get_engine()) as session:
+            return session.execute(select(Plants.id, Plants.name, Plants.botanical_name)).all()
 
-                if plant_name.startswith(text.lower()) or botanical_name.startswith(text.lower()):
-                    widget.show()
 
-                else:
-                    widget.hide()
-
-            elif len(search_text) > 1:
-                if search_text in plant_name or search_text in botanical_name:
-                    widget.show()
-                else:
-                    widget.hide()
-
-            else:
-                widget.show()
+    def filter_plants(self, text):
 
+        #only the matching plants are loaded, page by page as the view scrolls
+        self.plants_model.set_filter(self.plants_index.match(text))
 
-    def plant_label_clicked(self, event, plant_label):
 
-        if event.button() == Qt.LeftButton:
+    def plant_clicked(self, index):
 
-            plant_id = plant_label.property("id")
-            self.current_plant_id = plant_label.property("id")
-            print(plant_id)
-            self.stacklayout.setCurrentIndex(1)
-            self.populate_plants_info(plant_id)
+        plant_id = index.data(ID_ROLE)
+        self.current_plant_id = plant_id
+        print(plant_id)
+        self.stacklayout.setCurrentIndex(1)
+        self.populate_plants_info(plant_id)
 
 
     def populate_plants_info(self, plant_id):
@@ -953,7 +993,7 @@ class PlantsTab(QLabel):
         self.substrate_info = self.plants_info.findChild(QLineEdit, "substrate_info")
         self.ph_info = self.plants_info.findChild(QLineEdit, "ph_info")
 
-        with Session(bind=db_engine) as session:
+        with Session(bind=get_engine()) as session:
             plant = session.query(Plants).filter(Plants.id == plant_id).one_or_none()
             print(plant_id)
 
@@ -962,7 +1002,7 @@ class PlantsTab(QLabel):
 
             if plant.image_loc is not None:
 
-                self.plant_image.setStyleSheet(f"border-image: url({plant.image_loc}) 0 0 0 0 stretch stretch; \
+                self.plant_image.setStyleSheet(f"border-image: url({thumbnail_url(plant.image_loc)}) 0 0 0 0 stretch stretch; \
                                 background-position: center; \
                                 background-repeat: no-repeat; \
                                 background-clip: border-box; \
@@ -1002,8 +1042,8 @@ class PotsTab(QWidget):
         self.search_pots.setFocus(True)
 
         self.stacklayout_pots = QStackedLayout()
-        self.pots_info = loadUi("pots_info.ui")
-        self.pots_add = loadUi("pots_add.ui")
+        self.pots_info = load_ui("pots_info.ui")
+        self.pots_add = load_ui("pots_add.ui")
         self.populate_combo_boxes()
 
         self.stacklayout_pots.addWidget(self.pots_all)
@@ -1014,52 +1054,45 @@ class PotsTab(QWidget):
         layout.addLayout(self.stacklayout_pots)
 
         self.scroll_pots = self.home_screen.findChild(QScrollArea, "scroll_pots")
-        self.pots_widget = self.home_screen.findChild(QWidget, "pots_widget")
-
-        with Session(bind=db_engine) as session:
-            pots = session.query(Pots).all()
-            
-        for pot in pots:
-            self.pot_widget = QWidget()
-            self.pot_layout = QHBoxLayout(self.pot_widget)
-            self.pot_layout.setContentsMargins(0, 0, 0, 0)
-            self.pot_layout.setSpacing(0)
-            self.pot_image_label = QLabel()
-            self.pot_image_label.setFixedSize(80,80)
-            #self.pot_image_label.setProperty("id", str(pot.id))
-            self.pot_info_label = QLabel()
-            self.pot_info_label.setObjectName("pot_info_label")
-            #self.pot_info_label.setProperty("id", str(pot.id))
-            self.pot_widget.layout().addWidget(self.pot_image_label)
-            self.pot_widget.layout().addWidget(self.pot_info_label)
-            self.pot_widget.setMinimumSize(260,80)
-            self.pot_widget.setProperty("id", str(pot.id))
-            self.pot_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            self.pot_widget.setStyleSheet("background-color: #CFDBD8; border-radius: 30px;")
-            self.pot_info_label.setText(f"<span style='font-weight: bold; font-size: 13pt;'>{pot.name}</span><br>{pot.plant_name}")
-
-            if pot.plant_image is not None:
-
-                self.pot_image_label.setStyleSheet(f"border-image: url({pot.plant_image}); background-position: center; background-repeat: no-repeat;\
-                                    opacity: 1.0; border-radius: 30px")
-                
-            self.pot_info_label.setStyleSheet("font-family: Candara; font-size: 12pt; padding-left: 7px; border-radius: 30px;")
-            
 
-            self.pots_widget.layout().addWidget(self.pot_widget)
+        self.pots_model = PotsListModel(self)
+        self.pots_model.load()
 
-            self.pot_widget.mousePressEvent = lambda event, pot_widget=self.pot_widget: self.pot_widget_clicked(event, pot_widget)
+        self.pots_index = SearchIndex(loader=lambda: [(row.id, row.name, row.secondary) for row in self.pots_model.rows])
 
-        self.scroll_pots.setWidget(self.pots_widget)
-        self.pots_widget.layout().setAlignment(QtCore.Qt.AlignTop)
+        self.pots_view = QListView()
+        self.pots_view.setModel(self.pots_model)
+        self.pots_view.setItemDelegate(PotItemDelegate(self.pots_view))
+        self.pots_view.setUniformItemSizes(True)
+        self.pots_view.setSpacing(3)
+        self.pots_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.pots_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.pots_view.setFrameShape(QFrame.NoFrame)
+        self.pots_view.setStyleSheet(LIST_VIEW_STYLE)
+        self.pots_view.clicked.connect(self.pot_clicked)
 
-        #print(self.pot_info_label.text())
+        self.pots_all.layout().replaceWidget(self.scroll_pots, self.pots_view)
+        self.scroll_pots.hide()
 
-        self.search_pots.textChanged.connect(lambda text: self.filter_pots(text, self.pots_widget))
+        self.search_pots.textChanged.connect(self.filter_pots)
 
         self.sync_button = self.home_screen.findChild(QPushButton, "sync_button")
         self.sync_button.clicked.connect(self.sync_all_pots)
 
+        self.sync_pool = QThreadPool()
+        self.sync_pool.setMaxThreadCount(1)
+        self.sync_worker = None
+        self.watering_worker = None
+
+        self.reading_service = SensorReadingService(get_engine())
+
+        self.sync_progress = QProgressBar()
+        self.sync_progress.setFixedHeight(20)
+        self.sync_progress.setStyleSheet(SYNC_PROGRESS_STYLE)
+        self.sync_progress.setFormat("Synchronizing pots... %v/%m")
+        self.sync_progress.hide()
+        self.pots_layout.addWidget(self.sync_progress)
+
         self.add_pot_button = self.home_screen.findChild(QPushButton, "add_pot_button")
         self.add_pot_button.clicked.connect(self.add_pot)
 
@@ -1075,11 +1108,9 @@ class PotsTab(QWidget):
 
         self.sensor_graphs = self.pots_info.findChild(QWidget, "sensor_graphs")
 
-        self.plot_widget = pg.PlotWidget()
-        self.plot_widget.setBackground('#E9E5E3')
+        self.graph = None
         self.graph_widget_layout = QVBoxLayout()
         self.graph_widget_layout.setContentsMargins(0, 0, 0, 0)
-        self.graph_widget_layout.addWidget(self.plot_widget)
         self.sensor_graphs.setLayout(self.graph_widget_layout)
 
         self.manage_pot = self.pots_info.findChild(QToolButton, "manage_pot")
@@ -1118,47 +1149,6 @@ class PotsTab(QWidget):
             self.save_new_pot(self.user_id)
 
 
-    def repopulate_pots(self):
-
-        with Session(bind=db_engine) as session:
-            pots = session.query(Pots).all()
-
-        while self.pots_widget.layout().count():
-            item = self.pots_widget.layout().takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-
-        for pot in pots:
-            self.pot_widget = QWidget()
-            self.pot_layout = QHBoxLayout(self.pot_widget)
-            self.pot_layout.setContentsMargins(0, 0, 0, 0)
-            self.pot_layout.setSpacing(0)
-            self.pot_image_label = QLabel()
-            self.pot_image_label.setFixedSize(80,80)
-            #self.pot_image_label.setProperty("id", str(pot.id))
-            self.pot_info_label = QLabel()
-            self.pot_info_label.setObjectName("pot_info_label")
-            #self.pot_info_label.setProperty("id", str(pot.id))
-            self.pot_widget.layout().addWidget(self.pot_image_label)
-            self.pot_widget.layout().addWidget(self.pot_info_label)
-            self.pot_widget.setMinimumSize(260,80)
-            self.pot_widget.setProperty("id", str(pot.id))
-            self.pot_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            self.pot_widget.setStyleSheet("background-color: #CFDBD8; border-radius: 30px;")
-            self.pot_info_label.setText(f"<span style='font-weight: bold; font-size: 13pt;'>{pot.name}</span><br>{pot.plant_name}<br>")
-            self.pot_info_label.setStyleSheet("font-family: Candara; font-size: 12pt; padding-left: 7px; border-radius: 30px;")
-
-            if pot.plant_image is not None:
-
-                self.pot_image_label.setStyleSheet(f"border-image: url({pot.plant_image}); background-position: center; background-repeat: no-repeat;\
-                                    opacity: 1.0; border-radius: 30px")
-    
-            self.pots_widget.layout().addWidget(self.pot_widget)
-
-            self.pot_widget.mousePressEvent = lambda event, pot_widget=self.pot_widget: self.pot_widget_clicked(event, pot_widget)
-
-
     def populate_combo_boxes(self, plant=None, location=None, light_intensity=None, moisture=None):
 
         self.plant_options = self.pots_add.findChild(QComboBox, "plant_options")
@@ -1170,7 +1160,7 @@ class PotsTab(QWidget):
         self.save_add_pot = self.pots_add.findChild(QPushButton, "save_add_pot")
         self.discard_add_pot = self.pots_add.findChild(QPushButton, "discard_add_pot")
 
-        with Session(bind=db_engine) as local_session:
+        with Session(bind=get_engine()) as local_session:
             plants = local_session.query(Plants).all()
 
             for plant_obj in plants:
@@ -1207,7 +1197,7 @@ class PotsTab(QWidget):
         pot_id = self.current_pot_id
         print(pot_id)
 
-        with Session(bind=db_engine) as local_session:
+        with Session(bind=get_engine()) as local_session:
             pot = local_session.query(Pots).filter(Pots.id == pot_id).one_or_none()
 
         if pot:
@@ -1227,7 +1217,7 @@ class PotsTab(QWidget):
 
         pot_id = self.current_pot_id
 
-        with Session(db_engine) as local_session:
+        with Session(get_engine()) as local_session:
             edited_plant = local_session.query(Plants).filter_by(name=self.plant_options.currentText()).one_or_none()
 
             if edited_plant:
@@ -1260,7 +1250,8 @@ class PotsTab(QWidget):
 
                     local_session.commit()
 
-                    self.repopulate_pots()
+                    self.pots_model.update_pot(pot)
+                    self.pots_index.update(pot.id, pot.name, pot.plant_name)
                     self.populate_pots_info(pot_id)
 
                     self.stacklayout_pots.setCurrentIndex(1)
@@ -1275,7 +1266,7 @@ class PotsTab(QWidget):
 
     def save_new_pot(self, user_id):
 
-        with Session(db_engine) as local_session:
+        with Session(get_engine()) as local_session:
             selected_plant = local_session.query(Plants).filter_by(name=self.plant_options.currentText()).one_or_none()
 
             max_pot_number = local_session.query(func.max(Pots.id)).scalar()
@@ -1326,7 +1317,8 @@ class PotsTab(QWidget):
             local_session.add(new_pot)
             local_session.commit()
 
-            self.repopulate_pots()
+            self.pots_model.add_pot(new_pot)
+            self.pots_index.add(new_pot.id, new_pot.name, new_pot.plant_name)
 
             self.stacklayout_pots.setCurrentIndex(0)
             self.notification3 = NotificationTime(f"You have successfully added <b>{new_pot.name}</b> to your database!", 3000)
@@ -1343,53 +1335,20 @@ class PotsTab(QWidget):
         self.stacklayout_pots.setCurrentIndex(0)
 
 
-    def filter_pots(self, text, pots_widget):
-
-        for i in range(self.pots_widget.layout().count()):
-            widget = pots_widget.layout().itemAt(i).widget()
-            pot_info_label = widget.findChild(QLabel, "pot_info_label")
-            pots_widget.layout().setAlignment(QtCore.Qt.AlignTop)
-            label_text = pot_info_label.text().lower()
-            search_text = text.lower()
+    def filter_pots(self, text):
 
-            br_index = label_text.find("</span><br>")
-            pot_name = label_text[50:br_index]
-            plant_name = label_text[br_index + len("</span><br>"):]
+        self.pots_model.set_filter(self.pots_index.match(text))
 
-            print(pot_name, plant_name)
 
-            if len(search_text) == 1:
+    def pot_clicked(self, index):
 
-                if pot_name.startswith(text.lower()) or plant_name.startswith(text.lower()):
-                    widget.show()
+        pot_id = index.data(ID_ROLE)
+        self.current_pot_id = pot_id
 
-                else:
-                    widget.hide()
-
-            elif len(search_text) > 1:
-                if search_text in pot_name.lower() or search_text in plant_name.lower():
-                    widget.show()
-                else:
-                    widget.hide()
-
-            else:
-                widget.show()
-
-
-    def pot_widget_clicked(self, event, pot_widget):
-
-        if event.button() == Qt.LeftButton:
-
-            pot_id = pot_widget.property("id")
-            self.current_pot_id = pot_widget.property("id")
-            #self.current_pot_id = self.pot_widget.property("id")
-            #self.current_pot_id = self.pot_info_label.property("id")
-            #self.current_pot_id = self.pot_image_label.property("id")
-
-            print(pot_id)
-            self.stacklayout_pots.setCurrentIndex(1)
-            self.populate_pots_info(pot_id)
-            self.watering_record(pot_id)
+        print(pot_id)
+        self.stacklayout_pots.setCurrentIndex(1)
+        self.populate_pots_info(pot_id)
+        self.watering_record(pot_id)
 
 
     def populate_pots_info(self, pot_id):
@@ -1401,7 +1360,7 @@ class PotsTab(QWidget):
         self.moisture_range = self.pots_info.findChild(QLabel, "moisture_range")
         self.sensor_graphs = self.pots_info.findChild(QWidget, "sensor_graphs")
 
-        with Session(bind=db_engine) as session:
+        with Session(bind=get_engine()) as session:
             pot = session.query(Pots).filter(Pots.id == pot_id).one_or_none()
             print(pot_id)
 
@@ -1421,16 +1380,18 @@ class PotsTab(QWidget):
         #pot_id = self.sync_pot.property("id")
         print(pot_id)
 
-        current_time = dt.datetime.now()
+        if self.sync_worker is not None:
+            print("Synchronization is already running.")
+            return
 
-        with Session(bind=db_engine) as local_session:
+        with Session(bind=get_engine()) as local_session:
             pot = local_session.query(Pots).filter(Pots.id == pot_id).one_or_none()
 
             if pot:
 
                 pot_name = pot.name
 
-                if 'empty' in pot_name.lower() or 'broken' in pot_name.lower():
+                if not sensor_sync.pot_has_sensor(pot):
 
                     print("Pot is empty or broken. No reading.")
                     self.notification7 = NotificationTime(f"The pot <b>{pot_name}</b> is empty or broken. Sensor is not providing any readings!", 3000)
@@ -1438,50 +1399,11 @@ class PotsTab(QWidget):
 
                 else:
 
-                    light_intensity = measure_light_intensity(pot.light_intensity)
-                    moisture_option = pot.soil_moisture
-
-                    last_reading = local_session.query(SensorReadings).filter(SensorReadings.pot_id == pot.id).order_by(SensorReadings.datetime.desc()).first()
-
-                    if last_reading:
-                        moisture_option = moisture_option
-                        current_temperature = current_temperature_ow()
-                        current_light_intensity = light_intensity
-                        last_entry_time = last_reading.datetime
-                        time_difference = current_time - last_entry_time
-                        time_delta = time_difference.total_seconds()/3600
-                        soil_moisture_calc = measure_soil_moisture(moisture_option, current_temperature, current_light_intensity, time_delta)
-                        #print(last_entry_time, last_reading, current_time, time_difference, time_delta)
-
-                    else:
-
-                        soil_moisture_calc = initial_soil_moisture(moisture_option)
-
-                    soil_ph_range = pot.soil_ph
-                    soil_ph_reading = measure_soil_ph(soil_ph_range)
-
-                    new_reading = SensorReadings(
-                        pot_id = pot.id,
-                        datetime = current_time,
-                        temperature_celsius = current_temperature_ow(),
-                        light_intensity_lux = light_intensity,
-                        soil_moisture = soil_moisture_calc,
-                        soil_ph = soil_ph_reading
-                    )
-
-                    local_session.add(new_reading)
-                    local_session.commit()
-
-                    self.notification11 = NotificationTime(f"Sensor readings for <b>{pot.name}</b> have been successfully synchronized!", 3000)
-                    self.notification11.show()
-
-                    print("Success!")
+                    self.start_sync_worker([pot.id], pot_name)
 
             else:
                 print("Unsuccessful!")
 
-        self.sensor_graph(pot_id)
-
 
     def destroy_graph(self):
 
@@ -1493,131 +1415,94 @@ class PotsTab(QWidget):
         pot_id = self.sync_pot.property("id")
         print(pot_id)
 
-        self.plot_widget.clear()
-
-        p = self.plot_widget.plotItem
-
-        self.plot_widget.getPlotItem().setContentsMargins(0, 10, 0, 10)
-
-        p.clear()
-        p.clearPlots()
-        p.vb.clear()
-
-        v2 = pg.ViewBox()
-
-        v2.clear()
-        p.scene().addItem(v2)
-
-        p.setTitle("Sensor readings")
+        if self.graph is None:
+            self.create_graph()
 
-        p.getAxis('left').linkToView(p.vb)
-        p.getAxis('right').linkToView(v2)
-        x_axis = pg.DateAxisItem(orientation='bottom')
-        p.setAxisItems({'bottom': x_axis})
+        self.graph.show_pot(pot_id)
 
-        v2.setXLink(p)
 
-        with Session(bind=db_engine) as local_session:
-            readings = local_session.query(SensorReadings).filter(SensorReadings.pot_id == pot_id).all()
-            #for reading in readings:
-                #print(f"Reading - Timestamp: {reading.datetime}, Temperature: {reading.temperature_celsius}, Light Intensity: {reading.light_intensity_lux}, Soil Moisture: {reading.soil_moisture}, Soil pH: {reading.soil_ph}")
+    def create_graph(self):
 
-        x_data = [reading.datetime.timestamp() for reading in readings]
-        y1_data = [reading.temperature_celsius for reading in readings]
-        y2_data = [reading.light_intensity_lux for reading in readings]
-        y3_data = [reading.soil_moisture for reading in readings]
-        y4_data = [reading.soil_ph for reading in readings]
+        #pyqtgraph is only imported once the first graph is opened
+        import pyqtgraph as pg
+        from sensor_graph import SensorGraph
 
-        p.clear()
-        p.clearPlots()
-        p.vb.clear()
-        v2.clear()
+        self.plot_widget = pg.PlotWidget()
+        self.graph = SensorGraph(self.plot_widget)
+        self.graph_widget_layout.addWidget(self.plot_widget)
 
-        pen1 = pg.mkPen(color='#E07D54', width=2)
-        pen2 = pg.mkPen(color='#DB9600', width=2)
-        pen3 = pg.mkPen(color='#5E9299', width=2)
-        pen4 = pg.mkPen(color='#523D35', width=2)
 
-        curve1 = pg.PlotCurveItem(x_data, y1_data, pen=pen1, name='Temperature')
-        curve2 = pg.PlotCurveItem(x_data, y2_data, pen=pen2, name='Light Intensity')
-        curve3 = pg.PlotCurveItem(x_data, y3_data, pen=pen3, name='Soil Moisture')
-        curve4 = pg.PlotCurveItem(x_data, y4_data, pen=pen4, name='Soil pH')
+    def sync_all_pots(self):
 
-        p.addItem(curve1)
-        p.addItem(curve3)
-        p.addItem(curve4)
-        #v2.addItem(curve2)
+        if self.sync_worker is not None:
+            self.sync_worker.cancel()
+            self.sync_button.setEnabled(False)
+            return
 
-        self.plot_widget.setLabel('left', '<span style="color:#523D35">Soil pH,</span> <span style="color:#5E9299">Soil Moisture,</span> <span style="color:#E07D54">Temperature(°C)</span> ')
-        self.plot_widget.setLabel('right', '<span style="color:#DB9600">Light Intensity (LUX)</span>')
-        self.plot_widget.setLabel('bottom', 'Time')
+        self.start_sync_worker()
 
-        v2.setGeometry(p.vb.sceneBoundingRect())
 
-        v2.linkedViewChanged(p.vb, v2.XAxis)
+    def start_sync_worker(self, pot_ids=None, pot_name=None):
 
-        p.vb.sigResized.connect(lambda: v2.setGeometry(p.vb.sceneBoundingRect()))
+        self.sync_worker = SensorSyncWorker(pot_ids)
+        self.sync_worker.signals.progress.connect(self.sync_progress_changed)
+        self.sync_worker.signals.finished.connect(lambda readings_written, cancelled: self.sync_finished(readings_written, cancelled, pot_name))
+        self.sync_worker.signals.failed.connect(self.sync_failed)
 
-        self.plot_widget.update()
+        self.sync_pot.setEnabled(False)
 
+        if pot_ids is None:
+            self.sync_button.setIcon(QIcon("./close.png"))
+            self.sync_button.setToolTip("Cancel synchronization")
+            self.sync_progress.setValue(0)
+            self.sync_progress.show()
+        else:
+            self.sync_button.setEnabled(False)
 
-    def sync_all_pots(self):
+        self.sync_pool.start(self.sync_worker)
 
-        current_time = dt.datetime.now()
 
-        with Session(bind=db_engine) as local_session:
-            pots = local_session.query(Pots).all()
+    def sync_progress_changed(self, done, total):
 
-            for pot in pots:
+        self.sync_progress.setMaximum(total)
+        self.sync_progress.setValue(done)
 
-                pot_id = pot.id
-                print(pot_id)
-                pot_name = pot.name
 
-                if 'empty' in pot_name.lower() or 'broken' in pot_name.lower():
+    def reset_sync_controls(self):
 
-                    print("Pot is empty or broken. No reading.")
+        self.sync_worker = None
 
-                else:
+        self.sync_progress.hide()
+        self.sync_button.setIcon(QIcon("./sync.png"))
+        self.sync_button.setToolTip("")
+        self.sync_button.setEnabled(True)
+        self.sync_pot.setEnabled(True)
 
-                    light_intensity = measure_light_intensity(pot.light_intensity)
-                    moisture_option = pot.soil_moisture
 
-                    last_reading = local_session.query(SensorReadings).filter(SensorReadings.pot_id == pot.id).order_by(SensorReadings.datetime.desc()).first()
+    def sync_finished(self, readings_written, cancelled, pot_name):
 
-                    if last_reading:
-                        moisture_option = moisture_option
-                        current_temperature = current_temperature_ow()
-                        current_light_intensity = light_intensity
-                        last_entry_time = last_reading.datetime
-                        time_difference = current_time - last_entry_time
-                        time_delta = time_difference.total_seconds()/3600
-                        soil_moisture_calc = measure_soil_moisture(moisture_option, current_temperature, current_light_intensity, time_delta)
+        self.reset_sync_controls()
 
-                    else:
+        print(f"Wrote {readings_written} sensor readings. Weather cache: {get_weather_provider().cache_info()}")
 
-                        soil_moisture_calc = initial_soil_moisture(moisture_option)
+        if readings_written and self.stacklayout_pots.currentIndex() == 1:
+            self.sensor_graph(self.sync_pot.property("id"))
 
-                    soil_ph_range = pot.soil_ph
-                    soil_ph_reading = measure_soil_ph(soil_ph_range)
+        if cancelled:
+            self.notification9 = NotificationTime(f"Synchronization was cancelled after <b>{readings_written}</b> readings were saved.", 3000)
+        elif pot_name:
+            self.notification9 = NotificationTime(f"Sensor readings for <b>{pot_name}</b> have been successfully synchronized!", 3000)
+        else:
+            self.notification9 = NotificationTime(f"Sensor readings for all pots have been successfully synchronized!", 3000)
 
-                    new_reading = SensorReadings(
-                        pot_id = pot.id,
-                        datetime = current_time,
-                        temperature_celsius = current_temperature_ow(),
-                        light_intensity_lux = light_intensity,
-                        soil_moisture = soil_moisture_calc,
-                        soil_ph = soil_ph_reading
-                    )
+        self.notification9.show()
 
-                    local_session.add(new_reading)
-                    local_session.commit()
 
-                    print("Success!")
+    def sync_failed(self, message):
 
-        self.sensor_graph(pot_id)
+        self.reset_sync_controls()
 
-        self.notification9 = NotificationTime(f"Sensor readings for all pots have been successfully synchronized!", 3000)
+        self.notification9 = NotificationTime(message, 3000)
         self.notification9.show()
 
 
@@ -1626,78 +1511,67 @@ class PotsTab(QWidget):
         pot_id = self.sync_pot.property("id")
         print(pot_id)
 
-        current_time = dt.datetime.now()
-
-        with Session(bind=db_engine) as local_session:
-            pot = local_session.query(Pots).filter(Pots.id == pot_id).one_or_none()
+        if self.watering_worker is not None:
+            return
 
-            if pot:
+        #on the sync pool, so a watering waits for a running synchronization instead of writing next to it
+        self.watering_worker = WateringWorker(self.reading_service, pot_id)
+        self.watering_worker.signals.finished.connect(lambda watering: self.watering_finished(pot_id, watering))
+        self.watering_worker.signals.failed.connect(self.watering_failed)
 
-                plant_name = pot.plant_name
-                pot_name = pot.name
+        self.water_pot.setEnabled(False)
+        self.sync_pool.start(self.watering_worker)
 
-                if 'empty' in pot_name.lower() or 'broken' in pot_name.lower():
 
-                    print("Pot is empty or broken. No reading.")
-                    self.notification5 = NotificationTime(f"The pot <b>{pot_name}</b> is empty or broken. Watering is unavailable!", 3000)
-                    self.notification5.show()
+    def watering_failed(self, message):
 
-                else:
+        self.watering_worker = None
+        self.water_pot.setEnabled(True)
 
-                    last_soil_moisture_reading = (local_session.query(SensorReadings.soil_moisture).filter_by(pot_id=pot.id).order_by(SensorReadings.id.desc()).first())
+        print(message)
+        self.notification5 = NotificationTime(message, 3000)
+        self.notification5.show()
 
-                    if last_soil_moisture_reading:
 
-                        light_intensity = measure_light_intensity(pot.light_intensity)
+    def watering_finished(self, pot_id, watering):
 
-                        last_soil_moisture_reading = (local_session.query(SensorReadings.soil_moisture).filter_by(pot_id=pot.id).order_by(SensorReadings.id.desc()).first())
-                        last_soil_moisture = last_soil_moisture_reading.soil_moisture
-                        print(last_soil_moisture)
-                        new_soil_moisture = last_soil_moisture + 1.0
+        self.watering_worker = None
+        self.water_pot.setEnabled(True)
 
-                        new_soil_moisture = max(1, min(10, new_soil_moisture))
+        if watering.status == sensor_service.NO_SENSOR:
 
-                        formatted_soil_moisture = "{:.2f}".format(round(new_soil_moisture, 2))
+            print("Pot is empty or broken. No reading.")
+            self.notification5 = NotificationTime(f"The pot <b>{watering.pot_name}</b> is empty or broken. Watering is unavailable!", 3000)
+            self.notification5.show()
 
-                        soil_ph_range = pot.soil_ph
-                        soil_ph_reading = measure_soil_ph(soil_ph_range)
+        elif watering.status == sensor_service.NO_READING:
 
-                        new_reading = SensorReadings(
-                            pot_id = pot.id,
-                            datetime = current_time,
-                            watering_timestamp = current_time,
-                            temperature_celsius = current_temperature_ow(),
-                            light_intensity_lux = light_intensity,
-                            soil_moisture = new_soil_moisture,
-                            soil_ph = soil_ph_reading
-                        )
+            print("Pot doesn't have previous reading.")
+            self.notification5 = NotificationTime(f"Please fetch sensor readings for <b>{watering.pot_name}</b> before watering <b>{watering.plant_name}</b>.", 3000)
+            self.notification5.show()
 
-                        local_session.add(new_reading)
-                        local_session.commit()
+        elif watering.status == sensor_service.WATERED:
 
-                        print("Success!")
+            print("Success!")
 
-                        self.notification6 = NotificationTime(f"You have successfully watered <b>{plant_name}</b> in <b>{pot_name}</b>! The soil moisture level has increased by <b>1</b> point\
-                                                            and is now <b>{formatted_soil_moisture}</b>. Make sure to check the moisture range to ensure your plant is well-watered.", 7000)
-                        self.notification6.show()
+            formatted_soil_moisture = "{:.2f}".format(round(watering.soil_moisture, 2))
 
-                        self.sensor_graph(pot_id)
-                        self.watering_record(pot_id)
+            self.notification6 = NotificationTime(f"You have successfully watered <b>{watering.plant_name}</b> in <b>{watering.pot_name}</b>! The soil moisture level has increased by <b>1</b> point\
+                                                and is now <b>{formatted_soil_moisture}</b>. Make sure to check the moisture range to ensure your plant is well-watered.", 7000)
+            self.notification6.show()
 
-                    else:
-                        print("Pot doesn't have previous reading.")
-                        self.notification5 = NotificationTime(f"Please fetch sensor readings for <b>{pot_name}</b> before watering <b>{plant_name}</b>.", 3000)
-                        self.notification5.show()
+            self.sensor_graph(pot_id)
+            self.watering_record(pot_id)
 
-            else:
-                print("Unsuccessful!")
+        else:
+            print("Unsuccessful!")
 
 
     def pot_setup_text(self, pot_id):
 
         pot_id = self.current_pot_id
 
-        with Session(bind=db_engine) as local_session:
+        with Session(bind=get_engine()) as local_session:
             pot = local_session.query(Pots).filter(Pots.id == pot_id).one_or_none()
 
             if pot:
@@ -1745,33 +1619,25 @@ class PotsTab(QWidget):
 
         pot_id = self.current_pot_id
 
-        with Session(bind=db_engine) as session:
+        with Session(bind=get_engine()) as session:
             pot = session.query(Pots).filter(Pots.id == pot_id).one_or_none()
 
         confirmation2 = NotificationMessage(f"Are you sure you want to delete <b>{pot.name}</b>?")
 
         if confirmation2.exec_() == QDialog.Accepted:
-            with Session(bind=db_engine) as session:
+            with Session(bind=get_engine()) as session:
                 pot = session.query(Pots).filter(Pots.id == pot_id).one_or_none()
 
             if pot:
 
-                with Session(bind=db_engine) as session:
+                with Session(bind=get_engine()) as session:
                     session.query(SensorReadings).filter(SensorReadings.pot_id == pot_id).delete()
+                    sensor_rollups.delete_rollups(session, [int(pot_id)])
                     session.commit()
 
-                for child in self.pots_widget.children():
-                    if isinstance(child, QWidget) and child.property("id") == pot_id:
-                        pot_widget = child
-                        break
-
-                if pot_widget:
-
-                    self.stacklayout_pots.setCurrentIndex(0)
-                    self.pots_widget.layout().removeWidget(pot_widget)
-                    pot_widget.setParent(None)
-                    pot_widget.deleteLater()
-                    self.pots_widget.layout().update()
+                self.stacklayout_pots.setCurrentIndex(0)
+                self.pots_model.remove_pot(pot_id)
+                self.pots_index.remove(int(pot_id))
 
                 session.delete(pot)
                 session.commit()
@@ -1785,41 +1651,26 @@ class PotsTab(QWidget):
         pot_id = self.current_pot_id
         current_time = dt.datetime.now()
 
-        with Session(bind=db_engine) as local_session:
-            pot = local_session.query(Pots).filter(Pots.id == pot_id).one_or_none()
-
-            if pot:
-
-                last_watering_reading = (local_session.query(SensorReadings).filter(SensorReadings.pot_id == pot_id).order_by(SensorReadings.watering_timestamp.desc()).first())
-
-                if last_watering_reading is not None:
-
-                    last_watering_timestamp = last_watering_reading.watering_timestamp
-
-                    if last_watering_timestamp is not None:
-
-                        days_since_watering = (current_time - last_watering_timestamp).days
+        last_watering_timestamp = self.reading_service.last_watering(pot_id)
 
-                        print(f"Days since last watering: {days_since_watering}")
+        if last_watering_timestamp is not None:
 
-                        if days_since_watering == 0:
-                            self.last_watered.setText("today")
+            days_since_watering = (current_time - last_watering_timestamp).days
 
-                        elif days_since_watering == 1:
-                            self.last_watered.setText("yesterday")
+            print(f"Days since last watering: {days_since_watering}")
 
-                        else:
-                            self.last_watered.setText(f"{days_since_watering} days ago")
+            if days_since_watering == 0:
+                self.last_watered.setText("today")
 
-                    else:
-                        print("No watering records found for the pot")
-                        self.last_watered.setText("no previous watering")
-
-                else:
-                    self.last_watered.setText("no previous watering")
+            elif days_since_watering == 1:
+                self.last_watered.setText("yesterday")
 
             else:
-                print("Pot not found in the database")
+                self.last_watered.setText(f"{days_since_watering} days ago")
+
+        else:
+            print("No watering records found for the pot")
+            self.last_watered.setText("no previous watering")
 
    
 class NotificationTab(QWidget):
@@ -1850,6 +1701,14 @@ if __name__ == '__main__':
     #app = QApplication([])
     app = QApplication(sys.argv)
     app.setApplicationName("PyFlora")
+    startup_profile.mark("imports")
     login_screen = LoginScreen()
     login_screen.show()
+    QTimer.singleShot(0, lambda: startup_profile.login_screen_shown(login_screen))
+    #the database is opened (and old readings rolled up) in the background once the login screen is on screen;
+    #a pool of its own, the global one also converts images for QPixmap
+    startup_pool = QThreadPool()
+    startup_pool.setMaxThreadCount(1)
+    backfill_worker = BackfillWorker()
+    QTimer.singleShot(0, lambda: startup_pool.start(backfill_worker))
     app.exec_()
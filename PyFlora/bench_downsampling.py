@@ -0,0 +1,38 @@
+import numpy as np
+from downsampling import MAX_POINTS, minmax_downsample, visible_slice
+import time
+import sys
+
+# Usage: python bench_downsampling.py [readings]
+# Times min/max decimation of a full sensor history and of a zoomed-in window, and
+# checks that the decimated series keeps the extremes of the original one.
+
+
+def run(count):
+
+    rng = np.random.default_rng(1)
+    x = np.arange(count, dtype=np.float64) * 600 + 1.6e9
+    y = np.sin(np.arange(count) / 5000.0) * 10 + rng.random(count)
+    y[rng.integers(0, count, count // 100)] = np.nan
+
+    start = time.perf_counter()
+    x_values, y_values = minmax_downsample(x, y, MAX_POINTS)
+    full_elapsed = time.perf_counter() - start
+
+    print(f"{count} readings | full history: {full_elapsed * 1000:.1f} ms -> {len(x_values)} points"
+          f" | min {np.nanmin(y):.3f}/{np.nanmin(y_values):.3f} | max {np.nanmax(y):.3f}/{np.nanmax(y_values):.3f}")
+
+    x_min, x_max = x[count // 2], x[count // 2 + count // 20]
+
+    start = time.perf_counter()
+    first, last = visible_slice(x, x_min, x_max, padding=x_max - x_min)
+    x_values, y_values = minmax_downsample(x[first:last], y[first:last], MAX_POINTS)
+    window_elapsed = time.perf_counter() - start
+
+    print(f"{count} readings | 5% window: {window_elapsed * 1000:.1f} ms -> {len(x_values)} points")
+
+
+if __name__ == "__main__":
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    run(count)
@@ -0,0 +1,106 @@
+import sqlalchemy as db
+from pyflora_db import Plants, Pots
+import subprocess
+import statistics
+import tempfile
+import shutil
+import sys
+import os
+
+# Usage: python bench_home_screen.py [plants] [pots] [runs]
+# Logs in on a copy of pyflora.db with `plants` plants and `pots` pots added, in a fresh
+# process each run: time from pressing login to the home screen being shown, then the
+# time it takes to open the Plants tab and the Pots tab for the first time, and once more.
+# Runs with the offscreen Qt platform.
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CHILD = r"""
+import importlib.util, sys, time
+sys.path.insert(0, ".")
+from PyQt5.QtWidgets import QApplication
+app = QApplication([])
+spec = importlib.util.spec_from_file_location("pyflora_main", "1_pyflora_main.py")
+main = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(main)
+login = main.LoginScreen()
+login.show()
+app.processEvents()
+login.username_input.setText("m")
+login.password_input.setText("m")
+
+def visit(index):
+    started = time.perf_counter()
+    login.home_screen.pyflora_tabs.setCurrentIndex(index)
+    app.processEvents()
+    return time.perf_counter() - started
+
+started = time.perf_counter()
+login.authenticate()
+app.processEvents()
+home_shown = time.perf_counter() - started
+timings = [home_shown, visit(1), visit(2), visit(0) + visit(1) + visit(2)]
+print(*timings)
+"""
+
+
+def add_plants_and_pots(database, plant_count, pot_count):
+    #the new rows reuse the images of the plants already in the database
+
+    engine = db.create_engine(f"sqlite:///{database}")
+
+    with engine.begin() as connection:
+        images = [row.image_loc for row in connection.execute(db.select(Plants.image_loc))]
+
+        connection.execute(db.insert(Plants), [{
+            "user_id": 1,
+            "name": f"Plant {i + 1}",
+            "botanical_name": f"Planta numero {i + 1}",
+            "image_loc": images[i % len(images)],
+            "watering": "Once a week",
+            "sun_exposure": "Indirect sunlight",
+            "substrate": "Universal",
+            "soil_ph": "6.0 - 7.0"
+        } for i in range(plant_count)])
+
+        connection.execute(db.insert(Pots), [{
+            "user_id": 1,
+            "name": f"Pot {i + 1} - Living room",
+            "plant_name": f"Plant {i % plant_count + 1}" if plant_count else None,
+            "plant_image": images[i % len(images)],
+            "location": "Living room",
+            "light_intensity": "Indirect sunlight",
+            "soil_moisture": "Normal",
+            "soil_ph": "6.0 - 7.0"
+        } for i in range(pot_count)])
+
+    engine.dispose()
+
+
+def cold_start(database):
+
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", PYFLORA_DATABASE_PATH=database)
+    output = subprocess.run([sys.executable, "-c", CHILD], cwd=APP_DIR, env=env, capture_output=True, text=True, check=True).stdout
+
+    return [float(value) for value in output.strip().splitlines()[-1].split()]
+
+
+def run(plant_count, pot_count, runs):
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database = os.path.join(tmp_dir, "pyflora.db")
+        shutil.copy(os.path.join(APP_DIR, "pyflora.db"), database)
+        add_plants_and_pots(database, plant_count, pot_count)
+
+        timings = [cold_start(database) for _ in range(runs)]
+        home_shown, plants_tab, pots_tab, again = (statistics.median(column) * 1000 for column in zip(*timings))
+
+        print(f"{plant_count} plants, {pot_count} pots | home screen {home_shown:7.1f} ms | first visit: plants tab {plants_tab:7.1f} ms, pots tab {pots_tab:7.1f} ms | all tabs again {again:6.1f} ms")
+
+
+if __name__ == "__main__":
+
+    plant_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    pot_count = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    runs = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    run(plant_count, pot_count, runs)
@@ -0,0 +1,70 @@
+from search_index import SearchIndex
+import random
+import string
+import time
+import sys
+
+# Usage: python bench_search_index.py [entries]
+# Builds a SearchIndex over random plant-like names and compares search times
+# with a plain scan over the same names.
+
+QUERIES = ["a", "m", "ro", "ia", "ros", "mint", "ficus el", "zzzz"]
+REPEATS = 200
+
+
+def random_word(rng):
+
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 10)))
+
+
+def make_entries(count, rng):
+
+    return {i: (f"{random_word(rng).title()} {random_word(rng)}", f"{random_word(rng).title()} {random_word(rng)}") for i in range(1, count + 1)}
+
+
+def scan(entries, text):
+
+    text = text.lower()
+    matches = set()
+
+    for item_id, (name, botanical_name) in entries.items():
+        name, botanical_name = name.lower(), botanical_name.lower()
+
+        if len(text) == 1:
+            if name.startswith(text) or botanical_name.startswith(text):
+                matches.add(item_id)
+        elif text in name or text in botanical_name:
+            matches.add(item_id)
+
+    return matches
+
+
+def run(count):
+
+    rng = random.Random(1)
+    entries = make_entries(count, rng)
+
+    start = time.perf_counter()
+    index = SearchIndex()
+    index.add_many((item_id, *values) for item_id, values in entries.items())
+    print(f"{count} entries | index built in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    for query in QUERIES:
+        assert index.match(query) == scan(entries, query), query
+
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            matches = index.match(query)
+        indexed = (time.perf_counter() - start) / REPEATS * 1000
+
+        start = time.perf_counter()
+        scan(entries, query)
+        scanned = (time.perf_counter() - start) * 1000
+
+        print(f"    {query!r:<12} {len(matches):>6} matches | index: {indexed:8.3f} ms | scan: {scanned:8.2f} ms")
+
+
+if __name__ == "__main__":
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    run(count)
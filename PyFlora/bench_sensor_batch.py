@@ -0,0 +1,91 @@
+import numpy as np
+from sensor_light import calculate_intensity
+from sensor_moisture import measure_soil_moisture
+from sensor_ph import measure_soil_ph
+import sensor_batch
+import datetime as dt
+import random
+import time
+import sys
+
+# Usage: python bench_sensor_batch.py [readings]
+# Times the scalar sensor functions against sensor_batch and compares the
+# distributions they produce for the same pot settings and timestamps.
+
+LIGHT_OPTIONS = sensor_batch.LIGHT_OPTIONS
+MOISTURE_OPTIONS = ["Dry", "Normal", "Wet"]
+PH_RANGES = ["5.5 - 6.5", "6.0 - 7.0", "6.5 - 7.5"]
+
+
+def make_inputs(count, rng):
+
+    start_time = dt.datetime(2023, 6, 1)
+
+    return {
+        "light_options": rng.choice(LIGHT_OPTIONS, count),
+        "moisture_options": rng.choice(MOISTURE_OPTIONS, count),
+        "soil_ph_ranges": rng.choice(PH_RANGES, count),
+        "times": [start_time + dt.timedelta(seconds=int(seconds)) for seconds in rng.integers(0, 86400, count)],
+        "temperatures": rng.uniform(5, 35, count).round(2),
+        "time_deltas": rng.uniform(0, 48, count)
+    }
+
+
+def scalar_readings(inputs):
+
+    lux, moisture, ph = [], [], []
+
+    for i in range(len(inputs["times"])):
+        light_intensity = round(calculate_intensity(inputs["light_options"][i], inputs["times"][i].time()), 2)
+        lux.append(light_intensity)
+        moisture.append(measure_soil_moisture(inputs["moisture_options"][i], inputs["temperatures"][i], light_intensity, inputs["time_deltas"][i]))
+        ph.append(measure_soil_ph(inputs["soil_ph_ranges"][i]))
+
+    return {"light_intensity_lux": np.array(lux), "soil_moisture": np.array(moisture), "soil_ph": np.array(ph)}
+
+
+def batch_readings(inputs, rng):
+
+    return sensor_batch.simulate_readings(inputs["light_options"], inputs["moisture_options"], inputs["soil_ph_ranges"],
+                                          inputs["datetimes64"], inputs["temperatures"], inputs["time_deltas"], rng)
+
+
+def compare(name, scalar_values, batch_values, groups):
+
+    print(f"{name}:")
+
+    for group in np.unique(groups):
+        mask = groups == group
+        print(f"    {group:<26} scalar mean {scalar_values[mask].mean():9.2f} [{scalar_values[mask].min():8.2f}, {scalar_values[mask].max():8.2f}]"
+              f" | batch mean {batch_values[mask].mean():9.2f} [{batch_values[mask].min():8.2f}, {batch_values[mask].max():8.2f}]")
+
+
+def run(count):
+
+    random.seed(1)
+    rng = np.random.default_rng(1)
+    inputs = make_inputs(count, rng)
+    inputs["datetimes64"] = np.array(inputs["times"], dtype="datetime64[us]")
+
+    start = time.perf_counter()
+    scalar = scalar_readings(inputs)
+    scalar_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = batch_readings(inputs, rng)
+    batch_elapsed = time.perf_counter() - start
+
+    print(f"{count} readings | scalar: {scalar_elapsed * 1000:.1f} ms | batch: {batch_elapsed * 1000:.1f} ms | speedup: {scalar_elapsed / batch_elapsed:.0f}x")
+
+    hours = np.array([value.hour for value in inputs["times"]])
+    periods = np.select([(hours >= 6) & (hours < 9), (hours >= 9) & (hours < 17), (hours >= 17) & (hours < 19)], ["06-09", "09-17", "17-19"], "night")
+
+    compare("Light intensity (LUX)", scalar["light_intensity_lux"], batch["light_intensity_lux"], np.char.add(np.char.add(inputs["light_options"].astype(str), " "), periods))
+    compare("Soil moisture", scalar["soil_moisture"], batch["soil_moisture"], inputs["moisture_options"])
+    compare("Soil pH", scalar["soil_ph"], batch["soil_ph"], inputs["soil_ph_ranges"])
+
+
+if __name__ == "__main__":
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    run(count)
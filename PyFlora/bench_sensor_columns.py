@@ -0,0 +1,85 @@
+import numpy as np
+import sqlalchemy as db
+from sqlalchemy.orm import Session
+from pyflora_db import Base, SensorReadings
+from sensor_columns import SERIES, load_reading_columns
+import datetime as dt
+import tempfile
+import time
+import sys
+import os
+
+# Usage: python bench_sensor_columns.py [rows]
+# Loads one pot's whole history the way the graph used to (ORM objects, then one
+# Python list per series) and with sensor_columns.load_reading_columns.
+
+BATCH_SIZE = 50000
+POT_ID = 1
+
+
+def fill_readings(engine, row_count):
+
+    start_time = dt.datetime(2020, 1, 1)
+    rng = np.random.default_rng(1)
+    values = rng.uniform(0, 100, (row_count, 4)).round(2)
+
+    with engine.begin() as connection:
+        for first in range(0, row_count, BATCH_SIZE):
+            connection.execute(db.insert(SensorReadings), [{
+                "pot_id": POT_ID,
+                "datetime": start_time + dt.timedelta(minutes=i),
+                "watering_timestamp": None,
+                "temperature_celsius": values[i, 0],
+                "light_intensity_lux": values[i, 1],
+                "soil_moisture": values[i, 2],
+                "soil_ph": values[i, 3] if i % 1000 else None
+            } for i in range(first, min(first + BATCH_SIZE, row_count))])
+
+
+def orm_path(engine):
+
+    with Session(bind=engine) as session:
+        readings = session.query(SensorReadings).filter(SensorReadings.pot_id == POT_ID).order_by(SensorReadings.datetime).all()
+
+        x_data = [reading.datetime.timestamp() for reading in readings]
+        y_data = {name: [getattr(reading, name) for reading in readings] for name in SERIES}
+
+    return x_data, y_data
+
+
+def columnar_path(engine):
+
+    return load_reading_columns(engine, POT_ID)
+
+
+def run(row_count):
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = db.create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+
+        start = time.perf_counter()
+        fill_readings(engine, row_count)
+        print(f"filled {row_count} readings in {time.perf_counter() - start:.1f} s")
+
+        start = time.perf_counter()
+        x_data, y_data = orm_path(engine)
+        orm_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        columns = columnar_path(engine)
+        columnar_elapsed = time.perf_counter() - start
+
+        same_times = np.allclose(np.array(x_data), columns["datetime"], rtol=0, atol=0.001)
+        same_values = all(np.array_equal(np.array(y_data[name], dtype=np.float64), columns[name], equal_nan=True) for name in SERIES)
+
+        print(f"{row_count} readings | ORM: {orm_elapsed * 1000:.0f} ms | columnar: {columnar_elapsed * 1000:.0f} ms"
+              f" | speedup: {orm_elapsed / columnar_elapsed:.1f}x | same data: {same_times and same_values}")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    run(count)
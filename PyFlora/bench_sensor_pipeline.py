@@ -0,0 +1,98 @@
+from sqlalchemy.orm import Session
+from pyflora_db import Pots, init_db
+from bench_sync_all_pots import create_pots
+from weather_stub import DEFAULT_PORT
+from openweather_temp import parse_temperature
+import sensor_pipeline
+import sensor_sync
+import datetime as dt
+import subprocess
+import tempfile
+import requests
+import socket
+import time
+import sys
+import os
+
+# Usage: python bench_sensor_pipeline.py [pots] [latency] [error rate]
+# Starts weather_stub.py in its own process (every response delayed by `latency` seconds,
+# `error rate` of them failing, with a fixed seed so every run fails the same requests)
+# and collects one reading per pot the old way (one blocking weather request, reading and
+# commit per pot, timed on SERIAL_SAMPLE pots) and with sensor_pipeline, with every pot in
+# the same city (one request per round), pots spread over 100 cities and a city per pot.
+
+SERIAL_SAMPLE = 200
+
+
+def start_stub(port, latency, error_rate=0.0):
+
+    stub = subprocess.Popen([sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "weather_stub.py"),
+                             "--port", str(port), "--latency", str(latency), "--error-rate", str(error_rate), "--seed", "1"])
+
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return stub
+        except OSError:
+            time.sleep(0.1)
+
+    stub.kill()
+    raise RuntimeError("weather stub did not start")
+
+
+def serial_sync(engine, url, pot_count):
+
+    http_session = requests.Session()
+    current_time = dt.datetime.now()
+
+    with Session(bind=engine) as session:
+        pots = session.query(Pots).order_by(Pots.id).limit(pot_count).all()
+        start = time.perf_counter()
+
+        for pot in pots:
+            response = http_session.get(url, params={'q': f"City {pot.id}", 'units': 'metric', 'appid': 'stub'}, timeout=10)
+            temperature = parse_temperature(response.status_code, response.json())
+
+            if temperature is None:
+                continue
+
+            last_entry_times = sensor_sync.latest_reading_times(session, [pot.id])
+            sensor_sync.write_readings(session, [sensor_sync.build_reading(pot, current_time, temperature, last_entry_times.get(pot.id))])
+
+        return time.perf_counter() - start
+
+
+def run(pot_count, latency, error_rate=0.0):
+
+    port = DEFAULT_PORT + 1
+    url = f"http://127.0.0.1:{port}/data/2.5/weather"
+    stub = start_stub(port, latency, error_rate)
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            engine = init_db(os.path.join(tmp_dir, "bench.db"))
+            create_pots(engine, pot_count)
+
+            elapsed = serial_sync(engine, url, min(SERIAL_SAMPLE, pot_count))
+            print(f"serial, one request per pot     | {min(SERIAL_SAMPLE, pot_count) / elapsed:8.0f} pots/s")
+
+            city_choices = (("pipeline, one city", lambda pot: "Zagreb"),
+                            ("pipeline, 100 cities", lambda pot: f"City {pot.id % 100}"),
+                            ("pipeline, one city per pot", lambda pot: f"City {pot.id}"))
+
+            for label, city_of in city_choices:
+                report = sensor_pipeline.run_pipeline(engine, url=url, api_key="stub", backend="openweather", city_of=city_of)
+                print(f"{label:<31} | {report.pots / report.seconds:8.0f} pots/s ({report.readings} readings, {report.requests} requests, {report.no_temperature} without temperature, {report.stale} stale, {report.seconds:.2f} s)")
+
+            engine.dispose()
+    finally:
+        stub.terminate()
+        stub.wait()
+
+
+if __name__ == "__main__":
+
+    pot_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.02
+    error_rate = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+    run(pot_count, latency, error_rate)
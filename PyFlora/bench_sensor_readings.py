@@ -0,0 +1,93 @@
+import sqlalchemy as db
+from sqlalchemy.orm import Session
+from pyflora_db import Base, SensorReadings, upgrade_schema
+import datetime as dt
+import tempfile
+import random
+import time
+import sys
+import os
+
+# Usage: python bench_sensor_readings.py [rows ...]
+# Fills a temporary database with readings spread over POT_COUNT pots and times the
+# latest-reading lookup used by PotsTab, with and without the composite indexes.
+
+POT_COUNT = 500
+LOOKUPS = 2000
+UNINDEXED_LOOKUPS = 20
+BATCH_SIZE = 50000
+
+
+def fill_readings(engine, row_count):
+
+    start_time = dt.datetime(2020, 1, 1)
+
+    with engine.begin() as connection:
+        batch = []
+
+        for i in range(row_count):
+            pot_id = i % POT_COUNT + 1
+            batch.append({
+                "pot_id": pot_id,
+                "datetime": start_time + dt.timedelta(minutes=15 * (i // POT_COUNT)),
+                "watering_timestamp": None,
+                "temperature_celsius": 20.0,
+                "light_intensity_lux": 500.0,
+                "soil_moisture": 5.0,
+                "soil_ph": 6.5
+            })
+
+            if len(batch) == BATCH_SIZE:
+                connection.execute(db.insert(SensorReadings), batch)
+                batch = []
+
+        if batch:
+            connection.execute(db.insert(SensorReadings), batch)
+
+
+def time_latest_lookup(engine, lookups):
+
+    pot_ids = [random.randint(1, POT_COUNT) for _ in range(lookups)]
+
+    with Session(bind=engine) as session:
+        start = time.perf_counter()
+
+        for pot_id in pot_ids:
+            session.query(SensorReadings).filter(SensorReadings.pot_id == pot_id).order_by(SensorReadings.datetime.desc()).first()
+            session.query(SensorReadings).filter(SensorReadings.pot_id == pot_id).order_by(SensorReadings.watering_timestamp.desc()).first()
+
+        elapsed = time.perf_counter() - start
+
+    return elapsed / lookups * 1000000
+
+
+def run(row_count):
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = db.create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+
+        Base.metadata.create_all(bind=engine)
+        for index in SensorReadings.__table__.indexes:
+            index.drop(bind=engine)
+
+        fill_readings(engine, row_count)
+
+        without_index = time_latest_lookup(engine, UNINDEXED_LOOKUPS)
+
+        upgrade_schema(engine)
+        with engine.connect() as connection:
+            connection.exec_driver_sql("ANALYZE")
+
+        with_index = time_latest_lookup(engine, LOOKUPS)
+
+        engine.dispose()
+
+    print(f"{row_count:>10} rows | no index: {without_index:10.1f} us/lookup | indexed: {with_index:8.1f} us/lookup")
+
+
+if __name__ == "__main__":
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10000, 100000, 1000000]
+
+    for size in sizes:
+        run(size)
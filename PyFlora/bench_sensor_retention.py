@@ -0,0 +1,114 @@
+import numpy as np
+import sqlalchemy as db
+from sqlalchemy.orm import Session
+from pyflora_db import Base, SensorReadings, SensorRollupsHourly, SensorRollupsDaily
+import sensor_rollups
+import sensor_retention
+import datetime as dt
+import tempfile
+import threading
+import time
+import sys
+import os
+
+# Usage: python bench_sensor_retention.py [rows] [years]
+# Fills a temporary database with readings of POT_COUNT pots spread over a few years
+# (every WATERING_EVERY-th one a watering), runs the retention job with an incremental
+# vacuum and reports what it deleted and reclaimed. Meanwhile a writer thread inserts a
+# reading every WRITE_INTERVAL seconds and records how long each insert had to wait.
+
+BATCH_SIZE = 50000
+POT_COUNT = 20
+WATERING_EVERY = 500
+WRITE_INTERVAL = 0.05
+
+
+def fill_readings(engine, row_count, years, end_time):
+
+    start_time = end_time - dt.timedelta(days=365 * years)
+    step = years * 365 * 86400 / row_count
+    rng = np.random.default_rng(1)
+    values = rng.uniform(0, 100, (row_count, 4)).round(2)
+
+    with engine.begin() as connection:
+        for first in range(0, row_count, BATCH_SIZE):
+            rows = []
+
+            for i in range(first, min(first + BATCH_SIZE, row_count)):
+                reading_time = start_time + dt.timedelta(seconds=i * step)
+                rows.append({
+                    "pot_id": i % POT_COUNT + 1,
+                    "datetime": reading_time,
+                    "watering_timestamp": reading_time if i % WATERING_EVERY == 0 else None,
+                    "temperature_celsius": values[i, 0],
+                    "light_intensity_lux": values[i, 1],
+                    "soil_moisture": values[i, 2],
+                    "soil_ph": values[i, 3]
+                })
+
+            connection.execute(db.insert(SensorReadings), rows)
+
+
+def writer(engine, stop, waits):
+
+    while not stop.is_set():
+        started = time.perf_counter()
+
+        with engine.begin() as connection:
+            connection.execute(db.insert(SensorReadings), {"pot_id": POT_COUNT + 1, "datetime": None, "temperature_celsius": 20.0})
+
+        waits.append(time.perf_counter() - started)
+        time.sleep(WRITE_INTERVAL)
+
+
+def counts(engine):
+
+    with Session(bind=engine) as session:
+        waterings = session.execute(db.select(db.func.count()).where(SensorReadings.watering_timestamp.is_not(None))).scalar()
+        readings = session.execute(db.select(db.func.count()).select_from(SensorReadings)).scalar()
+        hourly = session.execute(db.select(db.func.count()).select_from(SensorRollupsHourly)).scalar()
+        daily = session.execute(db.select(db.func.total(SensorRollupsDaily.reading_count))).scalar()
+
+    return readings, waterings, hourly, daily
+
+
+def run(row_count, years):
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = db.create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        #still empty, so switching to incremental vacuum is instant here
+        sensor_retention.enable_incremental_vacuum(engine)
+
+        fill_readings(engine, row_count, years, dt.datetime.now())
+
+        with Session(bind=engine) as session:
+            sensor_rollups.backfill_rollups(session)
+
+        readings, waterings, hourly, daily = counts(engine)
+        print(f"before: {readings} readings ({waterings} waterings), {hourly} hourly rollups, {daily:.0f} readings in daily rollups,"
+              f" {sensor_retention.file_size(engine) / 1048576:.1f} MiB")
+
+        stop, waits = threading.Event(), []
+        writer_thread = threading.Thread(target=writer, args=(engine, stop, waits))
+        writer_thread.start()
+
+        report = sensor_retention.apply_retention(engine, vacuum=True)
+
+        stop.set()
+        writer_thread.join()
+
+        readings, waterings_after, hourly, daily_after = counts(engine)
+        print(f"after:  {readings} readings ({waterings_after} waterings), {hourly} hourly rollups, {daily_after:.0f} readings in daily rollups,"
+              f" {sensor_retention.file_size(engine) / 1048576:.1f} MiB")
+        print(sensor_retention.format_report(report))
+        print(f"concurrent writer: {len(waits)} inserts, median wait {np.median(waits) * 1000:.1f} ms, max wait {max(waits) * 1000:.1f} ms")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    years = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    run(count, years)
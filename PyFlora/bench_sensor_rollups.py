@@ -0,0 +1,113 @@
+import numpy as np
+import sqlalchemy as db
+from sqlalchemy.orm import Session
+from pyflora_db import Base, SensorReadings
+from sensor_columns import load_reading_columns
+import sensor_rollups
+import datetime as dt
+import tempfile
+import time
+import sys
+import os
+
+# Usage: python bench_sensor_rollups.py [rows] [years]
+# Spreads the readings of one pot over a few years, builds the rollups and times the
+# multi-year and one-week views read from raw readings and from the level the graph picks.
+# Also checks that incremental updates end up with the same buckets as a backfill.
+
+BATCH_SIZE = 50000
+POT_ID = 1
+
+
+def fill_readings(engine, row_count, years):
+
+    start_time = dt.datetime(2020, 1, 1)
+    step = years * 365 * 86400 / row_count
+    rng = np.random.default_rng(1)
+    values = rng.uniform(0, 100, (row_count, 4)).round(2)
+
+    with engine.begin() as connection:
+        for first in range(0, row_count, BATCH_SIZE):
+            connection.execute(db.insert(SensorReadings), [{
+                "pot_id": POT_ID,
+                "datetime": start_time + dt.timedelta(seconds=i * step),
+                "watering_timestamp": None,
+                "temperature_celsius": values[i, 0],
+                "light_intensity_lux": values[i, 1],
+                "soil_moisture": values[i, 2],
+                "soil_ph": values[i, 3]
+            } for i in range(first, min(first + BATCH_SIZE, row_count))])
+
+
+def time_view(engine, start, first, last):
+    #start=None reads from the first reading
+
+    began = time.perf_counter()
+    raw = load_reading_columns(engine, POT_ID, start=start)
+    raw_elapsed = time.perf_counter() - began
+
+    began = time.perf_counter()
+    resolution = sensor_rollups.pick_resolution(engine, POT_ID, first if start is None else start, last)
+
+    if resolution == "raw":
+        picked = load_reading_columns(engine, POT_ID, start=start)
+    else:
+        picked = sensor_rollups.load_rollup_columns(engine, POT_ID, resolution, start=start)
+
+    picked_elapsed = time.perf_counter() - began
+
+    return len(raw["datetime"]), raw_elapsed, resolution, len(picked["datetime"]), picked_elapsed
+
+
+def rollup_rows(session):
+
+    return [session.execute(db.select(table.__table__).order_by(table.pot_id, table.bucket_start)).all() for table, _, _ in sensor_rollups.RESOLUTIONS.values()]
+
+
+def check_incremental(engine):
+
+    with Session(bind=engine) as session:
+        readings = session.execute(db.select(SensorReadings).order_by(SensorReadings.id.desc()).limit(5000)).scalars().all()
+        sensor_rollups.delete_rollups(session)
+        sensor_rollups.add_readings(session, readings)
+        session.commit()
+        incremental = rollup_rows(session)
+
+        session.execute(db.delete(SensorReadings).where(SensorReadings.id < readings[-1].id))
+        sensor_rollups.backfill_rollups(session)
+        rebuilt = rollup_rows(session)
+
+    same = all(len(a) == len(b) and all(x[:3] == y[:3] and np.allclose([value or 0.0 for value in x[3:]], [value or 0.0 for value in y[3:]]) for x, y in zip(a, b))
+               for a, b in zip(incremental, rebuilt))
+
+    print(f"incremental rollups of the last 5000 readings match a backfill: {same}")
+
+
+def run(row_count, years):
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = db.create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+
+        fill_readings(engine, row_count, years)
+
+        began = time.perf_counter()
+        with Session(bind=engine) as session:
+            sensor_rollups.backfill_rollups(session)
+        print(f"backfill of {row_count} readings over {years} years: {(time.perf_counter() - began) * 1000:.0f} ms")
+
+        first, last = sensor_rollups.history_extent(engine, POT_ID)
+
+        for label, start in [("whole history", None), ("last month", last - 30 * 86400), ("last week", last - 7 * 86400)]:
+            raw_rows, raw_elapsed, resolution, picked_rows, picked_elapsed = time_view(engine, start, first, last)
+            print(f"{label:<14} | raw: {raw_rows} rows in {raw_elapsed * 1000:.0f} ms | {resolution}: {picked_rows} rows in {picked_elapsed * 1000:.0f} ms")
+
+        check_incremental(engine)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    years = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    run(count, years)
@@ -0,0 +1,111 @@
+import numpy as np
+import sqlalchemy as db
+from pyflora_db import Base, SensorReadings, create_db_engine
+from sensor_columns import load_reading_columns
+import datetime as dt
+import tempfile
+import threading
+import random
+import time
+import sys
+import os
+
+# Usage: python bench_sqlite_concurrency.py [seconds] [readers]
+# One writer thread commits sync-sized batches of readings while reader threads load
+# recent pot histories the way the graph does. Runs once with a plain create_engine
+# (rollback journal, default pragmas) and once with pyflora_db.create_db_engine (WAL and
+# tuned pragmas), each on its own copy of the same prefilled database.
+
+POT_COUNT = 200
+PREFILL = 200000
+WRITE_BATCH = 50
+
+
+def prefill(engine):
+
+    start_time = dt.datetime.now() - dt.timedelta(days=30)
+
+    with engine.begin() as connection:
+        connection.execute(db.insert(SensorReadings), [{
+            "pot_id": i % POT_COUNT + 1,
+            "datetime": start_time + dt.timedelta(seconds=i * 12),
+            "temperature_celsius": 20.0,
+            "light_intensity_lux": 500.0,
+            "soil_moisture": 5.0,
+            "soil_ph": 6.5
+        } for i in range(PREFILL)])
+
+
+def writer(engine, stop, stats):
+
+    while not stop.is_set():
+        started = time.perf_counter()
+
+        with engine.begin() as connection:
+            connection.execute(db.insert(SensorReadings), [{
+                "pot_id": random.randint(1, POT_COUNT),
+                "datetime": dt.datetime.now(),
+                "temperature_celsius": 20.0,
+                "light_intensity_lux": 500.0,
+                "soil_moisture": 5.0,
+                "soil_ph": 6.5
+            } for _ in range(WRITE_BATCH)])
+
+        stats.append(time.perf_counter() - started)
+
+
+def reader(engine, stop, stats):
+
+    day_ago = time.time() - 86400
+
+    while not stop.is_set():
+        started = time.perf_counter()
+        load_reading_columns(engine, random.randint(1, POT_COUNT), start=day_ago)
+        stats.append(time.perf_counter() - started)
+
+
+def measure(engine, seconds, readers):
+
+    stop = threading.Event()
+    write_stats, read_stats = [], [[] for _ in range(readers)]
+
+    threads = [threading.Thread(target=writer, args=(engine, stop, write_stats))]
+    threads += [threading.Thread(target=reader, args=(engine, stop, stats)) for stats in read_stats]
+
+    for thread in threads:
+        thread.start()
+
+    time.sleep(seconds)
+    stop.set()
+
+    for thread in threads:
+        thread.join()
+
+    reads = np.array([value for stats in read_stats for value in stats])
+    writes = np.array(write_stats)
+
+    return (f"writer {len(writes) / seconds:6.1f} commits/s (p99 {np.percentile(writes, 99) * 1000:6.1f} ms)"
+            f" | readers {len(reads) / seconds:7.1f} queries/s (p99 {np.percentile(reads, 99) * 1000:6.1f} ms, max {reads.max() * 1000:6.1f} ms)")
+
+
+def run(seconds, readers):
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engines = {
+            "plain create_engine": db.create_engine(f"sqlite:///{os.path.join(tmp_dir, 'plain.db')}"),
+            "create_db_engine": create_db_engine(os.path.join(tmp_dir, "tuned.db"))
+        }
+
+        for label, engine in engines.items():
+            Base.metadata.create_all(bind=engine)
+            prefill(engine)
+
+            print(f"{label:<20} | {measure(engine, seconds, readers)}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    run(seconds, readers)
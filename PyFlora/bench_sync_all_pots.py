@@ -0,0 +1,107 @@
+import sqlalchemy as db
+from sqlalchemy.orm import Session
+from pyflora_db import Base, Pots, SensorReadings
+from sensor_light import measure_light_intensity
+from sensor_moisture import initial_soil_moisture, measure_soil_moisture
+from sensor_ph import measure_soil_ph
+from sensor_service import SensorReadingService
+import datetime as dt
+import tempfile
+import time
+import sys
+import os
+
+# Usage: python bench_sync_all_pots.py [pots]
+# Compares the old per-pot query + commit loop with SensorReadingService, calling
+# take_reading() for every pot and take_readings() once for all of them.
+# The temperature is fixed so only database work is measured.
+
+TEMPERATURE = 21.5
+
+
+def create_pots(engine, pot_count):
+
+    light_options = ["Shade", "Indirect sunlight", "Strong light", "Full sun"]
+    moisture_options = ["Dry", "Normal", "Wet"]
+
+    with Session(bind=engine) as session:
+        for i in range(pot_count):
+            session.add(Pots(
+                name=f"Pot {i + 1} - Living room",
+                plant_name="Ficus",
+                location="Living room",
+                light_intensity=light_options[i % len(light_options)],
+                soil_moisture=moisture_options[i % len(moisture_options)],
+                soil_ph="6.0 - 7.0"
+            ))
+        session.commit()
+
+
+def legacy_sync(engine):
+
+    current_time = dt.datetime.now()
+
+    with Session(bind=engine) as local_session:
+        pots = local_session.query(Pots).all()
+
+        for pot in pots:
+            light_intensity = measure_light_intensity(pot.light_intensity)
+            last_reading = local_session.query(SensorReadings).filter(SensorReadings.pot_id == pot.id).order_by(SensorReadings.datetime.desc()).first()
+
+            if last_reading:
+                time_delta = (current_time - last_reading.datetime).total_seconds()/3600
+                soil_moisture_calc = measure_soil_moisture(pot.soil_moisture, TEMPERATURE, light_intensity, time_delta)
+            else:
+                soil_moisture_calc = initial_soil_moisture(pot.soil_moisture)
+
+            local_session.add(SensorReadings(
+                pot_id=pot.id,
+                datetime=current_time,
+                temperature_celsius=TEMPERATURE,
+                light_intensity_lux=light_intensity,
+                soil_moisture=soil_moisture_calc,
+                soil_ph=measure_soil_ph(pot.soil_ph)
+            ))
+            local_session.commit()
+
+
+def service_single(engine):
+
+    service = SensorReadingService(engine, lambda place: TEMPERATURE)
+
+    with Session(bind=engine) as local_session:
+        pot_ids = [pot_id for pot_id, in local_session.query(Pots.id).order_by(Pots.id)]
+
+    for pot_id in pot_ids:
+        service.take_reading(pot_id)
+
+
+def service_batched(engine):
+
+    SensorReadingService(engine, lambda place: TEMPERATURE).take_readings()
+
+
+def run(pot_count):
+
+    for name, sync in (("per-pot loop", legacy_sync), ("take_reading", service_single), ("take_readings", service_batched)):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            engine = db.create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+            Base.metadata.create_all(bind=engine)
+            create_pots(engine, pot_count)
+
+            #first sync takes the initial moisture path, the second one the time-delta path
+            sync(engine)
+
+            start = time.perf_counter()
+            sync(engine)
+            elapsed = time.perf_counter() - start
+
+            engine.dispose()
+
+        print(f"{pot_count:>6} pots | {name:<13} | {elapsed * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+
+    pot_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    run(pot_count)
@@ -0,0 +1,74 @@
+import subprocess
+import statistics
+import tempfile
+import shutil
+import sys
+import os
+
+# Usage: python bench_ui_loading.py [runs]
+# Cold start of the app in a fresh process each run, with the .ui files parsed by loadUi
+# ([ui] precompiled = no) and with the modules from build_ui.py: time to import the
+# app, to show the login screen and to log in and build the home screen with all tabs
+# (all from process start), then to build every screen once more, as a new login does,
+# and the median of RELOADS - 1 further rebuilds.
+# Runs on a copy of pyflora.db, with the offscreen Qt platform.
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+RELOADS = 9
+
+CHILD = r"""
+RELOADS = %d
+import time
+started = time.perf_counter()
+import importlib.util, sys
+sys.path.insert(0, ".")
+from PyQt5.QtWidgets import QApplication
+app = QApplication([])
+spec = importlib.util.spec_from_file_location("pyflora_main", "1_pyflora_main.py")
+main = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(main)
+imported = time.perf_counter()
+login = main.LoginScreen()
+login.show()
+app.processEvents()
+login_shown = time.perf_counter()
+login.username_input.setText("m")
+login.password_input.setText("m")
+login.authenticate()
+app.processEvents()
+home_shown = time.perf_counter()
+import statistics, ui_loader
+reloads = []
+for _ in range(RELOADS):
+    reload_started = time.perf_counter()
+    for ui_file in ui_loader.UI_FILES:
+        ui_loader.load_ui(ui_file)
+    reloads.append(time.perf_counter() - reload_started)
+print(imported - started, login_shown - started, home_shown - started, reloads[0], statistics.median(reloads[1:]))
+"""
+
+
+def cold_start(precompiled, database):
+
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", PYFLORA_UI_PRECOMPILED=precompiled, PYFLORA_DATABASE_PATH=database)
+    output = subprocess.run([sys.executable, "-c", CHILD % RELOADS], cwd=APP_DIR, env=env, capture_output=True, text=True, check=True).stdout
+
+    return [float(value) for value in output.strip().splitlines()[-1].split()]
+
+
+def run(runs):
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database = os.path.join(tmp_dir, "pyflora.db")
+        shutil.copy(os.path.join(APP_DIR, "pyflora.db"), database)
+
+        for label, precompiled in (("loadUi", "no"), ("precompiled", "yes")):
+            timings = [cold_start(precompiled, database) for _ in range(runs)]
+            imported, login_shown, home_shown, reloaded, repeated = (statistics.median(column) * 1000 for column in zip(*timings))
+
+            print(f"{label:<12} | import {imported:7.1f} ms | login screen {login_shown:7.1f} ms | home screen {home_shown:7.1f} ms | all .ui files again {reloaded:6.1f} ms, repeated {repeated:6.1f} ms")
+
+
+if __name__ == "__main__":
+
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
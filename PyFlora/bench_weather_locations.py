@@ -0,0 +1,64 @@
+from pyflora_db import init_db
+from bench_sync_all_pots import create_pots
+from bench_sensor_pipeline import start_stub
+from weather_stub import DEFAULT_PORT
+from openweather_temp import HttpWeatherBackend, WeatherProvider, FETCH_WORKERS, temperatures_for
+from weather_locations import LocationMap
+from sensor_service import SensorReadingService
+import sqlalchemy as db
+import tempfile
+import time
+import sys
+import os
+
+# Usage: python bench_weather_locations.py [pots] [sites] [latency]
+# Spreads the pots over `sites` locations, each mapped to its own city, and syncs them all
+# through SensorReadingService against weather_stub.py (every response delayed by
+# `latency` seconds). Counts the weather requests, and times looking the sites up one
+# after the other against FETCH_WORKERS at a time.
+
+
+def run(pot_count, site_count, latency):
+
+    port = DEFAULT_PORT + 2
+    url = f"http://127.0.0.1:{port}/data/2.5/weather"
+    stub = start_stub(port, latency)
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            engine = init_db(os.path.join(tmp_dir, "bench.db"))
+            create_pots(engine, pot_count)
+
+            with engine.begin() as connection:
+                connection.execute(db.text("UPDATE Pots SET location = 'Site ' || (id % :sites)"), {"sites": site_count})
+
+            cities = [f"City {site}" for site in range(site_count)]
+            locations = LocationMap({f"Site {site}": city for site, city in enumerate(cities)})
+
+            for label, workers in (("one site after the other", 1), (f"{FETCH_WORKERS} sites at a time", FETCH_WORKERS)):
+                provider = WeatherProvider(HttpWeatherBackend(url, "stub"), ttl=0)
+                start = time.perf_counter()
+                temperatures_for(provider.current_temperature, cities, workers)
+                elapsed = time.perf_counter() - start
+                print(f"{label:<25} | {site_count:>4} sites | {provider.cache_misses:>5} requests | {elapsed * 1000:8.1f} ms")
+
+            provider = WeatherProvider(HttpWeatherBackend(url, "stub"))
+            service = SensorReadingService(engine, provider.current_temperature, locations=locations)
+
+            start = time.perf_counter()
+            result = service.take_readings()
+            elapsed = time.perf_counter() - start
+            print(f"{'take_readings':<25} | {result.pots:>5} pots | {provider.cache_misses:>5} requests | {elapsed * 1000:8.1f} ms ({result.readings} readings)")
+
+            engine.dispose()
+    finally:
+        stub.terminate()
+        stub.wait()
+
+
+if __name__ == "__main__":
+
+    pot_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    site_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    latency = float(sys.argv[3]) if len(sys.argv) > 3 else 0.1
+    run(pot_count, site_count, latency)
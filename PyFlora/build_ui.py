@@ -0,0 +1,75 @@
+from PyQt5.uic import compileUi
+from ui_loader import UI_FILES, module_name, source_hash, widget_class
+import pyflora_config
+import argparse
+import io
+import os
+import re
+
+# Build step for the Qt Designer files: python build_ui.py
+# Writes <name>_ui.py next to every .ui file with the code pyuic5 would generate, plus
+# the hash of the .ui file it was built from, so ui_loader.load_ui() can tell when the
+# .ui file was edited afterwards. Run it again after changing a .ui file; until then the
+# app falls back to loading that file with loadUi. Images the .ui file names by file
+# (icons) are looked up next to the generated module, wherever the checkout is.
+
+#the .ui files point at pyflora.qrc, the app's compiled resources are resource_rc.py
+RESOURCE_IMPORTS = {"import pyflora_rc": "import resource_rc"}
+
+QT_IMPORT = "from PyQt5 import QtCore, QtGui, QtWidgets\n"
+PIXMAP = re.compile(r'QtGui\.QPixmap\("([^":]+)"\)')
+
+
+def build(ui_file, check=False):
+    #True when <name>_ui.py was (or, with check, would be) rewritten
+
+    path = os.path.join(pyflora_config.APP_DIR, ui_file)
+    target = os.path.join(pyflora_config.APP_DIR, module_name(ui_file) + ".py")
+
+    #given the open file, uic leaves image paths as they are written in the .ui file instead of making them absolute
+    code = io.StringIO()
+    with open(path, encoding="utf-8") as ui_source:
+        compileUi(ui_source, code, from_imports=False)
+    source = code.getvalue()
+
+    #the header names the .ui file, not where this checkout happens to be
+    source = source.replace(f"'{path}'", f"'{ui_file}'")
+
+    for generated, replacement in RESOURCE_IMPORTS.items():
+        source = source.replace(generated, replacement)
+
+    if PIXMAP.search(source):
+        source = source.replace(QT_IMPORT, QT_IMPORT + "import os\n\nUI_DIR = os.path.dirname(os.path.abspath(__file__))\n", 1)
+        source = PIXMAP.sub(r'QtGui.QPixmap(os.path.join(UI_DIR, "\1"))', source)
+
+    ui_class = source.split("class ", 1)[1].split("(", 1)[0]
+
+    source += (f"\n\nUI_CLASS = {ui_class}\n"
+               f"WIDGET_CLASS = \"{widget_class(path)}\"\n"
+               f"SOURCE_HASH = \"{source_hash(path)}\"\n")
+
+    if os.path.exists(target):
+        with open(target, encoding="utf-8") as current:
+            if current.read() == source:
+                return False
+
+    if not check:
+        with open(target, "w", encoding="utf-8") as generated_file:
+            generated_file.write(source)
+
+    return True
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Generate Python modules from the Qt Designer .ui files.")
+    parser.add_argument("--check", action="store_true", help="only list the modules that are missing or out of date")
+    args = parser.parse_args()
+
+    changed = [ui_file for ui_file in UI_FILES if build(ui_file, args.check)]
+
+    for ui_file in changed:
+        print(f"{module_name(ui_file)}.py {'is out of date' if args.check else 'written'}")
+
+    if not changed:
+        print("All UI modules are up to date.")
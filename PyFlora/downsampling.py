@@ -0,0 +1,47 @@
+import numpy as np
+
+# Level-of-detail helpers for long sensor histories: keep only the part of a series
+# that is on screen and reduce it to at most max_points with min/max decimation, so
+# peaks and dips stay visible however many readings there are.
+
+MAX_POINTS = 2000
+
+
+def visible_slice(x, x_min, x_max, padding=0.0):
+    #x must be sorted; padding (in x units) keeps a margin so short pans do not show empty edges
+
+    start = max(int(np.searchsorted(x, x_min - padding, side="left")) - 1, 0)
+    stop = min(int(np.searchsorted(x, x_max + padding, side="right")) + 1, len(x))
+
+    return start, stop
+
+
+def minmax_indices(y, max_points=MAX_POINTS):
+    #per bucket the indices of the lowest and highest value, plus the first and last point
+
+    count = len(y)
+
+    if count <= max_points:
+        return np.arange(count)
+
+    buckets = max(max_points // 2 - 1, 1)
+    bucket_size = int(np.ceil(count / buckets))
+    padding = buckets * bucket_size - count
+
+    padded = np.concatenate([np.asarray(y, dtype=np.float64), np.full(padding, np.nan)]).reshape(buckets, bucket_size)
+    missing = np.isnan(padded)
+    offsets = np.arange(buckets) * bucket_size
+
+    lowest = np.argmin(np.where(missing, np.inf, padded), axis=1) + offsets
+    highest = np.argmax(np.where(missing, -np.inf, padded), axis=1) + offsets
+
+    indices = np.unique(np.concatenate([lowest, highest, [0, count - 1]]))
+
+    return indices[indices < count]
+
+
+def minmax_downsample(x, y, max_points=MAX_POINTS):
+
+    indices = minmax_indices(y, max_points)
+
+    return x[indices], y[indices]
@@ -0,0 +1,114 @@
+from PyQt5.QtCore import QRect, QSize
+from PyQt5.QtGui import QImageReader, QPixmap, QPixmapCache
+import pyflora_config
+import hashlib
+import os
+
+# Downscaled copies of plant/pot/profile images. Each thumbnail is generated once and
+# stored in THUMBNAIL_DIR under a key made of the source path, its mtime and size, so an
+# edited photo gets a new thumbnail. Decoded thumbnails are kept in QPixmapCache under
+# the source path and mtime, which is bounded by PIXMAP_CACHE_KB and evicts the least
+# recently used entries. THUMBNAIL_DIR sits next to the app, wherever it is started from.
+
+THUMBNAIL_DIR = os.path.join(pyflora_config.APP_DIR, ".thumbnails")
+PIXMAP_CACHE_KB = 20 * 1024
+INFO_IMAGE_SIZE = 256
+
+QPixmapCache.setCacheLimit(PIXMAP_CACHE_KB)
+
+
+def stretched_image(source, width, height):
+    #what border-image does: the whole photo squeezed into the tile; the decoder scales while reading
+
+    reader = QImageReader(source)
+    reader.setScaledSize(QSize(width, height))
+
+    return reader.read()
+
+
+def center_strip_image(source, width, height):
+    #what background-image does: the centre of the photo at its native size, only that part is decoded
+
+    reader = QImageReader(source)
+    size = reader.size()
+
+    if size.isValid():
+        strip_width = min(size.width(), width)
+        strip_height = min(size.height(), height)
+        reader.setClipRect(QRect((size.width() - strip_width) // 2, (size.height() - strip_height) // 2, strip_width, strip_height))
+
+    return reader.read()
+
+
+VARIANTS = {
+    "stretch": stretched_image,
+    "strip": center_strip_image
+}
+
+
+def thumbnail_key(source, width, height, variant):
+
+    stat = os.stat(source)
+    raw_key = f"{os.path.abspath(source)}|{stat.st_mtime_ns}|{stat.st_size}|{variant}|{width}x{height}"
+
+    return hashlib.sha1(raw_key.encode("utf-8")).hexdigest()
+
+
+def thumbnail_file(source, width, height, variant="stretch"):
+
+    try:
+        key = thumbnail_key(source, width, height, variant)
+    except OSError:
+        return None
+
+    extension = ".png" if source.lower().endswith(".png") else ".jpg"
+    path = os.path.join(THUMBNAIL_DIR, key + extension)
+
+    if os.path.exists(path):
+        return path
+
+    image = VARIANTS[variant](source, width, height)
+
+    if image.isNull():
+        return None
+
+    os.makedirs(THUMBNAIL_DIR, exist_ok=True)
+
+    #written under a temporary name first so a half-written file is never picked up
+    temporary_path = f"{path}.{os.getpid()}.tmp{extension}"
+
+    if not image.save(temporary_path, quality=90):
+        return None
+
+    os.replace(temporary_path, path)
+
+    return path
+
+
+def thumbnail_pixmap(source, width, height, variant="stretch"):
+
+    try:
+        modified = os.stat(source).st_mtime_ns
+    except OSError:
+        modified = None
+
+    memory_key = f"{variant}:{width}x{height}:{modified}:{source}"
+    pixmap = QPixmapCache.find(memory_key)
+
+    if pixmap is None:
+        path = thumbnail_file(source, width, height, variant)
+        pixmap = QPixmap(path) if path else QPixmap()
+        QPixmapCache.insert(memory_key, pixmap)
+
+    return pixmap
+
+
+def thumbnail_url(source, size=INFO_IMAGE_SIZE):
+    #for stylesheets (border-image: url(...)); falls back to the original file
+
+    if not source:
+        return source
+
+    path = thumbnail_file(source, size, size)
+
+    return path.replace(os.sep, "/") if path else source
@@ -1,25 +1,384 @@
-import requests
-import datetime
+import pyflora_config
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import json
+import time
+import re
 
-def current_temperature_ow():
+API_KEY = 'YOUR_API_KEY'
+CITY = 'YOUR_CITY'
+WEATHER_URL = 'http://api.openweathermap.org/data/2.5/weather'
 
-    api_key = 'YOUR_API_KEY'
-    city = 'YOUR_CITY'
+CACHE_TTL = 300 #seconds
+REQUEST_TIMEOUT = (3.05, 10) #connect, read
+FAILURE_THRESHOLD = 3 #failed requests in a row that open the circuit breaker
+RESET_TIMEOUT = 60 #seconds the breaker stays open before one trial request
+FETCH_WORKERS = 8 #cities requested at the same time by current_temperatures
 
-    url = f'http://api.openweathermap.org/data/2.5/weather?q={city}&units=metric&appid={api_key}'
+COORDINATES = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*$")
 
-    response = requests.get(url)
+WeatherReading = namedtuple("WeatherReading", ["temperature", "age", "stale"]) #age in seconds, None when nothing is known
 
-    if response.status_code == 200:
-        
-        data = response.json()
-        temperature_celsius = data['main']['temp']
-        current_time = datetime.datetime.now().time().strftime("%H:%M:%S")
-        #print(f"Time: {current_time}. Current Temperature in {city}: {temperature_celsius}°C")
-        return round(temperature_celsius, 2)
+# Where temperatures come from is set in the [weather] section of pyflora.ini:
+# backend = openweather asks the OpenWeather API (or anything answering like it at url,
+# e.g. weather_stub.py) and, with record_file set, appends every response to that file;
+# backend = replay answers from such a recorded file, without any network.
+# Empty api_key / city / url fall back to the values above. Anywhere a city is asked for,
+# "latitude,longitude" works as well (see weather_locations.py for pots in several places).
 
-    else:
-        print("Failed to retrieve weather data. Status Code:", response.status_code)
+
+def place_params(place):
+    #a place is a city name or "latitude,longitude"
+
+    coordinates = COORDINATES.match(place)
+
+    if coordinates:
+        return {'lat': coordinates.group(1), 'lon': coordinates.group(2)}
+
+    return {'q': place}
+
+
+def parse_temperature(status, data):
+
+    if status != 200:
+        print("Failed to retrieve weather data. Status Code:", status)
+        return None
+
+    try:
+        return round(data['main']['temp'], 2)
+    except (KeyError, TypeError) as error:
+        print("Unexpected weather data.", error)
         return None
-    
+
+
+class HttpWeatherBackend:
+
+    def __init__(self, url=WEATHER_URL, api_key=API_KEY, timeout=REQUEST_TIMEOUT, session=None, record_file=None):
+
+        self.url = url
+        self.api_key = api_key
+        self.timeout = timeout
+        self.session = session
+        self.record_file = record_file
+
+        self._record_lock = threading.Lock()
+
+
+    def fetch_temperature(self, city):
+
+        #requests is imported with the first request, not when the app starts
+        import requests
+
+        if self.session is None:
+            self.session = requests.Session()
+
+        params = dict(place_params(city), units='metric', appid=self.api_key)
+
+        try:
+            response = self.session.get(self.url, params=params, timeout=self.timeout)
+        except requests.RequestException as error:
+            print("Failed to retrieve weather data.", error)
+            return None
+
+        try:
+            data = response.json()
+        except ValueError:
+            data = None
+
+        if self.record_file:
+            self.record(city, response.status_code, data)
+
+        return parse_temperature(response.status_code, data)
+
+
+    def record(self, city, status, data):
+
+        with self._record_lock, open(self.record_file, "a", encoding="utf-8") as record_file:
+            record_file.write(json.dumps({"city": city, "status": status, "body": data}) + "\n")
+
+
+class ReplayWeatherBackend:
+    #serves the recorded responses of every city in order, starting over after the last one
+
+    def __init__(self, path):
+
+        self.path = path
+        self.responses = {}
+        self.positions = {}
+
+        self._lock = threading.Lock()
+
+        with open(path, encoding="utf-8") as replay_file:
+            for line in replay_file:
+                if line.strip():
+                    recorded = json.loads(line)
+                    self.responses.setdefault(recorded["city"].lower(), []).append((recorded["status"], recorded["body"]))
+
+
+    def response(self, city):
+        #(status, body) of the next recorded response, 404 for a city that was never recorded
+
+        key = city.lower()
+
+        with self._lock:
+            responses = self.responses.get(key)
+
+            if not responses:
+                return 404, {"cod": "404", "message": "city not found"}
+
+            position = self.positions.get(key, 0)
+            self.positions[key] = (position + 1) % len(responses)
+
+        return responses[position]
+
+
+    def fetch_temperature(self, city):
+
+        return parse_temperature(*self.response(city))
+
+
+def temperatures_for(temperature, cities, workers=FETCH_WORKERS):
+    #{city: temperature(city)} with one lookup per distinct city, run side by side so slow requests overlap
+
+    cities = list(dict.fromkeys(cities))
+
+    if len(cities) <= 1:
+        return {city: temperature(city) for city in cities}
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(cities))) as pool:
+        return dict(zip(cities, pool.map(temperature, cities)))
+
+
+def create_backend(backend=None):
+
+    backend = backend or pyflora_config.get("weather", "backend")
+
+    if backend == "replay":
+        return ReplayWeatherBackend(pyflora_config.get_path("weather", "replay_file"))
+
+    if backend != "openweather":
+        raise ValueError(f"Unknown weather backend: {backend}")
+
+    return HttpWeatherBackend(pyflora_config.get("weather", "url") or WEATHER_URL,
+                              pyflora_config.get("weather", "api_key") or API_KEY,
+                              record_file=pyflora_config.get_path("weather", "record_file"))
+
+
+class CircuitBreaker:
+    #after failure_threshold failures in a row no requests are sent for reset_timeout seconds, then one trial request decides
+
+    def __init__(self, failure_threshold=FAILURE_THRESHOLD, reset_timeout=RESET_TIMEOUT, clock=time.monotonic):
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+
+        self.failures = 0
+        self.opened_at = None
+        self.trial = False
+
+        self._lock = threading.Lock()
+
+
+    @property
+    def state(self):
+
+        if self.opened_at is None:
+            return "closed"
+
+        return "half-open" if self.clock() - self.opened_at >= self.reset_timeout else "open"
+
+
+    def allow_request(self):
+
+        with self._lock:
+            if self.opened_at is None:
+                return True
+
+            if self.trial or self.clock() - self.opened_at < self.reset_timeout:
+                return False
+
+            self.trial = True
+            return True
+
+
+    def record_success(self):
+
+        with self._lock:
+            if self.opened_at is not None:
+                print("Weather service is back.")
+
+            self.failures = 0
+            self.opened_at = None
+            self.trial = False
+
+
+    def record_failure(self):
+
+        with self._lock:
+            self.failures += 1
+
+            if self.trial or (self.opened_at is None and self.failures >= self.failure_threshold):
+                if self.opened_at is None:
+                    print(f"Weather service failed {self.failures} times in a row, pausing requests for {self.reset_timeout} s.")
+
+                self.opened_at = self.clock()
+
+            self.trial = False
+
+
+class WeatherProvider:
+    #ambient temperature for a city barely changes between pots, so one response is shared for CACHE_TTL seconds;
+    #after that the old temperature is still served at once while a background request refreshes it (stale-while-revalidate),
+    #and while the circuit breaker is open the last known temperature is served, however old, with its age
+
+    def __init__(self, backend=None, city=None, ttl=CACHE_TTL, breaker=None, clock=time.monotonic):
+
+        self.backend = backend or create_backend()
+        self.city = city or pyflora_config.get("weather", "city") or CITY
+        self.ttl = ttl
+        self.breaker = breaker or CircuitBreaker(clock=clock)
+        self.clock = clock
+
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.stale_hits = 0
+        self._warned_open = None #breaker.opened_at of the outage the stale warning was printed for
+
+        self._cache = {}
+        self._refreshing = set()
+        self._city_locks = {}
+        self._lock = threading.Lock()
+
+
+    def current_reading(self, city=None):
+
+        city = city or self.city
+
+        with self._lock:
+            cached = self._cache.get(city)
+
+            if cached:
+                age = self.clock() - cached[0]
+
+                if age < self.ttl:
+                    self.cache_hits += 1
+                    return WeatherReading(cached[1], age, False)
+
+                self.stale_hits += 1
+
+                if city not in self._refreshing and self.breaker.allow_request():
+                    self._refreshing.add(city)
+                    threading.Thread(target=self.refresh, args=(city,), daemon=True).start()
+
+                elif self.breaker.state != "closed" and self._warned_open != self.breaker.opened_at:
+                    #once per outage, like the breaker's own messages; stale_hits keeps counting every lookup
+                    self._warned_open = self.breaker.opened_at
+                    print(f"Weather service unavailable, using the temperature from {age / 60:.0f} min ago.")
+
+                return WeatherReading(cached[1], age, True)
+
+            #nothing to fall back on: the first request for a city is waited for, other cities are fetched meanwhile
+            city_lock = self._city_locks.setdefault(city, threading.Lock())
+
+        with city_lock:
+            with self._lock:
+                cached = self._cache.get(city)
+
+                if cached:
+                    #fetched by another thread while this one waited
+                    self.cache_hits += 1
+                    return WeatherReading(cached[1], self.clock() - cached[0], False)
+
+                if not self.breaker.allow_request():
+                    return WeatherReading(None, None, True)
+
+                self.cache_misses += 1
+
+            temperature_celsius = self.fetch_temperature(city)
+
+            with self._lock:
+                self.store(city, temperature_celsius)
+
+        if temperature_celsius is None:
+            return WeatherReading(None, None, True)
+
+        return WeatherReading(temperature_celsius, 0.0, False)
+
+
+    def current_temperature(self, city=None):
+
+        return self.current_reading(city).temperature
+
+
+    def current_temperatures(self, cities, workers=FETCH_WORKERS):
+
+        return temperatures_for(self.current_temperature, cities, workers)
+
+
+    def refresh(self, city):
+
+        try:
+            temperature_celsius = self.fetch_temperature(city)
+        except Exception as error:
+            print("Failed to retrieve weather data.", error)
+            temperature_celsius = None
+
+        with self._lock:
+            self.cache_misses += 1
+            self.store(city, temperature_celsius)
+            self._refreshing.discard(city)
+
+
+    def store(self, city, temperature_celsius):
+
+        if temperature_celsius is None:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+            self._cache[city] = (self.clock(), temperature_celsius)
+
+
+    def fetch_temperature(self, city):
+
+        return self.backend.fetch_temperature(city)
+
+
+    def clear_cache(self):
+
+        with self._lock:
+            self._cache.clear()
+
+
+    def cache_info(self):
+
+        return {'hits': self.cache_hits, 'stale_hits': self.stale_hits, 'misses': self.cache_misses, 'cached_cities': len(self._cache), 'breaker': self.breaker.state}
+
+
+_weather_provider = None
+_provider_lock = threading.Lock()
+
+
+def get_weather_provider():
+    #created with the first lookup, so importing this module never opens the replay file or reads the settings
+
+    global _weather_provider
+
+    with _provider_lock:
+        if _weather_provider is None:
+            _weather_provider = WeatherProvider()
+
+    return _weather_provider
+
+
+def current_temperature_ow(city=None):
+
+    return get_weather_provider().current_temperature(city)
+
+
+def current_temperatures_ow(cities):
+
+    return get_weather_provider().current_temperatures(cities)
+
 #current_temperature_ow()
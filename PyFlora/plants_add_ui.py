@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'plants_add.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+import os
+
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class Ui_Form_add(object):
+    def setupUi(self, Form_add):
+        Form_add.setObjectName("Form_add")
+        Form_add.resize(334, 726)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(Form_add.sizePolicy().hasHeightForWidth())
+        Form_add.setSizePolicy(sizePolicy)
+        Form_add.setStyleSheet("background-color: #b2c5c0;")
+        self.verticalLayout = QtWidgets.QVBoxLayout(Form_add)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.horizontalLayout_2.setContentsMargins(-1, -1, -1, 15)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.label_about_add = QtWidgets.QLabel(Form_add)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_about_add.sizePolicy().hasHeightForWidth())
+        self.label_about_add.setSizePolicy(sizePolicy)
+        self.label_about_add.setMinimumSize(QtCore.QSize(0, 50))
+        self.label_about_add.setStyleSheet("font: 13pt \"Candara\";\n"
+"font-weight:bold;\n"
+"padding: 7px;\n"
+"color: #4F7375")
+        self.label_about_add.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.label_about_add.setObjectName("label_about_add")
+        self.horizontalLayout_2.addWidget(self.label_about_add, 0, QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.plant_image_add = QtWidgets.QLabel(Form_add)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.plant_image_add.sizePolicy().hasHeightForWidth())
+        self.plant_image_add.setSizePolicy(sizePolicy)
+        self.plant_image_add.setMinimumSize(QtCore.QSize(150, 150))
+        font = QtGui.QFont()
+        font.setFamily("Candara")
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setItalic(False)
+        font.setWeight(50)
+        self.plant_image_add.setFont(font)
+        self.plant_image_add.setStyleSheet("background-position: center; \n"
+"background-repeat: no-repeat; \n"
+"background-clip: border-box; \n"
+"border-radius: 40px;\n"
+"\n"
+"color: #69716F;\n"
+"\n"
+"\n"
+"\n"
+" ")
+        self.plant_image_add.setScaledContents(False)
+        self.plant_image_add.setAlignment(QtCore.Qt.AlignCenter)
+        self.plant_image_add.setWordWrap(True)
+        self.plant_image_add.setObjectName("plant_image_add")
+        self.horizontalLayout.addWidget(self.plant_image_add, 0, QtCore.Qt.AlignLeft)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setSizeConstraint(QtWidgets.QLayout.SetFixedSize)
+        self.verticalLayout_2.setSpacing(0)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.upload_plant_image_add = QtWidgets.QPushButton(Form_add)
+        self.upload_plant_image_add.setMinimumSize(QtCore.QSize(45, 45))
+        self.upload_plant_image_add.setMaximumSize(QtCore.QSize(45, 45))
+        self.upload_plant_image_add.setStyleSheet("QPushButton#upload_plant_image_add{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"\n"
+"    \n"
+"}\n"
+"\n"
+"QPushButton#upload_plant_image_add:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QPushButton#upload_plant_image_add:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        self.upload_plant_image_add.setText("")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "upload.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.upload_plant_image_add.setIcon(icon)
+        self.upload_plant_image_add.setIconSize(QtCore.QSize(20, 20))
+        self.upload_plant_image_add.setObjectName("upload_plant_image_add")
+        self.verticalLayout_2.addWidget(self.upload_plant_image_add, 0, QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.plant_name_add = QtWidgets.QTextEdit(Form_add)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.plant_name_add.sizePolicy().hasHeightForWidth())
+        self.plant_name_add.setSizePolicy(sizePolicy)
+        self.plant_name_add.setMinimumSize(QtCore.QSize(0, 50))
+        self.plant_name_add.setMaximumSize(QtCore.QSize(150, 50))
+        self.plant_name_add.setStyleSheet("font: 13pt \"Candara\";\n"
+"font-weight: bold;\n"
+"")
+        self.plant_name_add.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.plant_name_add.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.plant_name_add.setObjectName("plant_name_add")
+        self.verticalLayout_2.addWidget(self.plant_name_add, 0, QtCore.Qt.AlignBottom)
+        self.botanical_name_add = QtWidgets.QTextEdit(Form_add)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.botanical_name_add.sizePolicy().hasHeightForWidth())
+        self.botanical_name_add.setSizePolicy(sizePolicy)
+        self.botanical_name_add.setMaximumSize(QtCore.QSize(150, 50))
+        self.botanical_name_add.setStyleSheet("border-radius: 1px;\n"
+"font: 10pt \"Candara\";\n"
+"")
+        self.botanical_name_add.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.botanical_name_add.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.botanical_name_add.setObjectName("botanical_name_add")
+        self.verticalLayout_2.addWidget(self.botanical_name_add, 0, QtCore.Qt.AlignBottom)
+        self.horizontalLayout.addLayout(self.verticalLayout_2)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.verticalLayout_2_add = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2_add.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.verticalLayout_2_add.setContentsMargins(-1, 10, -1, -1)
+        self.verticalLayout_2_add.setSpacing(0)
+        self.verticalLayout_2_add.setObjectName("verticalLayout_2_add")
+        self.line = QtWidgets.QFrame(Form_add)
+        self.line.setLineWidth(2)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line.setObjectName("line")
+        self.verticalLayout_2_add.addWidget(self.line)
+        self.label = QtWidgets.QLabel(Form_add)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy)
+        self.label.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.label.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 10px;\n"
+"font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"text-align: left;\n"
+"\n"
+"")
+        self.label.setTextFormat(QtCore.Qt.AutoText)
+        self.label.setObjectName("label")
+        self.verticalLayout_2_add.addWidget(self.label)
+        self.watering_info_add = QtWidgets.QLineEdit(Form_add)
+        self.watering_info_add.setMinimumSize(QtCore.QSize(0, 35))
+        self.watering_info_add.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 1px;\n"
+"font: 12pt \"Candara\";\n"
+"padding-left: 10px")
+        self.watering_info_add.setFrame(False)
+        self.watering_info_add.setObjectName("watering_info_add")
+        self.verticalLayout_2_add.addWidget(self.watering_info_add)
+        self.line_2 = QtWidgets.QFrame(Form_add)
+        self.line_2.setWindowModality(QtCore.Qt.NonModal)
+        self.line_2.setLineWidth(2)
+        self.line_2.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_2.setObjectName("line_2")
+        self.verticalLayout_2_add.addWidget(self.line_2)
+        self.label_2 = QtWidgets.QLabel(Form_add)
+        self.label_2.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.label_2.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 10px;\n"
+"font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"text-align: left;")
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout_2_add.addWidget(self.label_2)
+        self.sunlight_info_add = QtWidgets.QLineEdit(Form_add)
+        self.sunlight_info_add.setMinimumSize(QtCore.QSize(0, 35))
+        self.sunlight_info_add.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 1px;\n"
+"font: 12pt \"Candara\";\n"
+"padding-left: 10px")
+        self.sunlight_info_add.setFrame(False)
+        self.sunlight_info_add.setObjectName("sunlight_info_add")
+        self.verticalLayout_2_add.addWidget(self.sunlight_info_add)
+        self.line_3 = QtWidgets.QFrame(Form_add)
+        self.line_3.setLineWidth(2)
+        self.line_3.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_3.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_3.setObjectName("line_3")
+        self.verticalLayout_2_add.addWidget(self.line_3)
+        self.label_3 = QtWidgets.QLabel(Form_add)
+        self.label_3.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.label_3.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 10px;\n"
+"font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"text-align: left;")
+        self.label_3.setObjectName("label_3")
+        self.verticalLayout_2_add.addWidget(self.label_3)
+        self.substrate_info_add = QtWidgets.QLineEdit(Form_add)
+        self.substrate_info_add.setMinimumSize(QtCore.QSize(0, 35))
+        self.substrate_info_add.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 1px;\n"
+"font: 12pt \"Candara\";\n"
+"padding-left: 10px")
+        self.substrate_info_add.setText("")
+        self.substrate_info_add.setFrame(False)
+        self.substrate_info_add.setObjectName("substrate_info_add")
+        self.verticalLayout_2_add.addWidget(self.substrate_info_add)
+        self.line_4 = QtWidgets.QFrame(Form_add)
+        self.line_4.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_4.setLineWidth(1)
+        self.line_4.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_4.setObjectName("line_4")
+        self.verticalLayout_2_add.addWidget(self.line_4)
+        self.label_4 = QtWidgets.QLabel(Form_add)
+        self.label_4.setMinimumSize(QtCore.QSize(0, 0))
+        self.label_4.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.label_4.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 10px;\n"
+"font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"text-align: left;")
+        self.label_4.setObjectName("label_4")
+        self.verticalLayout_2_add.addWidget(self.label_4)
+        self.ph_info_add = QtWidgets.QLineEdit(Form_add)
+        self.ph_info_add.setMinimumSize(QtCore.QSize(0, 35))
+        self.ph_info_add.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 1px;\n"
+"font: 12pt \"Candara\";\n"
+"padding-left: 10px")
+        self.ph_info_add.setFrame(False)
+        self.ph_info_add.setObjectName("ph_info_add")
+        self.verticalLayout_2_add.addWidget(self.ph_info_add)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2_add.addItem(spacerItem)
+        self.info_add = QtWidgets.QLabel(Form_add)
+        self.info_add.setStyleSheet("font: 13pt \"Candara\";\n"
+"padding: 7px;\n"
+"color: #BD523F;\n"
+"qproperty-alignment: AlignCenter;")
+        self.info_add.setText("")
+        self.info_add.setWordWrap(True)
+        self.info_add.setObjectName("info_add")
+        self.verticalLayout_2_add.addWidget(self.info_add)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalLayout_3.setSpacing(6)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.discard_button_add = QtWidgets.QPushButton(Form_add)
+        self.discard_button_add.setMinimumSize(QtCore.QSize(45, 45))
+        self.discard_button_add.setMaximumSize(QtCore.QSize(45, 45))
+        self.discard_button_add.setStyleSheet("QPushButton#discard_button_add{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"\n"
+"\n"
+"    \n"
+"}\n"
+"\n"
+"QPushButton#discard_button_add:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QPushButton#discard_button_add:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        self.discard_button_add.setText("")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "close.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.discard_button_add.setIcon(icon1)
+        self.discard_button_add.setIconSize(QtCore.QSize(28, 25))
+        self.discard_button_add.setObjectName("discard_button_add")
+        self.horizontalLayout_3.addWidget(self.discard_button_add, 0, QtCore.Qt.AlignRight|QtCore.Qt.AlignTop)
+        self.save_button_add = QtWidgets.QPushButton(Form_add)
+        self.save_button_add.setMinimumSize(QtCore.QSize(45, 45))
+        self.save_button_add.setMaximumSize(QtCore.QSize(45, 45))
+        self.save_button_add.setStyleSheet("QPushButton#save_button_add{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    \n"
+"}\n"
+"\n"
+"QPushButton#save_button_add:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QPushButton#save_button_add:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        self.save_button_add.setText("")
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "check.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.save_button_add.setIcon(icon2)
+        self.save_button_add.setIconSize(QtCore.QSize(25, 25))
+        self.save_button_add.setObjectName("save_button_add")
+        self.horizontalLayout_3.addWidget(self.save_button_add, 0, QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.verticalLayout_2_add.addLayout(self.horizontalLayout_3)
+        self.verticalLayout.addLayout(self.verticalLayout_2_add)
+
+        self.retranslateUi(Form_add)
+        QtCore.QMetaObject.connectSlotsByName(Form_add)
+
+    def retranslateUi(self, Form_add):
+        _translate = QtCore.QCoreApplication.translate
+        Form_add.setWindowTitle(_translate("Form_add", "Form"))
+        self.label_about_add.setText(_translate("Form_add", "ADD NEW PLANT"))
+        self.plant_image_add.setText(_translate("Form_add", "Upload plant       image here"))
+        self.plant_name_add.setPlaceholderText(_translate("Form_add", "Type plant name here"))
+        self.botanical_name_add.setPlaceholderText(_translate("Form_add", "Type plant botanical name here"))
+        self.label.setText(_translate("Form_add", "WATERING:"))
+        self.watering_info_add.setPlaceholderText(_translate("Form_add", "Type watering requirements here"))
+        self.label_2.setText(_translate("Form_add", "SUNLIGHT:"))
+        self.sunlight_info_add.setPlaceholderText(_translate("Form_add", "Type sunlight requirements here"))
+        self.label_3.setText(_translate("Form_add", "SUBSTRATE:"))
+        self.substrate_info_add.setPlaceholderText(_translate("Form_add", "Type substrate requirements here"))
+        self.label_4.setText(_translate("Form_add", "SOIL pH RANGE:"))
+        self.ph_info_add.setPlaceholderText(_translate("Form_add", "Type optimum soil pH range here"))
+import resource_rc
+
+
+UI_CLASS = Ui_Form_add
+WIDGET_CLASS = "QWidget"
+SOURCE_HASH = "ac373d7ea6b07b2be1548b27cbcab764b2643f1c"
@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'plants_info.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+import os
+
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class Ui_Form(object):
+    def setupUi(self, Form):
+        Form.setObjectName("Form")
+        Form.resize(334, 726)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(Form.sizePolicy().hasHeightForWidth())
+        Form.setSizePolicy(sizePolicy)
+        Form.setStyleSheet("background-color: #b2c5c0;")
+        self.verticalLayout = QtWidgets.QVBoxLayout(Form)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.horizontalLayout_2.setContentsMargins(-1, -1, -1, 15)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.return_plants = QtWidgets.QToolButton(Form)
+        self.return_plants.setMinimumSize(QtCore.QSize(45, 45))
+        self.return_plants.setStyleSheet("QToolButton#return_plants{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    text-align: center;\n"
+"\n"
+"    \n"
+"}\n"
+"\n"
+"QToolButton#return_plants:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QToolButton#return_plants:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "back.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.return_plants.setIcon(icon)
+        self.return_plants.setIconSize(QtCore.QSize(30, 30))
+        self.return_plants.setObjectName("return_plants")
+        self.horizontalLayout_2.addWidget(self.return_plants)
+        self.label_about = QtWidgets.QLabel(Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_about.sizePolicy().hasHeightForWidth())
+        self.label_about.setSizePolicy(sizePolicy)
+        self.label_about.setMinimumSize(QtCore.QSize(0, 50))
+        self.label_about.setStyleSheet("font: 13pt \"Candara\";\n"
+"font-weight:bold;\n"
+"padding: 7px;\n"
+"color: #4F7375")
+        self.label_about.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.label_about.setObjectName("label_about")
+        self.horizontalLayout_2.addWidget(self.label_about, 0, QtCore.Qt.AlignTop)
+        self.manage_plant = QtWidgets.QToolButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.manage_plant.sizePolicy().hasHeightForWidth())
+        self.manage_plant.setSizePolicy(sizePolicy)
+        self.manage_plant.setMinimumSize(QtCore.QSize(45, 45))
+        self.manage_plant.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
+        self.manage_plant.setLayoutDirection(QtCore.Qt.RightToLeft)
+        self.manage_plant.setStyleSheet("QToolButton::menu-indicator { image: none; }\n"
+"\n"
+"QToolButton#manage_plant{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    text-align: center;\n"
+"\n"
+"    \n"
+"}\n"
+"\n"
+"QToolButton#manage_plant:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QToolButton#manage_plant:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        self.manage_plant.setText("")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "more.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.manage_plant.setIcon(icon1)
+        self.manage_plant.setIconSize(QtCore.QSize(30, 30))
+        self.manage_plant.setPopupMode(QtWidgets.QToolButton.InstantPopup)
+        self.manage_plant.setToolButtonStyle(QtCore.Qt.ToolButtonIconOnly)
+        self.manage_plant.setObjectName("manage_plant")
+        self.horizontalLayout_2.addWidget(self.manage_plant, 0, QtCore.Qt.AlignTop)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.plant_image = QtWidgets.QLabel(Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.plant_image.sizePolicy().hasHeightForWidth())
+        self.plant_image.setSizePolicy(sizePolicy)
+        self.plant_image.setMinimumSize(QtCore.QSize(170, 170))
+        font = QtGui.QFont()
+        font.setFamily("Candara")
+        self.plant_image.setFont(font)
+        self.plant_image.setStyleSheet("background-position: center; \n"
+"background-repeat: no-repeat; \n"
+"background-clip: border-box; \n"
+"border-radius: 40px\n"
+"\n"
+"\n"
+"\n"
+" ")
+        self.plant_image.setText("")
+        self.plant_image.setScaledContents(False)
+        self.plant_image.setObjectName("plant_image")
+        self.horizontalLayout.addWidget(self.plant_image, 0, QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.plant_name = QtWidgets.QTextEdit(Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.plant_name.sizePolicy().hasHeightForWidth())
+        self.plant_name.setSizePolicy(sizePolicy)
+        self.plant_name.setMinimumSize(QtCore.QSize(0, 1))
+        self.plant_name.setMaximumSize(QtCore.QSize(115, 80))
+        font = QtGui.QFont()
+        font.setFamily("Candara")
+        font.setBold(False)
+        font.setItalic(False)
+        font.setWeight(50)
+        self.plant_name.setFont(font)
+        self.plant_name.setStyleSheet("vertical-align: bottom;")
+        self.plant_name.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.plant_name.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.plant_name.setOverwriteMode(False)
+        self.plant_name.setObjectName("plant_name")
+        self.horizontalLayout.addWidget(self.plant_name, 0, QtCore.Qt.AlignRight|QtCore.Qt.AlignBottom)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.verticalLayout_2.setContentsMargins(-1, 10, -1, -1)
+        self.verticalLayout_2.setSpacing(0)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.line = QtWidgets.QFrame(Form)
+        self.line.setLineWidth(2)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line.setObjectName("line")
+        self.verticalLayout_2.addWidget(self.line)
+        self.label = QtWidgets.QLabel(Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy)
+        self.label.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.label.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 10px;\n"
+"font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"text-align: left;\n"
+"\n"
+"")
+        self.label.setTextFormat(QtCore.Qt.AutoText)
+        self.label.setObjectName("label")
+        self.verticalLayout_2.addWidget(self.label)
+        self.watering_info = QtWidgets.QLineEdit(Form)
+        self.watering_info.setMinimumSize(QtCore.QSize(0, 35))
+        self.watering_info.setStyleSheet("background-color: #CFDBD8;\n"
+"font: 12pt \"Candara\";\n"
+"padding-left: 10px")
+        self.watering_info.setFrame(False)
+        self.watering_info.setObjectName("watering_info")
+        self.verticalLayout_2.addWidget(self.watering_info)
+        self.line_2 = QtWidgets.QFrame(Form)
+        self.line_2.setWindowModality(QtCore.Qt.NonModal)
+        self.line_2.setLineWidth(2)
+        self.line_2.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_2.setObjectName("line_2")
+        self.verticalLayout_2.addWidget(self.line_2)
+        self.label_2 = QtWidgets.QLabel(Form)
+        self.label_2.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.label_2.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 10px;\n"
+"font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"text-align: left;")
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout_2.addWidget(self.label_2)
+        self.sunlight_info = QtWidgets.QLineEdit(Form)
+        self.sunlight_info.setMinimumSize(QtCore.QSize(0, 35))
+        self.sunlight_info.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 1px;\n"
+"font: 12pt \"Candara\";\n"
+"padding-left: 10px")
+        self.sunlight_info.setFrame(False)
+        self.sunlight_info.setObjectName("sunlight_info")
+        self.verticalLayout_2.addWidget(self.sunlight_info)
+        self.line_3 = QtWidgets.QFrame(Form)
+        self.line_3.setLineWidth(2)
+        self.line_3.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_3.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_3.setObjectName("line_3")
+        self.verticalLayout_2.addWidget(self.line_3)
+        self.label_3 = QtWidgets.QLabel(Form)
+        self.label_3.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.label_3.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 10px;\n"
+"font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"text-align: left;")
+        self.label_3.setObjectName("label_3")
+        self.verticalLayout_2.addWidget(self.label_3)
+        self.substrate_info = QtWidgets.QLineEdit(Form)
+        self.substrate_info.setMinimumSize(QtCore.QSize(0, 35))
+        self.substrate_info.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 1px;\n"
+"font: 12pt \"Candara\";\n"
+"padding-left: 10px")
+        self.substrate_info.setFrame(False)
+        self.substrate_info.setObjectName("substrate_info")
+        self.verticalLayout_2.addWidget(self.substrate_info)
+        self.line_4 = QtWidgets.QFrame(Form)
+        self.line_4.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_4.setLineWidth(1)
+        self.line_4.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_4.setObjectName("line_4")
+        self.verticalLayout_2.addWidget(self.line_4)
+        self.label_4 = QtWidgets.QLabel(Form)
+        self.label_4.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.label_4.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 10px;\n"
+"font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"text-align: left;")
+        self.label_4.setObjectName("label_4")
+        self.verticalLayout_2.addWidget(self.label_4)
+        self.ph_info = QtWidgets.QLineEdit(Form)
+        self.ph_info.setMinimumSize(QtCore.QSize(0, 35))
+        self.ph_info.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 1px;\n"
+"font: 12pt \"Candara\";\n"
+"padding-left: 10px")
+        self.ph_info.setFrame(False)
+        self.ph_info.setObjectName("ph_info")
+        self.verticalLayout_2.addWidget(self.ph_info)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem)
+        self.verticalLayout.addLayout(self.verticalLayout_2)
+
+        self.retranslateUi(Form)
+        QtCore.QMetaObject.connectSlotsByName(Form)
+
+    def retranslateUi(self, Form):
+        _translate = QtCore.QCoreApplication.translate
+        Form.setWindowTitle(_translate("Form", "Form"))
+        self.return_plants.setText(_translate("Form", "..."))
+        self.label_about.setText(_translate("Form", "ABOUT"))
+        self.plant_name.setHtml(_translate("Form", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
+"<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
+"p, li { white-space: pre-wrap; }\n"
+"</style></head><body style=\" font-family:\'Candara\'; font-size:8.25pt; font-weight:400; font-style:normal;\">\n"
+"<p style=\"-qt-paragraph-type:empty; margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:10px; font-family:\'MS Shell Dlg 2\';\"><br /></p></body></html>"))
+        self.label.setText(_translate("Form", "WATERING:"))
+        self.label_2.setText(_translate("Form", "SUNLIGHT:"))
+        self.label_3.setText(_translate("Form", "SUBSTRATE:"))
+        self.label_4.setText(_translate("Form", "SOIL pH RANGE:"))
+import resource_rc
+
+
+UI_CLASS = Ui_Form
+WIDGET_CLASS = "QWidget"
+SOURCE_HASH = "967710c84150741698a87ec3d5ebece179dfe541"
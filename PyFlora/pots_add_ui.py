@@ -0,0 +1,448 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'pots_add.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+import os
+
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class Ui_Form_add(object):
+    def setupUi(self, Form_add):
+        Form_add.setObjectName("Form_add")
+        Form_add.resize(334, 726)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(Form_add.sizePolicy().hasHeightForWidth())
+        Form_add.setSizePolicy(sizePolicy)
+        Form_add.setStyleSheet("background-color: #b2c5c0;")
+        self.verticalLayout = QtWidgets.QVBoxLayout(Form_add)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.horizontalLayout_2.setContentsMargins(-1, -1, -1, 15)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.about_add_pot = QtWidgets.QLabel(Form_add)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.about_add_pot.sizePolicy().hasHeightForWidth())
+        self.about_add_pot.setSizePolicy(sizePolicy)
+        self.about_add_pot.setMinimumSize(QtCore.QSize(0, 50))
+        self.about_add_pot.setStyleSheet("font: 13pt \"Candara\";\n"
+"font-weight:bold;\n"
+"padding: 7px;\n"
+"color: #4F7375")
+        self.about_add_pot.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.about_add_pot.setObjectName("about_add_pot")
+        self.horizontalLayout_2.addWidget(self.about_add_pot, 0, QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.pots_info_btn = QtWidgets.QPushButton(Form_add)
+        self.pots_info_btn.setMinimumSize(QtCore.QSize(45, 45))
+        self.pots_info_btn.setStyleSheet("QPushButton#pots_info_btn{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    \n"
+"}\n"
+"\n"
+"QPushButton#pots_info_btn:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QPushButton#pots_info_btn:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        self.pots_info_btn.setText("")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "info.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pots_info_btn.setIcon(icon)
+        self.pots_info_btn.setIconSize(QtCore.QSize(30, 30))
+        self.pots_info_btn.setObjectName("pots_info_btn")
+        self.horizontalLayout_2.addWidget(self.pots_info_btn, 0, QtCore.Qt.AlignRight)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.pot_image_add = QtWidgets.QLabel(Form_add)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.pot_image_add.sizePolicy().hasHeightForWidth())
+        self.pot_image_add.setSizePolicy(sizePolicy)
+        self.pot_image_add.setMinimumSize(QtCore.QSize(150, 150))
+        self.pot_image_add.setMaximumSize(QtCore.QSize(150, 150))
+        font = QtGui.QFont()
+        font.setFamily("Candara")
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setItalic(False)
+        font.setWeight(50)
+        self.pot_image_add.setFont(font)
+        self.pot_image_add.setStyleSheet("background-position: center; \n"
+"background-repeat: no-repeat; \n"
+"background-clip: border-box; \n"
+"border-radius: 40px;\n"
+"\n"
+"color: #69716F;\n"
+"\n"
+"\n"
+"\n"
+" ")
+        self.pot_image_add.setText("")
+        self.pot_image_add.setPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "pots.png")))
+        self.pot_image_add.setScaledContents(True)
+        self.pot_image_add.setAlignment(QtCore.Qt.AlignCenter)
+        self.pot_image_add.setWordWrap(True)
+        self.pot_image_add.setObjectName("pot_image_add")
+        self.horizontalLayout.addWidget(self.pot_image_add, 0, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.verticalLayout_2_add = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2_add.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.verticalLayout_2_add.setContentsMargins(-1, 10, -1, -1)
+        self.verticalLayout_2_add.setSpacing(0)
+        self.verticalLayout_2_add.setObjectName("verticalLayout_2_add")
+        self.line = QtWidgets.QFrame(Form_add)
+        self.line.setStyleSheet("")
+        self.line.setLineWidth(2)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line.setObjectName("line")
+        self.verticalLayout_2_add.addWidget(self.line)
+        self.label = QtWidgets.QLabel(Form_add)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy)
+        self.label.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.label.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 15px;\n"
+"font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"text-align: left;\n"
+"\n"
+"")
+        self.label.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.label.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.label.setTextFormat(QtCore.Qt.AutoText)
+        self.label.setObjectName("label")
+        self.verticalLayout_2_add.addWidget(self.label)
+        self.plant_options = QtWidgets.QComboBox(Form_add)
+        self.plant_options.setMinimumSize(QtCore.QSize(0, 30))
+        font = QtGui.QFont()
+        font.setFamily("Candara")
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setItalic(False)
+        font.setWeight(50)
+        self.plant_options.setFont(font)
+        self.plant_options.setStyleSheet("QComboBox::drop-down {\n"
+"      subcontrol-origin: padding;\n"
+"    subcontrol-position: top right;\n"
+"    width: 20px;\n"
+"\n"
+"    border-left-width: 1px;\n"
+"    border-left-color: gray;\n"
+"    border-left-style: solid;\n"
+"    border-top-left-radius: 10px;\n"
+"    border-bottom-left-radius: 10px;\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow {\n"
+"    image: url(:/newPrefix/down.png);\n"
+"    width: 20px;\n"
+"    height: 20px;\n"
+"\n"
+"}\n"
+"\n"
+"QComboBox {\n"
+"background-color: #CFDBD8;\n"
+"border-radius: 1px;\n"
+"font: 12pt \"Candara\";\n"
+"padding-left: 10px;\n"
+"\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView {\n"
+"    border: 1px solid darkgray;\n"
+"    background-color: #CFDBD8;\n"
+"    selection-background-color: #b2c5c0;\n"
+"    padding-left: 10px;\n"
+"    selection-color: black;\n"
+"    font: 12pt \"Candara\";\n"
+"}")
+        self.plant_options.setEditable(False)
+        self.plant_options.setCurrentText("")
+        self.plant_options.setIconSize(QtCore.QSize(16, 16))
+        self.plant_options.setPlaceholderText("")
+        self.plant_options.setFrame(False)
+        self.plant_options.setObjectName("plant_options")
+        self.verticalLayout_2_add.addWidget(self.plant_options)
+        self.line_2 = QtWidgets.QFrame(Form_add)
+        self.line_2.setWindowModality(QtCore.Qt.NonModal)
+        self.line_2.setLineWidth(2)
+        self.line_2.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_2.setObjectName("line_2")
+        self.verticalLayout_2_add.addWidget(self.line_2)
+        self.label_2 = QtWidgets.QLabel(Form_add)
+        self.label_2.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.label_2.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 10px;\n"
+"font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"text-align: left;")
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout_2_add.addWidget(self.label_2)
+        self.location_options = QtWidgets.QComboBox(Form_add)
+        self.location_options.setMinimumSize(QtCore.QSize(0, 30))
+        self.location_options.setStyleSheet("QComboBox::drop-down {\n"
+"      subcontrol-origin: padding;\n"
+"    subcontrol-position: top right;\n"
+"    width: 20px;\n"
+"\n"
+"    border-left-width: 1px;\n"
+"    border-left-color: gray;\n"
+"    border-left-style: solid;\n"
+"    border-top-left-radius: 10px;\n"
+"    border-bottom-left-radius: 10px;\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow {\n"
+"    image: url(:/newPrefix/down.png);\n"
+"    width: 20px;\n"
+"    height: 20px;\n"
+"\n"
+"}\n"
+"\n"
+"QComboBox {\n"
+"background-color: #CFDBD8;\n"
+"border-radius: 1px;\n"
+"font: 12pt \"Candara\";\n"
+"padding-left: 10px;\n"
+"\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView {\n"
+"    border: 1px solid darkgray;\n"
+"    background-color: #CFDBD8;\n"
+"    selection-background-color: #b2c5c0;\n"
+"    padding-left: 10px;\n"
+"    selection-color: black;\n"
+"    font: 12pt \"Candara\";\n"
+"}")
+        self.location_options.setObjectName("location_options")
+        self.verticalLayout_2_add.addWidget(self.location_options)
+        self.line_3 = QtWidgets.QFrame(Form_add)
+        self.line_3.setLineWidth(2)
+        self.line_3.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_3.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_3.setObjectName("line_3")
+        self.verticalLayout_2_add.addWidget(self.line_3)
+        self.label_3 = QtWidgets.QLabel(Form_add)
+        self.label_3.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.label_3.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 10px;\n"
+"font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"text-align: left;")
+        self.label_3.setObjectName("label_3")
+        self.verticalLayout_2_add.addWidget(self.label_3)
+        self.light_options = QtWidgets.QComboBox(Form_add)
+        self.light_options.setMinimumSize(QtCore.QSize(0, 30))
+        self.light_options.setStyleSheet("QComboBox::drop-down {\n"
+"      subcontrol-origin: padding;\n"
+"    subcontrol-position: top right;\n"
+"    width: 20px;\n"
+"\n"
+"    border-left-width: 1px;\n"
+"    border-left-color: gray;\n"
+"    border-left-style: solid;\n"
+"    border-top-left-radius: 10px;\n"
+"    border-bottom-left-radius: 10px;\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow {\n"
+"    image: url(:/newPrefix/down.png);\n"
+"    width: 20px;\n"
+"    height: 20px;\n"
+"\n"
+"}\n"
+"\n"
+"QComboBox {\n"
+"background-color: #CFDBD8;\n"
+"border-radius: 1px;\n"
+"font: 12pt \"Candara\";\n"
+"padding-left: 10px;\n"
+"\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView {\n"
+"    border: 1px solid darkgray;\n"
+"    background-color: #CFDBD8;\n"
+"    selection-background-color: #b2c5c0;\n"
+"    padding-left: 10px;\n"
+"    selection-color: black;\n"
+"    font: 12pt \"Candara\";\n"
+"}")
+        self.light_options.setObjectName("light_options")
+        self.verticalLayout_2_add.addWidget(self.light_options)
+        self.line_4 = QtWidgets.QFrame(Form_add)
+        self.line_4.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_4.setLineWidth(1)
+        self.line_4.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_4.setObjectName("line_4")
+        self.verticalLayout_2_add.addWidget(self.line_4)
+        self.label_4 = QtWidgets.QLabel(Form_add)
+        self.label_4.setMinimumSize(QtCore.QSize(0, 0))
+        self.label_4.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.label_4.setStyleSheet("background-color: #CFDBD8;\n"
+"border-radius: 10px;\n"
+"font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"text-align: left;")
+        self.label_4.setObjectName("label_4")
+        self.verticalLayout_2_add.addWidget(self.label_4)
+        self.moisture_options = QtWidgets.QComboBox(Form_add)
+        self.moisture_options.setMinimumSize(QtCore.QSize(0, 30))
+        self.moisture_options.setStyleSheet("QComboBox::drop-down {\n"
+"      subcontrol-origin: padding;\n"
+"    subcontrol-position: top right;\n"
+"    width: 20px;\n"
+"\n"
+"    border-left-width: 1px;\n"
+"    border-left-color: gray;\n"
+"    border-left-style: solid;\n"
+"    border-top-left-radius: 10px;\n"
+"    border-bottom-left-radius: 10px;\n"
+"}\n"
+"\n"
+"QComboBox::down-arrow {\n"
+"    image: url(:/newPrefix/down.png);\n"
+"    width: 20px;\n"
+"    height: 20px;\n"
+"\n"
+"}\n"
+"\n"
+"QComboBox {\n"
+"background-color: #CFDBD8;\n"
+"border-radius: 1px;\n"
+"font: 12pt \"Candara\";\n"
+"padding-left: 10px;\n"
+"\n"
+"}\n"
+"\n"
+"QComboBox QAbstractItemView {\n"
+"    border: 1px solid darkgray;\n"
+"    background-color: #CFDBD8;\n"
+"    selection-background-color: #b2c5c0;\n"
+"    padding-left: 10px;\n"
+"    selection-color: black;\n"
+"    font: 12pt \"Candara\";\n"
+"}")
+        self.moisture_options.setObjectName("moisture_options")
+        self.verticalLayout_2_add.addWidget(self.moisture_options)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2_add.addItem(spacerItem)
+        self.info_add_pot = QtWidgets.QLabel(Form_add)
+        self.info_add_pot.setStyleSheet("font: 13pt \"Candara\";\n"
+"padding: 7px;\n"
+"color: #DE7067;\n"
+"qproperty-alignment: AlignCenter;")
+        self.info_add_pot.setText("")
+        self.info_add_pot.setWordWrap(True)
+        self.info_add_pot.setObjectName("info_add_pot")
+        self.verticalLayout_2_add.addWidget(self.info_add_pot)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalLayout_3.setSpacing(6)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.discard_add_pot = QtWidgets.QPushButton(Form_add)
+        self.discard_add_pot.setMinimumSize(QtCore.QSize(45, 45))
+        self.discard_add_pot.setMaximumSize(QtCore.QSize(45, 45))
+        self.discard_add_pot.setStyleSheet("QPushButton#discard_add_pot{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"\n"
+"\n"
+"    \n"
+"}\n"
+"\n"
+"QPushButton#discard_add_pot:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QPushButton#discard_add_pot:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        self.discard_add_pot.setText("")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "close.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.discard_add_pot.setIcon(icon1)
+        self.discard_add_pot.setIconSize(QtCore.QSize(28, 25))
+        self.discard_add_pot.setObjectName("discard_add_pot")
+        self.horizontalLayout_3.addWidget(self.discard_add_pot, 0, QtCore.Qt.AlignRight|QtCore.Qt.AlignTop)
+        self.save_add_pot = QtWidgets.QPushButton(Form_add)
+        self.save_add_pot.setMinimumSize(QtCore.QSize(45, 45))
+        self.save_add_pot.setMaximumSize(QtCore.QSize(45, 45))
+        self.save_add_pot.setStyleSheet("QPushButton#save_add_pot{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    \n"
+"}\n"
+"\n"
+"QPushButton#save_add_pot:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QPushButton#save_add_pot:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        self.save_add_pot.setText("")
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "check.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.save_add_pot.setIcon(icon2)
+        self.save_add_pot.setIconSize(QtCore.QSize(25, 25))
+        self.save_add_pot.setObjectName("save_add_pot")
+        self.horizontalLayout_3.addWidget(self.save_add_pot, 0, QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.verticalLayout_2_add.addLayout(self.horizontalLayout_3)
+        self.verticalLayout.addLayout(self.verticalLayout_2_add)
+
+        self.retranslateUi(Form_add)
+        QtCore.QMetaObject.connectSlotsByName(Form_add)
+
+    def retranslateUi(self, Form_add):
+        _translate = QtCore.QCoreApplication.translate
+        Form_add.setWindowTitle(_translate("Form_add", "Form"))
+        self.about_add_pot.setText(_translate("Form_add", "ADD NEW POT"))
+        self.label.setText(_translate("Form_add", "PLANT:"))
+        self.label_2.setText(_translate("Form_add", "POT LOCATION:"))
+        self.label_3.setText(_translate("Form_add", "LIGHT INTENSITY:"))
+        self.label_4.setText(_translate("Form_add", "SOIL MOISTURE:"))
+import resource_rc
+
+
+UI_CLASS = Ui_Form_add
+WIDGET_CLASS = "QWidget"
+SOURCE_HASH = "8fbbe2591da6b634d61a19cea78d2322dff43bfd"
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'pots_info.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+import os
+
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class Ui_Form(object):
+    def setupUi(self, Form):
+        Form.setObjectName("Form")
+        Form.resize(334, 726)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(Form.sizePolicy().hasHeightForWidth())
+        Form.setSizePolicy(sizePolicy)
+        Form.setStyleSheet("background-color: #b2c5c0;")
+        self.verticalLayout = QtWidgets.QVBoxLayout(Form)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.horizontalLayout_2.setContentsMargins(-1, -1, -1, 15)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.return_pots = QtWidgets.QToolButton(Form)
+        self.return_pots.setMinimumSize(QtCore.QSize(45, 45))
+        self.return_pots.setStyleSheet("QToolButton#return_pots{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    text-align: center;\n"
+"\n"
+"    \n"
+"}\n"
+"\n"
+"QToolButton#return_pots:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QToolButton#return_pots:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "back.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.return_pots.setIcon(icon)
+        self.return_pots.setIconSize(QtCore.QSize(30, 30))
+        self.return_pots.setObjectName("return_pots")
+        self.horizontalLayout_2.addWidget(self.return_pots)
+        self.label_about_pot = QtWidgets.QLabel(Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_about_pot.sizePolicy().hasHeightForWidth())
+        self.label_about_pot.setSizePolicy(sizePolicy)
+        self.label_about_pot.setMinimumSize(QtCore.QSize(0, 50))
+        self.label_about_pot.setStyleSheet("font: 13pt \"Candara\";\n"
+"font-weight:bold;\n"
+"padding: 7px;\n"
+"color: #4F7375")
+        self.label_about_pot.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.label_about_pot.setObjectName("label_about_pot")
+        self.horizontalLayout_2.addWidget(self.label_about_pot, 0, QtCore.Qt.AlignTop)
+        self.manage_pot = QtWidgets.QToolButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.manage_pot.sizePolicy().hasHeightForWidth())
+        self.manage_pot.setSizePolicy(sizePolicy)
+        self.manage_pot.setMinimumSize(QtCore.QSize(45, 45))
+        self.manage_pot.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
+        self.manage_pot.setLayoutDirection(QtCore.Qt.RightToLeft)
+        self.manage_pot.setStyleSheet("QToolButton::menu-indicator { image: none; }\n"
+"\n"
+"QToolButton#manage_pot{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    text-align: center;\n"
+"\n"
+"    \n"
+"}\n"
+"\n"
+"QToolButton#manage_pot:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QToolButton#manage_pot:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        self.manage_pot.setText("")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "more.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.manage_pot.setIcon(icon1)
+        self.manage_pot.setIconSize(QtCore.QSize(30, 30))
+        self.manage_pot.setPopupMode(QtWidgets.QToolButton.InstantPopup)
+        self.manage_pot.setToolButtonStyle(QtCore.Qt.ToolButtonIconOnly)
+        self.manage_pot.setObjectName("manage_pot")
+        self.horizontalLayout_2.addWidget(self.manage_pot, 0, QtCore.Qt.AlignTop)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setSizeConstraint(QtWidgets.QLayout.SetFixedSize)
+        self.horizontalLayout.setContentsMargins(-1, 0, 0, 0)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_4.setSizeConstraint(QtWidgets.QLayout.SetMaximumSize)
+        self.verticalLayout_4.setContentsMargins(-1, 30, -1, 20)
+        self.verticalLayout_4.setSpacing(0)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.pot_name = QtWidgets.QLabel(Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.pot_name.sizePolicy().hasHeightForWidth())
+        self.pot_name.setSizePolicy(sizePolicy)
+        self.pot_name.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.pot_name.setStyleSheet("font: 13pt \"Candara\";\n"
+"font-weight:bold;\n"
+"padding-left: 7px;\n"
+"")
+        self.pot_name.setText("")
+        self.pot_name.setObjectName("pot_name")
+        self.verticalLayout_4.addWidget(self.pot_name)
+        self.pot_plant = QtWidgets.QLabel(Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.pot_plant.sizePolicy().hasHeightForWidth())
+        self.pot_plant.setSizePolicy(sizePolicy)
+        self.pot_plant.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.pot_plant.setStyleSheet("font: 12pt \"Candara\";\n"
+"padding-left: 7px;\n"
+"")
+        self.pot_plant.setText("")
+        self.pot_plant.setObjectName("pot_plant")
+        self.verticalLayout_4.addWidget(self.pot_plant)
+        self.horizontalLayout.addLayout(self.verticalLayout_4)
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_3.setSizeConstraint(QtWidgets.QLayout.SetMinimumSize)
+        self.verticalLayout_3.setSpacing(6)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.sync_pot = QtWidgets.QPushButton(Form)
+        self.sync_pot.setMinimumSize(QtCore.QSize(45, 45))
+        self.sync_pot.setMaximumSize(QtCore.QSize(45, 45))
+        self.sync_pot.setStyleSheet("QPushButton#sync_pot{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    text-align: center;\n"
+"\n"
+"}\n"
+"\n"
+"QPushButton#sync_pot:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QPushButton#sync_pot:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        self.sync_pot.setText("")
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "sync.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.sync_pot.setIcon(icon2)
+        self.sync_pot.setIconSize(QtCore.QSize(25, 25))
+        self.sync_pot.setObjectName("sync_pot")
+        self.verticalLayout_3.addWidget(self.sync_pot, 0, QtCore.Qt.AlignRight)
+        self.water_pot = QtWidgets.QPushButton(Form)
+        self.water_pot.setMinimumSize(QtCore.QSize(45, 45))
+        self.water_pot.setMaximumSize(QtCore.QSize(45, 45))
+        self.water_pot.setStyleSheet("QPushButton#water_pot{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    text-align: center;\n"
+"\n"
+"    \n"
+"}\n"
+"\n"
+"QPushButton#water_pot:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QPushButton#water_pot:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        self.water_pot.setText("")
+        icon3 = QtGui.QIcon()
+        icon3.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "watering-can.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.water_pot.setIcon(icon3)
+        self.water_pot.setIconSize(QtCore.QSize(35, 35))
+        self.water_pot.setObjectName("water_pot")
+        self.verticalLayout_3.addWidget(self.water_pot, 0, QtCore.Qt.AlignRight)
+        self.horizontalLayout.addLayout(self.verticalLayout_3)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.verticalLayout_2.setContentsMargins(-1, 0, -1, -1)
+        self.verticalLayout_2.setSpacing(0)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.formLayout = QtWidgets.QFormLayout()
+        self.formLayout.setContentsMargins(-1, 10, -1, 10)
+        self.formLayout.setSpacing(0)
+        self.formLayout.setObjectName("formLayout")
+        self.label = QtWidgets.QLabel(Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy)
+        self.label.setMinimumSize(QtCore.QSize(131, 30))
+        self.label.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.label.setSizeIncrement(QtCore.QSize(0, 0))
+        self.label.setStyleSheet("font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"text-align: left;\n"
+"background-color: #CFDBD8;\n"
+"\n"
+"")
+        self.label.setTextFormat(QtCore.Qt.AutoText)
+        self.label.setObjectName("label")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label)
+        self.label_4 = QtWidgets.QLabel(Form)
+        self.label_4.setMinimumSize(QtCore.QSize(131, 30))
+        self.label_4.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.label_4.setStyleSheet("font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"text-align: left;\n"
+"background-color: #CFDBD8;")
+        self.label_4.setObjectName("label_4")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label_4)
+        self.last_watered = QtWidgets.QLabel(Form)
+        self.last_watered.setStyleSheet("font: 12pt \"Candara\";\n"
+"background-color: #CFDBD8;")
+        self.last_watered.setText("")
+        self.last_watered.setAlignment(QtCore.Qt.AlignCenter)
+        self.last_watered.setObjectName("last_watered")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.last_watered)
+        self.pot_watering = QtWidgets.QLabel(Form)
+        self.pot_watering.setMinimumSize(QtCore.QSize(0, 0))
+        self.pot_watering.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.pot_watering.setStyleSheet("font: 12pt \"Candara\";\n"
+"background-color: #CFDBD8;")
+        self.pot_watering.setText("")
+        self.pot_watering.setAlignment(QtCore.Qt.AlignCenter)
+        self.pot_watering.setObjectName("pot_watering")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.pot_watering)
+        self.label_2 = QtWidgets.QLabel(Form)
+        self.label_2.setMinimumSize(QtCore.QSize(0, 30))
+        self.label_2.setStyleSheet("font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"text-align: left;\n"
+"background-color: #CFDBD8;")
+        self.label_2.setObjectName("label_2")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.label_2)
+        self.moisture_range = QtWidgets.QLabel(Form)
+        self.moisture_range.setStyleSheet("font: 12pt \"Candara\";\n"
+"background-color: #CFDBD8;\n"
+"")
+        self.moisture_range.setText("")
+        self.moisture_range.setAlignment(QtCore.Qt.AlignCenter)
+        self.moisture_range.setObjectName("moisture_range")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.moisture_range)
+        self.verticalLayout_2.addLayout(self.formLayout)
+        self.sensor_graphs = QtWidgets.QWidget(Form)
+        self.sensor_graphs.setMinimumSize(QtCore.QSize(0, 240))
+        self.sensor_graphs.setMaximumSize(QtCore.QSize(320, 240))
+        self.sensor_graphs.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
+        self.sensor_graphs.setStyleSheet("")
+        self.sensor_graphs.setObjectName("sensor_graphs")
+        self.verticalLayout_2.addWidget(self.sensor_graphs)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem)
+        self.pot_label_info = QtWidgets.QLabel(Form)
+        self.pot_label_info.setStyleSheet("font: 13pt \"Candara\";\n"
+"padding: 7px;\n"
+"color: #BD523F;\n"
+"qproperty-alignment: AlignCenter;")
+        self.pot_label_info.setText("")
+        self.pot_label_info.setObjectName("pot_label_info")
+        self.verticalLayout_2.addWidget(self.pot_label_info, 0, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.verticalLayout.addLayout(self.verticalLayout_2)
+
+        self.retranslateUi(Form)
+        QtCore.QMetaObject.connectSlotsByName(Form)
+
+    def retranslateUi(self, Form):
+        _translate = QtCore.QCoreApplication.translate
+        Form.setWindowTitle(_translate("Form", "Form"))
+        self.return_pots.setText(_translate("Form", "..."))
+        self.label_about_pot.setText(_translate("Form", "ABOUT"))
+        self.label.setText(_translate("Form", "WATERING:"))
+        self.label_4.setText(_translate("Form", "LAST WATERED:"))
+        self.label_2.setText(_translate("Form", "MOISTURE RANGE:"))
+import resource_rc
+
+
+UI_CLASS = Ui_Form
+WIDGET_CLASS = "QWidget"
+SOURCE_HASH = "cfc5933922cdafbb03fbf875ec6aa818dbe72a74"
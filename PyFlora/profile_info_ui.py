@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'profile_info.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+import os
+
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class Ui_Form(object):
+    def setupUi(self, Form):
+        Form.setObjectName("Form")
+        Form.resize(334, 726)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(Form.sizePolicy().hasHeightForWidth())
+        Form.setSizePolicy(sizePolicy)
+        Form.setStyleSheet("background-color: #b2c5c0;")
+        self.verticalLayout = QtWidgets.QVBoxLayout(Form)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.horizontalLayout_2.setContentsMargins(-1, -1, -1, 15)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.return_profile = QtWidgets.QToolButton(Form)
+        self.return_profile.setMinimumSize(QtCore.QSize(45, 45))
+        self.return_profile.setStyleSheet("QToolButton#return_profile{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    text-align: center;\n"
+"\n"
+"    \n"
+"}\n"
+"\n"
+"QToolButton#return_profile:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QToolButton#return_profile:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "back.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.return_profile.setIcon(icon)
+        self.return_profile.setIconSize(QtCore.QSize(30, 30))
+        self.return_profile.setObjectName("return_profile")
+        self.horizontalLayout_2.addWidget(self.return_profile)
+        self.label_about_pot = QtWidgets.QLabel(Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_about_pot.sizePolicy().hasHeightForWidth())
+        self.label_about_pot.setSizePolicy(sizePolicy)
+        self.label_about_pot.setMinimumSize(QtCore.QSize(0, 50))
+        self.label_about_pot.setStyleSheet("font: 13pt \"Candara\";\n"
+"font-weight:bold;\n"
+"padding: 7px;\n"
+"color: #4F7375")
+        self.label_about_pot.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.label_about_pot.setObjectName("label_about_pot")
+        self.horizontalLayout_2.addWidget(self.label_about_pot, 0, QtCore.Qt.AlignTop)
+        self.manage_profile = QtWidgets.QToolButton(Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.manage_profile.sizePolicy().hasHeightForWidth())
+        self.manage_profile.setSizePolicy(sizePolicy)
+        self.manage_profile.setMinimumSize(QtCore.QSize(45, 45))
+        self.manage_profile.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
+        self.manage_profile.setLayoutDirection(QtCore.Qt.RightToLeft)
+        self.manage_profile.setStyleSheet("QToolButton::menu-indicator { image: none; }\n"
+"\n"
+"QToolButton#manage_profile{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    text-align: center;\n"
+"\n"
+"    \n"
+"}\n"
+"\n"
+"QToolButton#manage_profile:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QToolButton#manage_profile:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        self.manage_profile.setText("")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "more.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.manage_profile.setIcon(icon1)
+        self.manage_profile.setIconSize(QtCore.QSize(30, 30))
+        self.manage_profile.setPopupMode(QtWidgets.QToolButton.InstantPopup)
+        self.manage_profile.setToolButtonStyle(QtCore.Qt.ToolButtonIconOnly)
+        self.manage_profile.setObjectName("manage_profile")
+        self.horizontalLayout_2.addWidget(self.manage_profile, 0, QtCore.Qt.AlignTop)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setSizeConstraint(QtWidgets.QLayout.SetFixedSize)
+        self.horizontalLayout.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.profile_photo = QtWidgets.QLabel(Form)
+        self.profile_photo.setMinimumSize(QtCore.QSize(150, 150))
+        self.profile_photo.setStyleSheet("border-radius: 40px;\n"
+"border: 1px solid #DE7067;\n"
+"\n"
+"background-position: center; \n"
+"background-repeat: no-repeat; \n"
+"background-clip: border-box; \n"
+"border-radius: 40px;\n"
+"\n"
+"color: #69716F;\n"
+"")
+        self.profile_photo.setText("")
+        self.profile_photo.setObjectName("profile_photo")
+        self.horizontalLayout.addWidget(self.profile_photo, 0, QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.experience_garden = QtWidgets.QLabel(Form)
+        self.experience_garden.setMinimumSize(QtCore.QSize(150, 80))
+        self.experience_garden.setStyleSheet("font: 11pt \"Candara\";\n"
+"padding-left: 7px;\n"
+"color: #BD523F")
+        self.experience_garden.setText("")
+        self.experience_garden.setAlignment(QtCore.Qt.AlignCenter)
+        self.experience_garden.setWordWrap(True)
+        self.experience_garden.setObjectName("experience_garden")
+        self.horizontalLayout.addWidget(self.experience_garden, 0, QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.verticalLayout_profile = QtWidgets.QVBoxLayout()
+        self.verticalLayout_profile.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.verticalLayout_profile.setContentsMargins(-1, 0, -1, -1)
+        self.verticalLayout_profile.setSpacing(0)
+        self.verticalLayout_profile.setObjectName("verticalLayout_profile")
+        self.formLayout = QtWidgets.QFormLayout()
+        self.formLayout.setContentsMargins(-1, 10, -1, 10)
+        self.formLayout.setSpacing(0)
+        self.formLayout.setObjectName("formLayout")
+        self.label = QtWidgets.QLabel(Form)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy)
+        self.label.setMinimumSize(QtCore.QSize(85, 30))
+        self.label.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.label.setSizeIncrement(QtCore.QSize(0, 0))
+        self.label.setStyleSheet("font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"\n"
+"text-align: left;\n"
+"background-color: #CFDBD8;\n"
+"\n"
+"")
+        self.label.setTextFormat(QtCore.Qt.AutoText)
+        self.label.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label.setObjectName("label")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label)
+        self.label_4 = QtWidgets.QLabel(Form)
+        self.label_4.setMinimumSize(QtCore.QSize(85, 30))
+        self.label_4.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.label_4.setStyleSheet("font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"text-align: left;\n"
+"background-color: #CFDBD8;")
+        self.label_4.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_4.setObjectName("label_4")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label_4)
+        self.number_plants = QtWidgets.QLabel(Form)
+        self.number_plants.setStyleSheet("font: bold 14pt \"Candara\";\n"
+"background-color: #CFDBD8;")
+        self.number_plants.setText("")
+        self.number_plants.setAlignment(QtCore.Qt.AlignCenter)
+        self.number_plants.setObjectName("number_plants")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.number_plants)
+        self.label_2 = QtWidgets.QLabel(Form)
+        self.label_2.setMinimumSize(QtCore.QSize(85, 30))
+        self.label_2.setStyleSheet("font: 11pt \"Candara\";\n"
+"font-weight: bold;\n"
+"padding-left: 1px;\n"
+"text-align: left;\n"
+"background-color: #CFDBD8;")
+        self.label_2.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_2.setObjectName("label_2")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.label_2)
+        self.number_pots = QtWidgets.QLabel(Form)
+        self.number_pots.setStyleSheet("font: bold 14pt \"Candara\";\n"
+"background-color: #CFDBD8;\n"
+"")
+        self.number_pots.setText("")
+        self.number_pots.setAlignment(QtCore.Qt.AlignCenter)
+        self.number_pots.setObjectName("number_pots")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.number_pots)
+        self.gardener_name = QtWidgets.QLineEdit(Form)
+        self.gardener_name.setMinimumSize(QtCore.QSize(0, 30))
+        self.gardener_name.setStyleSheet("font: 13pt \"Candara\";\n"
+"background-color: #CFDBD8;")
+        self.gardener_name.setText("")
+        self.gardener_name.setFrame(False)
+        self.gardener_name.setAlignment(QtCore.Qt.AlignCenter)
+        self.gardener_name.setObjectName("gardener_name")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.gardener_name)
+        self.verticalLayout_profile.addLayout(self.formLayout)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_profile.addItem(spacerItem)
+        self.verticalLayout.addLayout(self.verticalLayout_profile)
+
+        self.retranslateUi(Form)
+        QtCore.QMetaObject.connectSlotsByName(Form)
+
+    def retranslateUi(self, Form):
+        _translate = QtCore.QCoreApplication.translate
+        Form.setWindowTitle(_translate("Form", "Form"))
+        self.return_profile.setText(_translate("Form", "..."))
+        self.label_about_pot.setText(_translate("Form", "ABOUT"))
+        self.label.setText(_translate("Form", "GARDENER:"))
+        self.label_4.setText(_translate("Form", "PLANTS:"))
+        self.label_2.setText(_translate("Form", "POTS:"))
+import resource_rc
+
+
+UI_CLASS = Ui_Form
+WIDGET_CLASS = "QWidget"
+SOURCE_HASH = "ecf05cef0a0985dd5f398482d0894b3a91421bdf"
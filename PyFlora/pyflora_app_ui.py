@@ -0,0 +1,602 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'pyflora_app.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+import os
+
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class Ui_pyflora_app(object):
+    def setupUi(self, pyflora_app):
+        pyflora_app.setObjectName("pyflora_app")
+        pyflora_app.resize(360, 800)
+        pyflora_app.setMaximumSize(QtCore.QSize(360, 800))
+        self.centralwidget = QtWidgets.QWidget(pyflora_app)
+        self.centralwidget.setMaximumSize(QtCore.QSize(360, 16777215))
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setContentsMargins(10, 10, 10, 10)
+        self.verticalLayout.setSpacing(6)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.pyflora_tabs = QtWidgets.QTabWidget(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.pyflora_tabs.sizePolicy().hasHeightForWidth())
+        self.pyflora_tabs.setSizePolicy(sizePolicy)
+        self.pyflora_tabs.setMinimumSize(QtCore.QSize(0, 0))
+        font = QtGui.QFont()
+        font.setFamily("Candara")
+        font.setPointSize(12)
+        self.pyflora_tabs.setFont(font)
+        self.pyflora_tabs.setContextMenuPolicy(QtCore.Qt.ActionsContextMenu)
+        self.pyflora_tabs.setAcceptDrops(False)
+        self.pyflora_tabs.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.pyflora_tabs.setStyleSheet("QTabBar::tab{\n"
+"    height: 50px; \n"
+"    width: 85px;\n"
+"   qproperty-alignment: AlignCenter;\n"
+"}\n"
+"\n"
+"    \n"
+"\n"
+"QTabBar::tab:nth-of-type(0) {\n"
+"    icon-size: 150px 150px;\n"
+"}")
+        self.pyflora_tabs.setTabPosition(QtWidgets.QTabWidget.South)
+        self.pyflora_tabs.setTabShape(QtWidgets.QTabWidget.Rounded)
+        self.pyflora_tabs.setIconSize(QtCore.QSize(55, 35))
+        self.pyflora_tabs.setElideMode(QtCore.Qt.ElideNone)
+        self.pyflora_tabs.setTabBarAutoHide(False)
+        self.pyflora_tabs.setObjectName("pyflora_tabs")
+        self.home_tab = QtWidgets.QWidget()
+        font = QtGui.QFont()
+        font.setFamily("Candara")
+        font.setPointSize(12)
+        self.home_tab.setFont(font)
+        self.home_tab.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.home_tab.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.home_tab.setObjectName("home_tab")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.home_tab)
+        self.verticalLayout_2.setContentsMargins(15, -1, 15, -1)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.home_layout = QtWidgets.QVBoxLayout()
+        self.home_layout.setObjectName("home_layout")
+        self.home_all = QtWidgets.QWidget(self.home_tab)
+        self.home_all.setObjectName("home_all")
+        self.verticalLayout_10 = QtWidgets.QVBoxLayout(self.home_all)
+        self.verticalLayout_10.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_10.setObjectName("verticalLayout_10")
+        self.home_label = QtWidgets.QLabel(self.home_all)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.home_label.sizePolicy().hasHeightForWidth())
+        self.home_label.setSizePolicy(sizePolicy)
+        self.home_label.setMinimumSize(QtCore.QSize(0, 50))
+        font = QtGui.QFont()
+        font.setFamily("Candara")
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setItalic(False)
+        font.setWeight(75)
+        self.home_label.setFont(font)
+        self.home_label.setStyleSheet("font: 13pt \"Candara\";\n"
+"font-weight:bold;\n"
+"padding: 7px;\n"
+"color: #4F7375")
+        self.home_label.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.home_label.setObjectName("home_label")
+        self.verticalLayout_10.addWidget(self.home_label)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setSizeConstraint(QtWidgets.QLayout.SetFixedSize)
+        self.horizontalLayout.setContentsMargins(5, 0, 5, 20)
+        self.horizontalLayout.setSpacing(0)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.image_label = QtWidgets.QLabel(self.home_all)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.image_label.sizePolicy().hasHeightForWidth())
+        self.image_label.setSizePolicy(sizePolicy)
+        self.image_label.setMinimumSize(QtCore.QSize(125, 125))
+        self.image_label.setMaximumSize(QtCore.QSize(125, 125))
+        self.image_label.setBaseSize(QtCore.QSize(0, 0))
+        font = QtGui.QFont()
+        font.setFamily("Candara")
+        font.setPointSize(14)
+        self.image_label.setFont(font)
+        self.image_label.setStyleSheet("border-radius: 40px;\n"
+"border: 1px solid #DE7067;\n"
+"")
+        self.image_label.setText("")
+        self.image_label.setScaledContents(True)
+        self.image_label.setObjectName("image_label")
+        self.horizontalLayout.addWidget(self.image_label)
+        self.greeting_label = QtWidgets.QLabel(self.home_all)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.greeting_label.sizePolicy().hasHeightForWidth())
+        self.greeting_label.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setFamily("Candara")
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setItalic(False)
+        font.setWeight(50)
+        self.greeting_label.setFont(font)
+        self.greeting_label.setStyleSheet("padding-left: 10px;\n"
+"color:#BD523F")
+        self.greeting_label.setText("")
+        self.greeting_label.setWordWrap(True)
+        self.greeting_label.setObjectName("greeting_label")
+        self.horizontalLayout.addWidget(self.greeting_label)
+        self.verticalLayout_10.addLayout(self.horizontalLayout)
+        self.profile_button = QtWidgets.QPushButton(self.home_all)
+        self.profile_button.setMinimumSize(QtCore.QSize(0, 50))
+        self.profile_button.setStyleSheet("QPushButton#profile_button{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    text-align: left;\n"
+"    padding-left: 20 px;\n"
+"    \n"
+"}\n"
+"\n"
+"QPushButton#profile_button:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QPushButton#profile_button:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "profile.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.profile_button.setIcon(icon)
+        self.profile_button.setIconSize(QtCore.QSize(20, 20))
+        self.profile_button.setAutoDefault(False)
+        self.profile_button.setDefault(False)
+        self.profile_button.setObjectName("profile_button")
+        self.verticalLayout_10.addWidget(self.profile_button)
+        self.plants_button = QtWidgets.QPushButton(self.home_all)
+        self.plants_button.setMinimumSize(QtCore.QSize(0, 50))
+        self.plants_button.setStyleSheet("QPushButton#plants_button{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    text-align: left;\n"
+"    padding-left: 20px;\n"
+"    \n"
+"}\n"
+"\n"
+"QPushButton#plants_button:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QPushButton#plants_button:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "plants.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.plants_button.setIcon(icon1)
+        self.plants_button.setIconSize(QtCore.QSize(25, 25))
+        self.plants_button.setObjectName("plants_button")
+        self.verticalLayout_10.addWidget(self.plants_button)
+        self.pots_button = QtWidgets.QPushButton(self.home_all)
+        self.pots_button.setMinimumSize(QtCore.QSize(0, 50))
+        self.pots_button.setBaseSize(QtCore.QSize(0, 0))
+        self.pots_button.setStyleSheet("QPushButton#pots_button{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    text-align: left;\n"
+"    padding-left: 20px;\n"
+"    \n"
+"}\n"
+"\n"
+"QPushButton#pots_button:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QPushButton#pots_button:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "pot.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pots_button.setIcon(icon2)
+        self.pots_button.setIconSize(QtCore.QSize(25, 25))
+        self.pots_button.setObjectName("pots_button")
+        self.verticalLayout_10.addWidget(self.pots_button)
+        self.settings_button = QtWidgets.QPushButton(self.home_all)
+        self.settings_button.setMinimumSize(QtCore.QSize(0, 50))
+        self.settings_button.setStyleSheet("QPushButton#settings_button{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    text-align: left;\n"
+"    padding-left: 20px;\n"
+"    \n"
+"}\n"
+"\n"
+"QPushButton#settings_button:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QPushButton#settings_button:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        icon3 = QtGui.QIcon()
+        icon3.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "settings.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.settings_button.setIcon(icon3)
+        self.settings_button.setIconSize(QtCore.QSize(20, 20))
+        self.settings_button.setObjectName("settings_button")
+        self.verticalLayout_10.addWidget(self.settings_button)
+        self.logout_button = QtWidgets.QPushButton(self.home_all)
+        self.logout_button.setMinimumSize(QtCore.QSize(0, 50))
+        self.logout_button.setStyleSheet("QPushButton#logout_button{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    text-align: left;\n"
+"    padding-left: 20px;\n"
+"    \n"
+"}\n"
+"\n"
+"QPushButton#logout_button:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QPushButton#logout_button:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        icon4 = QtGui.QIcon()
+        icon4.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "logout.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.logout_button.setIcon(icon4)
+        self.logout_button.setIconSize(QtCore.QSize(20, 20))
+        self.logout_button.setObjectName("logout_button")
+        self.verticalLayout_10.addWidget(self.logout_button)
+        self.label_2 = QtWidgets.QLabel(self.home_all)
+        self.label_2.setStyleSheet("font: 8pt \"Candara\";\n"
+"padding: 7px;\n"
+"color: #4F7375")
+        self.label_2.setTextFormat(QtCore.Qt.AutoText)
+        self.label_2.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout_10.addWidget(self.label_2, 0, QtCore.Qt.AlignRight)
+        self.home_info = QtWidgets.QLabel(self.home_all)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.home_info.sizePolicy().hasHeightForWidth())
+        self.home_info.setSizePolicy(sizePolicy)
+        self.home_info.setMinimumSize(QtCore.QSize(0, 0))
+        self.home_info.setMaximumSize(QtCore.QSize(16777215, 35))
+        self.home_info.setStyleSheet("font: 13pt \"Candara\";\n"
+"padding: 7px;\n"
+"color: #BD523F;\n"
+"qproperty-alignment: AlignCenter;")
+        self.home_info.setText("")
+        self.home_info.setWordWrap(True)
+        self.home_info.setObjectName("home_info")
+        self.verticalLayout_10.addWidget(self.home_info)
+        self.home_layout.addWidget(self.home_all)
+        self.verticalLayout_2.addLayout(self.home_layout)
+        icon5 = QtGui.QIcon()
+        icon5.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "home.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pyflora_tabs.addTab(self.home_tab, icon5, "")
+        self.plants_tab = QtWidgets.QWidget()
+        self.plants_tab.setObjectName("plants_tab")
+        self.verticalLayout_5 = QtWidgets.QVBoxLayout(self.plants_tab)
+        self.verticalLayout_5.setContentsMargins(15, -1, 15, -1)
+        self.verticalLayout_5.setSpacing(6)
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.plants_layout = QtWidgets.QVBoxLayout()
+        self.plants_layout.setContentsMargins(0, 0, 0, 0)
+        self.plants_layout.setSpacing(0)
+        self.plants_layout.setObjectName("plants_layout")
+        self.plants_all = QtWidgets.QWidget(self.plants_tab)
+        self.plants_all.setMinimumSize(QtCore.QSize(50, 50))
+        self.plants_all.setObjectName("plants_all")
+        self.verticalLayout_6 = QtWidgets.QVBoxLayout(self.plants_all)
+        self.verticalLayout_6.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_6.setSpacing(6)
+        self.verticalLayout_6.setObjectName("verticalLayout_6")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.horizontalLayout_3.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.plants_label = QtWidgets.QLabel(self.plants_all)
+        self.plants_label.setEnabled(True)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.plants_label.sizePolicy().hasHeightForWidth())
+        self.plants_label.setSizePolicy(sizePolicy)
+        self.plants_label.setMinimumSize(QtCore.QSize(0, 50))
+        self.plants_label.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.plants_label.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.plants_label.setAutoFillBackground(False)
+        self.plants_label.setStyleSheet("font: 13pt \"Candara\";\n"
+"font-weight:bold;\n"
+"padding: 7px;\n"
+"color: #4F7375")
+        self.plants_label.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.plants_label.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.plants_label.setTextFormat(QtCore.Qt.AutoText)
+        self.plants_label.setScaledContents(False)
+        self.plants_label.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.plants_label.setWordWrap(False)
+        self.plants_label.setObjectName("plants_label")
+        self.horizontalLayout_3.addWidget(self.plants_label)
+        self.add_plant_button = QtWidgets.QPushButton(self.plants_all)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.add_plant_button.sizePolicy().hasHeightForWidth())
+        self.add_plant_button.setSizePolicy(sizePolicy)
+        self.add_plant_button.setMinimumSize(QtCore.QSize(45, 45))
+        self.add_plant_button.setAcceptDrops(False)
+        self.add_plant_button.setStyleSheet("QPushButton#add_plant_button{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    text-align: left;\n"
+"    padding-left: 10px;\n"
+"    \n"
+"}\n"
+"\n"
+"QPushButton#add_plant_button:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QPushButton#add_plant_button:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        self.add_plant_button.setText("")
+        icon6 = QtGui.QIcon()
+        icon6.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "add.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.add_plant_button.setIcon(icon6)
+        self.add_plant_button.setIconSize(QtCore.QSize(25, 25))
+        self.add_plant_button.setAutoDefault(False)
+        self.add_plant_button.setDefault(False)
+        self.add_plant_button.setFlat(False)
+        self.add_plant_button.setObjectName("add_plant_button")
+        self.horizontalLayout_3.addWidget(self.add_plant_button, 0, QtCore.Qt.AlignRight|QtCore.Qt.AlignBottom)
+        self.verticalLayout_6.addLayout(self.horizontalLayout_3)
+        self.search_plants = QtWidgets.QLineEdit(self.plants_all)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.search_plants.sizePolicy().hasHeightForWidth())
+        self.search_plants.setSizePolicy(sizePolicy)
+        self.search_plants.setMinimumSize(QtCore.QSize(0, 45))
+        self.search_plants.setStyleSheet("background-color: #A3BAB4;\n"
+"border-radius: 10px;\n"
+"font: 12pt \"Candara\";\n"
+"padding-left: 10px")
+        self.search_plants.setObjectName("search_plants")
+        self.verticalLayout_6.addWidget(self.search_plants)
+        self.scroll_plants = QtWidgets.QScrollArea(self.plants_all)
+        self.scroll_plants.setStyleSheet("")
+        self.scroll_plants.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.scroll_plants.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.scroll_plants.setWidgetResizable(True)
+        self.scroll_plants.setObjectName("scroll_plants")
+        self.plants_widget = QtWidgets.QWidget()
+        self.plants_widget.setGeometry(QtCore.QRect(0, 0, 302, 597))
+        font = QtGui.QFont()
+        font.setFamily("Candara")
+        font.setPointSize(10)
+        self.plants_widget.setFont(font)
+        self.plants_widget.setObjectName("plants_widget")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.plants_widget)
+        self.verticalLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.scroll_plants.setWidget(self.plants_widget)
+        self.verticalLayout_6.addWidget(self.scroll_plants)
+        self.plants_layout.addWidget(self.plants_all)
+        self.verticalLayout_5.addLayout(self.plants_layout)
+        self.pyflora_tabs.addTab(self.plants_tab, icon1, "")
+        self.pots_tab = QtWidgets.QWidget()
+        self.pots_tab.setObjectName("pots_tab")
+        self.verticalLayout_7 = QtWidgets.QVBoxLayout(self.pots_tab)
+        self.verticalLayout_7.setContentsMargins(15, -1, 15, -1)
+        self.verticalLayout_7.setObjectName("verticalLayout_7")
+        self.pots_layout = QtWidgets.QVBoxLayout()
+        self.pots_layout.setSpacing(0)
+        self.pots_layout.setObjectName("pots_layout")
+        self.pots_all = QtWidgets.QWidget(self.pots_tab)
+        self.pots_all.setMinimumSize(QtCore.QSize(0, 0))
+        self.pots_all.setObjectName("pots_all")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.pots_all)
+        self.verticalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setSizeConstraint(QtWidgets.QLayout.SetDefaultConstraint)
+        self.horizontalLayout_2.setSpacing(6)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.pots_label = QtWidgets.QLabel(self.pots_all)
+        self.pots_label.setMinimumSize(QtCore.QSize(0, 50))
+        self.pots_label.setStyleSheet("font: 13pt \"Candara\";\n"
+"font-weight:bold;\n"
+"padding: 7px;\n"
+"color: #4F7375")
+        self.pots_label.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.pots_label.setObjectName("pots_label")
+        self.horizontalLayout_2.addWidget(self.pots_label, 0, QtCore.Qt.AlignTop)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem)
+        self.sync_button = QtWidgets.QPushButton(self.pots_all)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.sync_button.sizePolicy().hasHeightForWidth())
+        self.sync_button.setSizePolicy(sizePolicy)
+        self.sync_button.setMinimumSize(QtCore.QSize(45, 45))
+        self.sync_button.setMaximumSize(QtCore.QSize(45, 45))
+        self.sync_button.setStyleSheet("QPushButton#sync_button{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    text-align: left;\n"
+"    padding-left: 10px;\n"
+"    \n"
+"}\n"
+"\n"
+"QPushButton#sync_button:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QPushButton#sync_button:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        self.sync_button.setText("")
+        icon7 = QtGui.QIcon()
+        icon7.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "sync.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.sync_button.setIcon(icon7)
+        self.sync_button.setIconSize(QtCore.QSize(25, 25))
+        self.sync_button.setObjectName("sync_button")
+        self.horizontalLayout_2.addWidget(self.sync_button, 0, QtCore.Qt.AlignRight|QtCore.Qt.AlignBottom)
+        self.add_pot_button = QtWidgets.QPushButton(self.pots_all)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.add_pot_button.sizePolicy().hasHeightForWidth())
+        self.add_pot_button.setSizePolicy(sizePolicy)
+        self.add_pot_button.setMinimumSize(QtCore.QSize(45, 45))
+        self.add_pot_button.setMaximumSize(QtCore.QSize(45, 45))
+        self.add_pot_button.setStyleSheet("QPushButton#add_pot_button{\n"
+"    background-color: #E9E5E3;\n"
+"    border-radius: 15px;\n"
+"    font: 12pt \"Candara\";\n"
+"    text-align: left;\n"
+"    padding-left: 10px;\n"
+"    \n"
+"}\n"
+"\n"
+"QPushButton#add_pot_button:hover{\n"
+"    background-color: #D1CECC;\n"
+"}\n"
+"\n"
+"QPushButton#add_pot_button:pressed{\n"
+"    background-color: #E9E5E3;\n"
+"    border: 4px solid #D1CECC;\n"
+"    \n"
+"}")
+        self.add_pot_button.setText("")
+        self.add_pot_button.setIcon(icon6)
+        self.add_pot_button.setIconSize(QtCore.QSize(25, 25))
+        self.add_pot_button.setObjectName("add_pot_button")
+        self.horizontalLayout_2.addWidget(self.add_pot_button, 0, QtCore.Qt.AlignRight|QtCore.Qt.AlignBottom)
+        self.verticalLayout_4.addLayout(self.horizontalLayout_2)
+        self.search_pots = QtWidgets.QLineEdit(self.pots_all)
+        self.search_pots.setMinimumSize(QtCore.QSize(0, 45))
+        self.search_pots.setStyleSheet("background-color: #A3BAB4;\n"
+"border-radius: 10px;\n"
+"font: 12pt \"Candara\";\n"
+"padding-left: 10px")
+        self.search_pots.setObjectName("search_pots")
+        self.verticalLayout_4.addWidget(self.search_pots)
+        self.scroll_pots = QtWidgets.QScrollArea(self.pots_all)
+        self.scroll_pots.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.scroll_pots.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.scroll_pots.setWidgetResizable(True)
+        self.scroll_pots.setObjectName("scroll_pots")
+        self.pots_widget = QtWidgets.QWidget()
+        self.pots_widget.setGeometry(QtCore.QRect(0, 0, 302, 597))
+        self.pots_widget.setObjectName("pots_widget")
+        self.verticalLayout_8 = QtWidgets.QVBoxLayout(self.pots_widget)
+        self.verticalLayout_8.setObjectName("verticalLayout_8")
+        self.scroll_pots.setWidget(self.pots_widget)
+        self.verticalLayout_4.addWidget(self.scroll_pots)
+        self.pots_layout.addWidget(self.pots_all)
+        self.verticalLayout_7.addLayout(self.pots_layout)
+        self.pyflora_tabs.addTab(self.pots_tab, icon2, "")
+        self.notifcation_tab = QtWidgets.QWidget()
+        self.notifcation_tab.setObjectName("notifcation_tab")
+        self.verticalLayout_9 = QtWidgets.QVBoxLayout(self.notifcation_tab)
+        self.verticalLayout_9.setContentsMargins(15, 9, 15, -1)
+        self.verticalLayout_9.setObjectName("verticalLayout_9")
+        self.verticalLayout_11 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_11.setContentsMargins(0, -1, 0, -1)
+        self.verticalLayout_11.setObjectName("verticalLayout_11")
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalLayout_4.setSpacing(0)
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.label = QtWidgets.QLabel(self.notifcation_tab)
+        self.label.setMinimumSize(QtCore.QSize(0, 50))
+        self.label.setStyleSheet("font: 13pt \"Candara\";\n"
+"font-weight:bold;\n"
+"padding: 7px;\n"
+"color: #4F7375")
+        self.label.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.label.setObjectName("label")
+        self.horizontalLayout_4.addWidget(self.label, 0, QtCore.Qt.AlignTop)
+        self.verticalLayout_11.addLayout(self.horizontalLayout_4)
+        self.notification_scroll = QtWidgets.QScrollArea(self.notifcation_tab)
+        self.notification_scroll.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.notification_scroll.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.notification_scroll.setWidgetResizable(True)
+        self.notification_scroll.setObjectName("notification_scroll")
+        self.notification_widget = QtWidgets.QWidget()
+        self.notification_widget.setGeometry(QtCore.QRect(0, 0, 302, 648))
+        self.notification_widget.setObjectName("notification_widget")
+        self.verticalLayout_12 = QtWidgets.QVBoxLayout(self.notification_widget)
+        self.verticalLayout_12.setObjectName("verticalLayout_12")
+        self.notification_scroll.setWidget(self.notification_widget)
+        self.verticalLayout_11.addWidget(self.notification_scroll)
+        self.verticalLayout_9.addLayout(self.verticalLayout_11)
+        icon8 = QtGui.QIcon()
+        icon8.addPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "school-bell.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.pyflora_tabs.addTab(self.notifcation_tab, icon8, "")
+        self.verticalLayout.addWidget(self.pyflora_tabs)
+        pyflora_app.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(pyflora_app)
+        self.pyflora_tabs.setCurrentIndex(3)
+        QtCore.QMetaObject.connectSlotsByName(pyflora_app)
+
+    def retranslateUi(self, pyflora_app):
+        _translate = QtCore.QCoreApplication.translate
+        pyflora_app.setWindowTitle(_translate("pyflora_app", "MainWindow"))
+        self.home_label.setText(_translate("pyflora_app", "HOME"))
+        self.profile_button.setText(_translate("pyflora_app", "My Profile"))
+        self.plants_button.setText(_translate("pyflora_app", "My Plants"))
+        self.pots_button.setText(_translate("pyflora_app", "My Pots"))
+        self.settings_button.setText(_translate("pyflora_app", "Settings"))
+        self.logout_button.setText(_translate("pyflora_app", "Logout"))
+        self.label_2.setText(_translate("pyflora_app", "created by marta.jerkovich@gmail.com"))
+        self.plants_label.setText(_translate("pyflora_app", "MY PLANTS"))
+        self.search_plants.setPlaceholderText(_translate("pyflora_app", "Search plants"))
+        self.pots_label.setText(_translate("pyflora_app", "MY POTS"))
+        self.search_pots.setPlaceholderText(_translate("pyflora_app", "Search pots"))
+        self.label.setText(_translate("pyflora_app", "NOTIFICATIONS"))
+
+
+UI_CLASS = Ui_pyflora_app
+WIDGET_CLASS = "QMainWindow"
+SOURCE_HASH = "c75d117c3c78268e7261e02292348a8fe99e7518"
@@ -0,0 +1,95 @@
+import configparser
+import os
+
+# Settings come from, in order: PYFLORA_<SECTION>_<KEY> environment variables, the
+# optional pyflora.ini next to the app (or the file named by PYFLORA_CONFIG), then the
+# defaults below. Relative paths are resolved against the app folder, not the CWD.
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_FILE = os.environ.get("PYFLORA_CONFIG", os.path.join(APP_DIR, "pyflora.ini"))
+
+DEFAULTS = {
+    "database": {
+        "path": "pyflora.db",
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL", #safe with WAL: a power cut can lose the last commits, never corrupt the file
+        "cache_size_kb": "16384",
+        "mmap_size_mb": "64",
+        "busy_timeout_ms": "5000"
+    },
+    "collector": {
+        "interval_seconds": "900",
+        "jitter_seconds": "30",
+        "max_catch_up": "96", #missed intervals filled in per pot, older gaps stay gaps
+        "batch_size": "5000" #readings per transaction
+    },
+    "weather": {
+        "backend": "openweather", #or replay
+        "url": "", #e.g. http://127.0.0.1:8765/data/2.5/weather for weather_stub.py
+        "api_key": "",
+        "city": "",
+        "record_file": "", #openweather responses are appended here when set
+        "replay_file": "weather_replay.jsonl"
+    },
+    "retention": {
+        "enabled": "no", #yes: the app deletes old readings in the background; sensor_retention.py can always be run by hand
+        "raw_days": "30", #empty: keep that level forever
+        "hourly_days": "365",
+        "interval_hours": "6",
+        "vacuum": "no" #yes: give freed pages back to the disk, once the database was converted (sensor_retention.py --convert)
+    },
+    "ui": {
+        "precompiled": "yes" #no: always parse the .ui files with loadUi, see ui_loader.py
+    },
+    "locations": {} #pot location or user.<username> = city or "latitude,longitude", see weather_locations.py
+}
+
+_parser = None
+
+
+def parser():
+
+    global _parser
+
+    if _parser is None:
+        _parser = configparser.ConfigParser()
+        _parser.read_dict(DEFAULTS)
+        _parser.read(CONFIG_FILE, encoding="utf-8")
+
+    return _parser
+
+
+def get(section, key, default=None):
+
+    value = os.environ.get(f"PYFLORA_{section}_{key}".upper())
+
+    if value is None:
+        value = parser().get(section, key, fallback=default)
+
+    return value
+
+
+def get_int(section, key, default=None):
+
+    value = get(section, key)
+
+    return int(value) if value not in (None, "") else default
+
+
+def get_path(section, key, default=None):
+
+    value = get(section, key, default)
+
+    if not value or value == ":memory:" or os.path.isabs(value):
+        return value
+
+    return os.path.join(APP_DIR, value)
+
+
+def items(section):
+    #every key of a section from pyflora.ini and the defaults, without environment overrides
+
+    if not parser().has_section(section):
+        return {}
+
+    return dict(parser().items(section))
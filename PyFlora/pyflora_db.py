@@ -1,7 +1,10 @@
 import sqlalchemy as db
 from sqlalchemy.orm import Session, relationship, backref
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
+import pyflora_config
+import threading
 import csv
 
 
@@ -63,14 +66,121 @@ class SensorReadings(Base):
     soil_moisture = db.Column(db.Float, nullable=True)
     soil_ph = db.Column(db.Float, nullable=True)
 
+    __table_args__ = (
+        db.Index("ix_sensor_readings_pot_datetime", "pot_id", "datetime"),
+        db.Index("ix_sensor_readings_pot_watering", "pot_id", "watering_timestamp"),
+    )
+
+
+class SensorRollupColumns:
+    #one row per pot and hour/day; mean = sum / count, counts are per column because readings can have NULLs
+    pot_id = db.Column(db.Integer, primary_key=True)
+    bucket_start = db.Column(db.DateTime, primary_key=True)
+    reading_count = db.Column(db.Integer, nullable=False, default=0)
+    temperature_celsius_count = db.Column(db.Integer, nullable=False, default=0)
+    temperature_celsius_sum = db.Column(db.Float, nullable=True)
+    temperature_celsius_min = db.Column(db.Float, nullable=True)
+    temperature_celsius_max = db.Column(db.Float, nullable=True)
+    light_intensity_lux_count = db.Column(db.Integer, nullable=False, default=0)
+    light_intensity_lux_sum = db.Column(db.Float, nullable=True)
+    light_intensity_lux_min = db.Column(db.Float, nullable=True)
+    light_intensity_lux_max = db.Column(db.Float, nullable=True)
+    soil_moisture_count = db.Column(db.Integer, nullable=False, default=0)
+    soil_moisture_sum = db.Column(db.Float, nullable=True)
+    soil_moisture_min = db.Column(db.Float, nullable=True)
+    soil_moisture_max = db.Column(db.Float, nullable=True)
+    soil_ph_count = db.Column(db.Integer, nullable=False, default=0)
+    soil_ph_sum = db.Column(db.Float, nullable=True)
+    soil_ph_min = db.Column(db.Float, nullable=True)
+    soil_ph_max = db.Column(db.Float, nullable=True)
+
+
+class SensorRollupsHourly(SensorRollupColumns, Base):
+    __tablename__ = "SensorRollupsHourly"
+
+
+class SensorRollupsDaily(SensorRollupColumns, Base):
+    __tablename__ = "SensorRollupsDaily"
+
+
+def upgrade_schema(engine):
+    #create_all only adds indexes together with new tables, so databases created before the indexes existed get them here
+
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
+def sqlite_pragmas(journal_mode=None, synchronous=None, cache_size_kb=None, mmap_size_mb=None, busy_timeout_ms=None):
+    #settings not given come from [database]; 0 is a setting too (no mmap, no busy wait)
+
+    def setting(value, key, read=pyflora_config.get_int):
+
+        return value if value is not None else read("database", key)
+
+    return {
+        "journal_mode": setting(journal_mode, "journal_mode", pyflora_config.get),
+        "synchronous": setting(synchronous, "synchronous", pyflora_config.get),
+        "cache_size": -setting(cache_size_kb, "cache_size_kb"), #negative = KiB instead of pages
+        "mmap_size": setting(mmap_size_mb, "mmap_size_mb") * 1024 * 1024,
+        "busy_timeout": setting(busy_timeout_ms, "busy_timeout_ms")
+    }
+
+
+def create_db_engine(path=None, **pragma_settings):
+    #WAL lets the GUI read while a sync or the retention job writes; every new connection gets the pragmas
+
+    path = path or pyflora_config.get_path("database", "path")
+    pragmas = sqlite_pragmas(**pragma_settings)
+
+    if path == ":memory:":
+        #one shared connection, otherwise every session would see its own empty database
+        engine = db.create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    else:
+        engine = db.create_engine(f"sqlite:///{path}", connect_args={"timeout": pragmas["busy_timeout"] / 1000})
+
+    @db.event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+
+        cursor = dbapi_connection.cursor()
+
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+
+        cursor.close()
+
+    return engine
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def init_db(path=None, **pragma_settings):
+    #opens the database and brings its schema up to date, once; importing this module touches no database.
+    #Tools and benchmarks can pass another path (or ":memory:") before anything calls get_engine()
+
+    global _engine
+
+    with _engine_lock:
+        if _engine is None:
+            engine = create_db_engine(path, **pragma_settings)
+            Base.metadata.create_all(bind=engine)
+            upgrade_schema(engine)
+            _engine = engine
+
+    return _engine
+
+
+def get_engine():
+
+    return init_db()
 
-db_engine = db.create_engine("sqlite:///pyflora.db")
-Base.metadata.create_all(bind=db_engine)
 
 if __name__ == "__main__":
 
 
-    with Session(bind=db_engine) as session:
+    with Session(bind=init_db()) as session:
 
         user = Users(username="m", password="m", first_name="Mabel", last_name="Mora", image_path=f'./mabel_mora.jpg')
         session.add(user)
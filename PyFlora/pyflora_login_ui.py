@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'pyflora_login.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+import os
+
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class Ui_PyFlora_Login(object):
+    def setupUi(self, PyFlora_Login):
+        PyFlora_Login.setObjectName("PyFlora_Login")
+        PyFlora_Login.setEnabled(True)
+        PyFlora_Login.resize(360, 800)
+        PyFlora_Login.setStyleSheet("background-color:#4F7375;\n"
+"")
+        self.centralwidget = QtWidgets.QWidget(PyFlora_Login)
+        palette = QtGui.QPalette()
+        brush = QtGui.QBrush(QtGui.QColor(79, 115, 117))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(79, 115, 117))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(79, 115, 117))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(79, 115, 117))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(79, 115, 117))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(79, 115, 117))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(79, 115, 117))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(79, 115, 117))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(79, 115, 117))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.Window, brush)
+        self.centralwidget.setPalette(palette)
+        font = QtGui.QFont()
+        font.setFamily("Candara")
+        self.centralwidget.setFont(font)
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setContentsMargins(-1, 10, -1, 10)
+        self.gridLayout.setSpacing(0)
+        self.gridLayout.setObjectName("gridLayout")
+        spacerItem = QtWidgets.QSpacerItem(0, 0, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout.addItem(spacerItem, 1, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(0, 0, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout.addItem(spacerItem1, 1, 2, 1, 1)
+        spacerItem2 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.gridLayout.addItem(spacerItem2, 0, 1, 1, 1)
+        self.login_name = QtWidgets.QLabel(self.centralwidget)
+        self.login_name.setMinimumSize(QtCore.QSize(0, 0))
+        self.login_name.setMaximumSize(QtCore.QSize(1000, 1000))
+        self.login_name.setBaseSize(QtCore.QSize(0, 0))
+        self.login_name.setStyleSheet("font: 30pt \"Candara\";PyFlora")
+        self.login_name.setObjectName("login_name")
+        self.gridLayout.addWidget(self.login_name, 3, 1, 1, 1, QtCore.Qt.AlignTop)
+        self.login_image = QtWidgets.QLabel(self.centralwidget)
+        self.login_image.setMinimumSize(QtCore.QSize(50, 50))
+        self.login_image.setMaximumSize(QtCore.QSize(50, 50))
+        self.login_image.setBaseSize(QtCore.QSize(0, 0))
+        self.login_image.setStyleSheet("")
+        self.login_image.setText("")
+        self.login_image.setPixmap(QtGui.QPixmap(os.path.join(UI_DIR, "leaves.png")))
+        self.login_image.setScaledContents(True)
+        self.login_image.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.login_image.setObjectName("login_image")
+        self.gridLayout.addWidget(self.login_image, 2, 1, 1, 1, QtCore.Qt.AlignBottom)
+        self.verticalLayout.addLayout(self.gridLayout)
+        self.gridLayout_2 = QtWidgets.QGridLayout()
+        self.gridLayout_2.setContentsMargins(30, -1, 30, -1)
+        self.gridLayout_2.setSpacing(6)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        spacerItem3 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.gridLayout_2.addItem(spacerItem3, 0, 0, 1, 1)
+        self.username_input = QtWidgets.QLineEdit(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.username_input.sizePolicy().hasHeightForWidth())
+        self.username_input.setSizePolicy(sizePolicy)
+        self.username_input.setMinimumSize(QtCore.QSize(250, 40))
+        font = QtGui.QFont()
+        font.setFamily("Candara")
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setItalic(False)
+        font.setWeight(50)
+        self.username_input.setFont(font)
+        self.username_input.setStyleSheet("background-color: #E9E5E3;\n"
+"border-radius: 10px;\n"
+"font: 12pt \"Candara\";\n"
+"padding: 7px")
+        self.username_input.setObjectName("username_input")
+        self.gridLayout_2.addWidget(self.username_input, 1, 0, 1, 1)
+        self.password_input = QtWidgets.QLineEdit(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.password_input.sizePolicy().hasHeightForWidth())
+        self.password_input.setSizePolicy(sizePolicy)
+        self.password_input.setMinimumSize(QtCore.QSize(250, 40))
+        font = QtGui.QFont()
+        font.setFamily("Candara")
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setItalic(False)
+        font.setWeight(50)
+        self.password_input.setFont(font)
+        self.password_input.setStyleSheet("background-color: #E9E5E3;\n"
+"border-radius: 10px;\n"
+"font: 12pt \"Candara\";\n"
+"padding: 7px")
+        self.password_input.setEchoMode(QtWidgets.QLineEdit.Password)
+        self.password_input.setObjectName("password_input")
+        self.gridLayout_2.addWidget(self.password_input, 2, 0, 1, 1)
+        self.verticalLayout.addLayout(self.gridLayout_2)
+        self.gridLayout_3 = QtWidgets.QGridLayout()
+        self.gridLayout_3.setObjectName("gridLayout_3")
+        self.login_info = QtWidgets.QLabel(self.centralwidget)
+        self.login_info.setMinimumSize(QtCore.QSize(120, 40))
+        font = QtGui.QFont()
+        font.setFamily("Candara")
+        font.setPointSize(13)
+        font.setBold(True)
+        font.setItalic(False)
+        font.setWeight(75)
+        self.login_info.setFont(font)
+        self.login_info.setStyleSheet("font:bold 13pt \"Candara\";\n"
+"padding: 7px;\n"
+"color:#BD523F")
+        self.login_info.setText("")
+        self.login_info.setObjectName("login_info")
+        self.gridLayout_3.addWidget(self.login_info, 0, 0, 1, 1, QtCore.Qt.AlignHCenter|QtCore.Qt.AlignVCenter)
+        self.verticalLayout.addLayout(self.gridLayout_3)
+        self.gridLayout_4 = QtWidgets.QGridLayout()
+        self.gridLayout_4.setObjectName("gridLayout_4")
+        self.login_button = QtWidgets.QPushButton(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.login_button.sizePolicy().hasHeightForWidth())
+        self.login_button.setSizePolicy(sizePolicy)
+        self.login_button.setMinimumSize(QtCore.QSize(120, 40))
+        palette = QtGui.QPalette()
+        brush = QtGui.QBrush(QtGui.QColor(116, 142, 129))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(116, 142, 129))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(116, 142, 129))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(116, 142, 129))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(116, 142, 129))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(116, 142, 129))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.Window, brush)
+        brush = QtGui.QBrush(QtGui.QColor(116, 142, 129))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.Button, brush)
+        brush = QtGui.QBrush(QtGui.QColor(116, 142, 129))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.Base, brush)
+        brush = QtGui.QBrush(QtGui.QColor(116, 142, 129))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.Window, brush)
+        self.login_button.setPalette(palette)
+        font = QtGui.QFont()
+        font.setFamily("Candara")
+        font.setPointSize(12)
+        font.setBold(False)
+        font.setItalic(False)
+        font.setWeight(50)
+        self.login_button.setFont(font)
+        self.login_button.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.login_button.setStyleSheet("QPushButton#login_button{\n"
+"    background-color: #748E81;\n"
+"    border-radius: 10px;\n"
+"    font: 12pt \"Candara\";\n"
+"    \n"
+"}\n"
+"\n"
+"QPushButton#login_button:hover{\n"
+"    background-color: #8FA39E;\n"
+"    border-radius: 10px;\n"
+"    font: 12pt \"Candara\";\n"
+"}\n"
+"\n"
+"QPushButton#login_button:pressed{\n"
+"    background-color: #8FA39E;\n"
+"    border-radius: 10px;\n"
+"    font: 12pt \"Candara\";\n"
+"    border: 5px solid #748E81;\n"
+"    \n"
+"}")
+        self.login_button.setAutoDefault(False)
+        self.login_button.setDefault(True)
+        self.login_button.setFlat(False)
+        self.login_button.setObjectName("login_button")
+        self.gridLayout_4.addWidget(self.login_button, 1, 0, 1, 1)
+        spacerItem4 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.gridLayout_4.addItem(spacerItem4, 2, 0, 1, 1)
+        self.verticalLayout.addLayout(self.gridLayout_4)
+        PyFlora_Login.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(PyFlora_Login)
+        QtCore.QMetaObject.connectSlotsByName(PyFlora_Login)
+
+    def retranslateUi(self, PyFlora_Login):
+        _translate = QtCore.QCoreApplication.translate
+        PyFlora_Login.setWindowTitle(_translate("PyFlora_Login", "MainWindow"))
+        self.login_name.setText(_translate("PyFlora_Login", "PyFlora"))
+        self.username_input.setPlaceholderText(_translate("PyFlora_Login", "Username"))
+        self.password_input.setPlaceholderText(_translate("PyFlora_Login", "Password"))
+        self.login_button.setText(_translate("PyFlora_Login", "Login"))
+import resource_rc
+
+
+UI_CLASS = Ui_PyFlora_Login
+WIDGET_CLASS = "QMainWindow"
+SOURCE_HASH = "7cef040cbcf7d95ac8f53bb3f7c6dd817ef54706"
@@ -0,0 +1,386 @@
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QRectF, QSize
+from PyQt5.QtGui import QColor, QFont, QPainter, QPainterPath
+from PyQt5.QtWidgets import QStyledItemDelegate
+from sqlalchemy.orm import Session
+from sqlalchemy import select
+from pyflora_db import get_engine, Plants, Pots
+from image_cache import thumbnail_pixmap
+from collections import namedtuple
+
+TileRow = namedtuple("TileRow", ["id", "name", "secondary", "image"])
+
+ID_ROLE = Qt.UserRole
+SECONDARY_ROLE = Qt.UserRole + 1
+IMAGE_ROLE = Qt.UserRole + 2
+
+TILE_HEIGHT = 80
+TILE_MIN_WIDTH = 260
+PLANT_STRIP_WIDTH = 600
+
+
+def pot_row(pot):
+
+    return TileRow(pot.id, pot.name, pot.plant_name, pot.plant_image)
+
+
+def plant_row(plant):
+
+    return TileRow(plant.id, plant.name, plant.botanical_name, plant.image_loc)
+
+
+class TileListModel(QAbstractListModel):
+    #keeps only plain rows in memory; the view asks for the visible ones while painting.
+    #set_filter narrows the rows to a set of ids (e.g. from a SearchIndex) without touching widgets
+
+    def __init__(self, parent=None):
+        super(TileListModel, self).__init__(parent)
+
+        self.rows = []
+        self.filter_ids = None
+        self.filtered_rows = None
+
+
+    def shown_rows(self):
+
+        return self.rows if self.filtered_rows is None else self.filtered_rows
+
+
+    def rowCount(self, parent=QModelIndex()):
+
+        return 0 if parent.isValid() else len(self.shown_rows())
+
+
+    def data(self, index, role=Qt.DisplayRole):
+
+        if not index.isValid():
+            return None
+
+        row = self.shown_rows()[index.row()]
+
+        if role == Qt.DisplayRole:
+            return row.name
+        elif role == SECONDARY_ROLE:
+            return row.secondary
+        elif role == IMAGE_ROLE:
+            return row.image
+        elif role == ID_ROLE:
+            return row.id
+
+        return None
+
+
+    def set_filter(self, ids):
+
+        self.beginResetModel()
+        self.filter_ids = ids
+        self.filtered_rows = None if ids is None else [row for row in self.rows if row.id in ids]
+        self.endResetModel()
+
+
+    def is_shown(self, row):
+
+        return self.filter_ids is None or row.id in self.filter_ids
+
+
+    def position_of(self, rows, row_id):
+
+        row_id = int(row_id)
+
+        for i, row in enumerate(rows):
+            if row.id == row_id:
+                return i
+
+        return -1
+
+
+    def append_row(self, row):
+
+        if self.filtered_rows is None:
+            position = len(self.rows)
+
+            self.beginInsertRows(QModelIndex(), position, position)
+            self.rows.append(row)
+            self.endInsertRows()
+
+        else:
+            self.rows.append(row)
+
+            if self.is_shown(row):
+                position = len(self.filtered_rows)
+
+                self.beginInsertRows(QModelIndex(), position, position)
+                self.filtered_rows.append(row)
+                self.endInsertRows()
+
+
+    def replace_row(self, row):
+        #a filtered row may be shown without being in rows (see PlantsListModel.set_filter)
+
+        position = self.position_of(self.rows, row.id)
+
+        if position >= 0:
+            self.rows[position] = row
+
+        if self.filtered_rows is not None:
+            position = self.position_of(self.filtered_rows, row.id)
+
+            if position >= 0:
+                self.filtered_rows[position] = row
+
+        if position >= 0:
+            self.dataChanged.emit(self.index(position), self.index(position))
+
+
+    def remove_row(self, row_id):
+
+        position = self.position_of(self.rows, row_id)
+
+        if self.filtered_rows is None:
+            if position >= 0:
+                self.beginRemoveRows(QModelIndex(), position, position)
+                del self.rows[position]
+                self.endRemoveRows()
+
+        else:
+            if position >= 0:
+                del self.rows[position]
+
+            position = self.position_of(self.filtered_rows, row_id)
+
+            if position >= 0:
+                self.beginRemoveRows(QModelIndex(), position, position)
+                del self.filtered_rows[position]
+                self.endRemoveRows()
+
+
+class PotsListModel(TileListModel):
+
+    def load(self):
+
+        with Session(bind=get_engine()) as session:
+            rows = session.execute(select(Pots.id, Pots.name, Pots.plant_name, Pots.plant_image).order_by(Pots.id)).all()
+
+        self.beginResetModel()
+        self.rows = [TileRow(*row) for row in rows]
+        self.filter_ids = None
+        self.filtered_rows = None
+        self.endResetModel()
+
+
+    def add_pot(self, pot):
+
+        self.append_row(pot_row(pot))
+
+
+    def update_pot(self, pot):
+
+        self.replace_row(pot_row(pot))
+
+
+    def remove_pot(self, pot_id):
+
+        self.remove_row(pot_id)
+
+
+class PlantsListModel(TileListModel):
+    #rows are materialized a page at a time as the view scrolls (canFetchMore/fetchMore).
+    #while filtered, the matching plants past the fetched pages are loaded by id instead, a page at a time as well,
+    #and only shown: rows keeps the unfiltered pages
+
+    PAGE_SIZE = 200
+
+    def __init__(self, parent=None):
+        super(PlantsListModel, self).__init__(parent)
+
+        self.last_id = 0
+        self.loaded_all = False
+        self.pending_ids = []
+
+
+    def load(self):
+
+        self.beginResetModel()
+        self.rows = []
+        self.filter_ids = None
+        self.filtered_rows = None
+        self.pending_ids = []
+        self.last_id = 0
+        self.loaded_all = False
+        self.endResetModel()
+
+
+    def set_filter(self, ids):
+
+        self.beginResetModel()
+        self.filter_ids = ids
+        self.filtered_rows = None if ids is None else [row for row in self.rows if row.id in ids]
+        self.pending_ids = [] if ids is None or self.loaded_all else sorted(plant_id for plant_id in ids if plant_id > self.last_id)
+        self.endResetModel()
+
+
+    def canFetchMore(self, parent=QModelIndex()):
+
+        if parent.isValid():
+            return False
+
+        if self.filtered_rows is not None:
+            return bool(self.pending_ids)
+
+        return not self.loaded_all
+
+
+    def fetchMore(self, parent=QModelIndex()):
+
+        if not self.canFetchMore(parent):
+            return
+
+        query = select(Plants.id, Plants.name, Plants.botanical_name, Plants.image_loc)
+
+        if self.filtered_rows is not None:
+            page, self.pending_ids = self.pending_ids[:self.PAGE_SIZE], self.pending_ids[self.PAGE_SIZE:]
+            query = query.where(Plants.id.in_(page))
+        else:
+            query = query.where(Plants.id > self.last_id).limit(self.PAGE_SIZE)
+
+        with Session(bind=get_engine()) as session:
+            rows = [TileRow(*row) for row in session.execute(query.order_by(Plants.id)).all()]
+
+        if self.filtered_rows is not None:
+            shown = self.filtered_rows
+
+        else:
+            if len(rows) < self.PAGE_SIZE:
+                self.loaded_all = True
+
+            shown = self.rows
+
+            if rows:
+                self.last_id = rows[-1].id
+
+        if rows:
+            self.beginInsertRows(QModelIndex(), len(shown), len(shown) + len(rows) - 1)
+            shown.extend(rows)
+            self.endInsertRows()
+
+
+    def add_plant(self, plant):
+
+        #plants that are not fetched yet show up with their page
+        if self.loaded_all:
+            self.append_row(plant_row(plant))
+            self.last_id = max(self.last_id, plant.id)
+
+
+    def update_plant(self, plant):
+
+        self.replace_row(plant_row(plant))
+
+
+    def remove_plant(self, plant_id):
+
+        self.remove_row(plant_id)
+
+
+class TileDelegate(QStyledItemDelegate):
+
+    RADIUS = 10
+    TEXT_COLOR = QColor("black")
+
+    def __init__(self, parent=None):
+        super(TileDelegate, self).__init__(parent)
+
+        self.name_font = QFont("Candara", 13)
+        self.name_font.setBold(True)
+        self.secondary_font = QFont("Candara", 12)
+
+
+    def sizeHint(self, option, index):
+
+        return QSize(TILE_MIN_WIDTH, TILE_HEIGHT)
+
+
+    def paint_text(self, painter, text_rect, index, color):
+
+        name_rect = QRect(text_rect.left(), text_rect.top(), text_rect.width(), text_rect.height() // 2)
+        secondary_rect = QRect(text_rect.left(), name_rect.bottom(), text_rect.width(), text_rect.height() - name_rect.height())
+
+        painter.setPen(color)
+        painter.setFont(self.name_font)
+        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignBottom, str(index.data(Qt.DisplayRole)))
+        painter.setFont(self.secondary_font)
+        painter.drawText(secondary_rect, Qt.AlignLeft | Qt.AlignTop, str(index.data(SECONDARY_ROLE)))
+
+
+class PotItemDelegate(TileDelegate):
+    #paints the same tile PotsTab used to build out of a QWidget and two QLabels
+
+    BACKGROUND_COLOR = QColor("#CFDBD8")
+    RADIUS = 30
+
+    def paint(self, painter, option, index):
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+
+        rect = option.rect
+
+        background = QPainterPath()
+        background.addRoundedRect(QRectF(rect), self.RADIUS, self.RADIUS)
+        painter.fillPath(background, self.BACKGROUND_COLOR)
+
+        image_path = index.data(IMAGE_ROLE)
+
+        if image_path:
+            pixmap = thumbnail_pixmap(image_path, TILE_HEIGHT, TILE_HEIGHT)
+
+            if not pixmap.isNull():
+                image_rect = QRect(rect.left(), rect.top(), TILE_HEIGHT, TILE_HEIGHT)
+                clip = QPainterPath()
+                clip.addRoundedRect(QRectF(image_rect), self.RADIUS, self.RADIUS)
+                painter.setClipPath(clip)
+                painter.drawPixmap(image_rect, pixmap)
+                painter.setClipping(False)
+
+        self.paint_text(painter, rect.adjusted(TILE_HEIGHT + 7, 0, -7, 0), index, self.TEXT_COLOR)
+
+        painter.restore()
+
+
+class PlantItemDelegate(TileDelegate):
+    #the old plant labels showed the centre of the photo at its native size behind the text
+
+    NO_IMAGE_COLOR = QColor("#E9E5E3")
+    IMAGE_TEXT_COLOR = QColor("white")
+
+    def paint(self, painter, option, index):
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        rect = option.rect
+
+        background = QPainterPath()
+        background.addRoundedRect(QRectF(rect), self.RADIUS, self.RADIUS)
+
+        image_path = index.data(IMAGE_ROLE)
+        pixmap = thumbnail_pixmap(image_path, PLANT_STRIP_WIDTH, TILE_HEIGHT, "strip") if image_path else None
+
+        if pixmap is not None and not pixmap.isNull():
+            painter.setClipPath(background)
+
+            source = QRect(max(0, (pixmap.width() - rect.width()) // 2), max(0, (pixmap.height() - rect.height()) // 2),
+                           min(pixmap.width(), rect.width()), min(pixmap.height(), rect.height()))
+            target = QRect(rect.left() + (rect.width() - source.width()) // 2, rect.top() + (rect.height() - source.height()) // 2,
+                           source.width(), source.height())
+
+            painter.drawPixmap(target, pixmap, source)
+            painter.setClipping(False)
+            text_color = self.IMAGE_TEXT_COLOR
+        else:
+            painter.fillPath(background, self.NO_IMAGE_COLOR)
+            text_color = self.TEXT_COLOR
+
+        self.paint_text(painter, rect.adjusted(7, 0, -7, 0), index, text_color)
+
+        painter.restore()
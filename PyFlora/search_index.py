@@ -0,0 +1,188 @@
+from collections import defaultdict
+import gc
+
+# In-memory search over a few text fields per item (plant name + botanical name,
+# pot name + plant name). A prefix trie answers "starts with" queries and an n-gram
+# index answers "contains" queries; both are updated item by item.
+# With a loader the index is only built on the first search, so opening a tab with
+# a large catalogue does not pay for it.
+
+MAX_PREFIX_DEPTH = 3
+NGRAM_SIZES = (2, 3)
+
+
+class SearchIndex:
+
+    def __init__(self, loader=None):
+
+        self.loader = loader
+
+        self.fields = {}
+        self.trie = {}
+        self.grams = defaultdict(set)
+
+
+    def ensure_loaded(self):
+
+        if self.loader is not None:
+            loader, self.loader = self.loader, None
+            self.add_many(loader())
+
+
+    def add_many(self, items):
+
+        #the index is millions of small sets; pausing the cyclic GC keeps bulk builds from rescanning them
+        gc_enabled = gc.isenabled()
+        gc.disable()
+
+        try:
+            for item_id, *values in items:
+                self.add(item_id, *values)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+
+    def __len__(self):
+
+        self.ensure_loaded()
+
+        return len(self.fields)
+
+
+    def prefixes(self, value):
+
+        return [value[:length] for length in range(1, min(len(value), MAX_PREFIX_DEPTH) + 1)]
+
+
+    def ngrams(self, value):
+
+        return {value[i:i + size] for size in NGRAM_SIZES for i in range(len(value) - size + 1)}
+
+
+    def add(self, item_id, *values):
+
+        #items added or removed before the first search are picked up by the loader
+        if self.loader is not None:
+            return
+
+        if item_id in self.fields:
+            self.remove(item_id)
+
+        values = tuple(str(value).lower() for value in values if value)
+        self.fields[item_id] = values
+
+        for value in values:
+            node = self.trie
+
+            for char in value[:MAX_PREFIX_DEPTH]:
+                node = node.setdefault(char, {None: set()})
+                node[None].add(item_id)
+
+            for gram in self.ngrams(value):
+                self.grams[gram].add(item_id)
+
+
+    def remove(self, item_id):
+
+        if self.loader is not None:
+            return
+
+        values = self.fields.pop(item_id, None)
+
+        if values is None:
+            return
+
+        for value in values:
+            self.remove_from_trie(self.trie, value[:MAX_PREFIX_DEPTH], item_id)
+
+            for gram in self.ngrams(value):
+                ids = self.grams.get(gram)
+
+                if ids is not None:
+                    ids.discard(item_id)
+
+                    if not ids:
+                        del self.grams[gram]
+
+
+    def remove_from_trie(self, node, value, item_id):
+
+        if not value:
+            return
+
+        child = node.get(value[0])
+
+        if child is None:
+            return
+
+        child[None].discard(item_id)
+        self.remove_from_trie(child, value[1:], item_id)
+
+        if not child[None]:
+            del node[value[0]]
+
+
+    def update(self, item_id, *values):
+
+        self.add(item_id, *values)
+
+
+    def starts_with(self, text):
+
+        self.ensure_loaded()
+
+        text = text.lower()
+        node = self.trie
+
+        for char in text[:MAX_PREFIX_DEPTH]:
+            node = node.get(char)
+
+            if node is None:
+                return set()
+
+        ids = node[None] if text else set(self.fields)
+
+        if len(text) <= MAX_PREFIX_DEPTH:
+            return set(ids)
+
+        return {item_id for item_id in ids if any(value.startswith(text) for value in self.fields[item_id])}
+
+
+    def contains(self, text):
+
+        self.ensure_loaded()
+
+        text = text.lower()
+
+        if len(text) < min(NGRAM_SIZES):
+            return {item_id for item_id, values in self.fields.items() if any(text in value for value in values)}
+
+        if len(text) in NGRAM_SIZES:
+            return set(self.grams.get(text, ()))
+
+        size = max(NGRAM_SIZES)
+        postings = sorted((self.grams.get(text[i:i + size], set()) for i in range(len(text) - size + 1)), key=len)
+
+        candidates = set(postings[0])
+        for ids in postings[1:]:
+            candidates &= ids
+
+            if not candidates:
+                break
+
+        return {item_id for item_id in candidates if any(text in value for value in self.fields[item_id])}
+
+
+    def match(self, text):
+        #same rules the search boxes always used: one letter matches the start of a name,
+        #longer text matches anywhere; an empty search matches everything (None)
+
+        text = text.lower()
+
+        if not text:
+            return None
+        elif len(text) == 1:
+            return self.starts_with(text)
+        else:
+            return self.contains(text)
@@ -0,0 +1,131 @@
+import numpy as np
+
+# Vectorized versions of sensor_light, sensor_moisture and sensor_ph for generating
+# load and backfill data for many pots at once. Every function takes equally long
+# arrays (one entry per pot/reading) and returns NumPy arrays.
+
+LIGHT_OPTIONS = ["Shade", "Indirect sunlight", "Strong light", "Full sun"]
+
+#lux ranges per light option, columns: night, 6-9h, 9-17h, 17-19h (same values as sensor_light.calculate_intensity)
+LIGHT_LOW = np.array([
+    [0.0, 0.0, 0.0, 0.0],
+    [10, 100, 400, 100],
+    [10, 400, 1000, 400],
+    [10, 400, 2000, 400],
+    [10, 400, 5000, 400],
+], dtype=np.float64)
+
+LIGHT_HIGH = np.array([
+    [0.0, 0.0, 0.0, 0.0],
+    [100, 400, 1000, 400],
+    [100, 1000, 2000, 1000],
+    [100, 2000, 5000, 2000],
+    [100, 5000, 10000, 5000],
+], dtype=np.float64)
+
+#period boundaries in seconds of the day: 6h, 9h, 17h, 19h
+PERIOD_EDGES = np.array([6, 9, 17, 19]) * 3600
+PERIOD_COLUMNS = np.array([0, 1, 2, 3, 0])
+
+INITIAL_MOISTURE = {"Wet": 10.0, "Normal": 7.0, "Dry": 3.0}
+DEFAULT_INITIAL_MOISTURE = 10.0
+
+TEMPERATURE_WEIGHT = 0.6
+LIGHT_INTENSITY_WEIGHT = 0.4
+MOISTURE_DECREASE_RATE = 0.01 #per hour
+
+
+def lookup_codes(values, mapping, default):
+    #one vectorized comparison per known option instead of a Python lookup per element
+
+    values = np.asarray(values).astype(str)
+    codes = np.full(values.shape, default, dtype=np.asarray(list(mapping.values()) + [default]).dtype)
+
+    for key, code in mapping.items():
+        codes[values == key] = code
+
+    return codes.reshape(-1)
+
+
+def seconds_of_day(times):
+
+    times = np.asarray(times)
+
+    if np.issubdtype(times.dtype, np.datetime64):
+        return (times - times.astype("datetime64[D]")) / np.timedelta64(1, "s")
+
+    if np.issubdtype(times.dtype, np.number):
+        return times.astype(np.float64) % 86400
+
+    return np.array([time.hour * 3600 + time.minute * 60 + time.second + time.microsecond / 1000000 for time in times.ravel()], dtype=np.float64)
+
+
+def batch_light_intensity(options, times, rng=None):
+
+    rng = rng or np.random.default_rng()
+
+    option_codes = lookup_codes(options, {option: i + 1 for i, option in enumerate(LIGHT_OPTIONS)}, 0)
+    periods = PERIOD_COLUMNS[np.searchsorted(PERIOD_EDGES, seconds_of_day(times), side="right")]
+
+    low = LIGHT_LOW[option_codes, periods]
+    high = LIGHT_HIGH[option_codes, periods]
+
+    return np.round(rng.uniform(low, high), 2)
+
+
+def batch_initial_soil_moisture(moisture_options):
+
+    return lookup_codes(moisture_options, INITIAL_MOISTURE, DEFAULT_INITIAL_MOISTURE).astype(np.float64)
+
+
+def batch_soil_moisture(moisture_options, temperatures, light_intensities, time_deltas):
+
+    temperatures = np.asarray(temperatures, dtype=np.float64)
+    light_intensities = np.asarray(light_intensities, dtype=np.float64)
+    time_deltas = np.asarray(time_deltas, dtype=np.float64)
+
+    moisture_decrease = temperatures/100 * TEMPERATURE_WEIGHT + light_intensities/10000 * LIGHT_INTENSITY_WEIGHT + MOISTURE_DECREASE_RATE * time_deltas
+    moisture = batch_initial_soil_moisture(moisture_options) - moisture_decrease
+
+    return np.round(np.clip(moisture, 1, 10), 2)
+
+
+def parse_ph_ranges(soil_ph_ranges):
+
+    #ranges are free text, so each distinct string is parsed once
+    unique_ranges, inverse = np.unique(np.asarray(soil_ph_ranges).astype(str), return_inverse=True)
+    bounds = np.array([[float(value.strip()) for value in soil_ph_range.split("-")[:2]] for soil_ph_range in unique_ranges])
+
+    return bounds[inverse.reshape(-1), 0], bounds[inverse.reshape(-1), 1]
+
+
+def batch_soil_ph(soil_ph_ranges, rng=None):
+
+    rng = rng or np.random.default_rng()
+    min_values, max_values = parse_ph_ranges(soil_ph_ranges)
+
+    return np.round(rng.uniform(min_values, max_values), 2)
+
+
+def simulate_readings(light_options, moisture_options, soil_ph_ranges, times, temperatures, time_deltas=None, rng=None):
+    #time_deltas are hours since each pot's previous reading; NaN (or no array at all) means first reading
+
+    rng = rng or np.random.default_rng()
+
+    lux = batch_light_intensity(light_options, times, rng)
+
+    if time_deltas is None:
+        moisture = batch_initial_soil_moisture(moisture_options)
+    else:
+        time_deltas = np.asarray(time_deltas, dtype=np.float64)
+        first_reading = np.isnan(time_deltas)
+
+        moisture = batch_soil_moisture(moisture_options, temperatures, lux, np.where(first_reading, 0, time_deltas))
+        moisture = np.where(first_reading, batch_initial_soil_moisture(moisture_options), moisture)
+
+    return {
+        "light_intensity_lux": lux,
+        "soil_moisture": moisture,
+        "soil_ph": batch_soil_ph(soil_ph_ranges, rng)
+    }
+
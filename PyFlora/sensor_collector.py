@@ -0,0 +1,131 @@
+from pyflora_db import init_db
+from openweather_temp import current_temperature_ow
+from sensor_service import SensorReadingService
+import pyflora_config
+import datetime as dt
+import argparse
+import threading
+import random
+import signal
+import time
+
+# Headless sensor collection, meant to run as a service next to the GUI on the same
+# database: python sensor_collector.py [--interval S] [--jitter S] [--once]
+# Readings are taken on a fixed grid of interval slots. A pot whose last reading is a
+# few slots old first gets one reading per missed slot (at most max_catch_up), stamped
+# with the slot time, so stopping the collector or the machine leaves no gaps.
+# Pots that already have a reading in the current slot (e.g. synced from the GUI) are
+# skipped. SIGINT/SIGTERM stop it after the batch that is being written.
+
+
+def config_int(key):
+
+    return pyflora_config.get_int("collector", key)
+
+
+def slot_start(epoch, interval):
+
+    return epoch - epoch % interval
+
+
+def reading_times(last_entry_time, now, interval, max_catch_up):
+    #missed slots after the pot's last reading (stamped at the slot start) plus one reading for now
+
+    now_epoch = now.timestamp()
+    current_slot = slot_start(now_epoch, interval)
+
+    if last_entry_time is None:
+        return [now]
+
+    last_slot = slot_start(last_entry_time.timestamp(), interval)
+
+    if last_slot >= current_slot:
+        return []
+
+    first_slot = max(last_slot + interval, current_slot - max_catch_up * interval)
+    missed = [dt.datetime.fromtimestamp(first_slot + i * interval) for i in range(int((current_slot - first_slot) // interval))]
+
+    return missed + [now]
+
+
+class SensorCollector:
+
+    def __init__(self, engine, interval=None, jitter=None, max_catch_up=None, batch_size=None, temperature=current_temperature_ow):
+
+        self.engine = engine
+        self.interval = interval or config_int("interval_seconds")
+        self.jitter = jitter if jitter is not None else config_int("jitter_seconds")
+        self.max_catch_up = max_catch_up if max_catch_up is not None else config_int("max_catch_up")
+        self.batch_size = batch_size or config_int("batch_size")
+        self.service = SensorReadingService(engine, temperature, self.batch_size)
+
+        self.stop_event = threading.Event()
+
+
+    def stop(self, *args):
+
+        if not self.stop_event.is_set():
+            print("Stopping sensor collector...", flush=True)
+
+        self.stop_event.set()
+
+
+    def collect(self, now=None):
+        #one round: every pot with a sensor gets the readings it is missing, written batch_size rows per transaction
+
+        now = now or dt.datetime.now()
+
+        result = self.service.take_readings(current_time=now, reading_times=self.reading_times, should_stop=self.stop_event.is_set)
+
+        return result.readings
+
+
+    def reading_times(self, last_entry_time, now):
+
+        return reading_times(last_entry_time, now, self.interval, self.max_catch_up)
+
+
+    def next_run(self, now_epoch):
+
+        return slot_start(now_epoch, self.interval) + self.interval + random.uniform(0, self.jitter)
+
+
+    def run(self, once=False):
+
+        print(f"Sensor collector started: every {self.interval} s (+ up to {self.jitter} s jitter), database {self.engine.url.database}", flush=True)
+
+        while not self.stop_event.is_set():
+            started = time.time()
+
+            try:
+                written = self.collect()
+                print(f"{dt.datetime.now():%Y-%m-%d %H:%M:%S} Wrote {written} readings in {time.time() - started:.2f} s.", flush=True)
+            except Exception as error:
+                #a locked or unreachable database is retried on the next slot instead of ending the service
+                print(f"{dt.datetime.now():%Y-%m-%d %H:%M:%S} Collection failed: {error}", flush=True)
+
+            if once:
+                break
+
+            self.stop_event.wait(max(self.next_run(time.time()) - time.time(), 0))
+
+        self.engine.dispose()
+        print("Sensor collector stopped.", flush=True)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Collect sensor readings for every pot on a fixed interval.")
+    parser.add_argument("--interval", type=int, help="seconds between readings (default: [collector] interval_seconds)")
+    parser.add_argument("--jitter", type=int, help="random delay added to every run, in seconds")
+    parser.add_argument("--max-catch-up", type=int, help="missed intervals to fill in per pot")
+    parser.add_argument("--database", help="database file (default: the configured one)")
+    parser.add_argument("--once", action="store_true", help="collect one round and exit")
+    args = parser.parse_args()
+
+    collector = SensorCollector(init_db(args.database), args.interval, args.jitter, args.max_catch_up)
+
+    signal.signal(signal.SIGINT, collector.stop)
+    signal.signal(signal.SIGTERM, collector.stop)
+
+    collector.run(once=args.once)
@@ -0,0 +1,87 @@
+from pyflora_db import SensorReadings
+import datetime as dt
+
+# Readings as columns for plotting and analysis: one raw SQL query, rows go straight
+# from the sqlite cursor into a float64 matrix, no ORM objects and no per-row datetime.
+# Timestamps are epoch seconds, computed by SQLite the same way datetime.timestamp()
+# reads the naive local times stored in the table. NULL values come back as NaN.
+# numpy is imported inside the functions, so writing readings at start-up does not load it.
+
+SERIES = ["temperature_celsius", "light_intensity_lux", "soil_moisture", "soil_ph"]
+
+#the text format SQLAlchemy's DateTime uses in SQLite, so bounds compare as plain strings
+DB_TIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+def epoch_seconds(column):
+
+    return f"(julianday({column}, 'utc') - 2440587.5) * 86400.0"
+
+
+def db_time(epoch):
+
+    return dt.datetime.fromtimestamp(epoch).strftime(DB_TIME_FORMAT)
+
+
+def time_range_filter(column, start=None, end=None):
+    #start/end are epoch seconds; returns the SQL condition and its parameters
+
+    conditions, params = [], []
+
+    if start is not None:
+        conditions.append(f" AND {column} >= ?")
+        params.append(db_time(start))
+
+    if end is not None:
+        conditions.append(f" AND {column} <= ?")
+        params.append(db_time(end))
+
+    return "".join(conditions), params
+
+
+def fetch_matrix(engine, query, params):
+
+    import numpy as np
+
+    connection = engine.raw_connection()
+
+    try:
+        cursor = connection.cursor()
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+        cursor.close()
+    finally:
+        connection.close()
+
+    return np.array(rows, dtype=np.float64) if rows else None
+
+
+def empty_columns(columns=SERIES):
+
+    import numpy as np
+
+    data = {"id": np.empty(0, dtype=np.int64), "datetime": np.empty(0)}
+    data.update({name: np.empty(0) for name in columns})
+
+    return data
+
+
+def load_reading_columns(engine, pot_id, after_id=0, columns=SERIES, start=None, end=None):
+    #{"id": int64, "datetime": float64 epoch seconds, <column>: float64, ...}, ordered by time
+
+    import numpy as np
+
+    range_filter, range_params = time_range_filter("datetime", start, end)
+
+    query = (f"SELECT id, {epoch_seconds('datetime')}, {', '.join(columns)} FROM {SensorReadings.__tablename__} "
+             f"WHERE pot_id = ? AND id > ?{range_filter} ORDER BY datetime, id")
+
+    matrix = fetch_matrix(engine, query, [int(pot_id), int(after_id)] + range_params)
+
+    if matrix is None:
+        return empty_columns(columns)
+
+    data = {"id": matrix[:, 0].astype(np.int64), "datetime": np.ascontiguousarray(matrix[:, 1])}
+    data.update({name: np.ascontiguousarray(matrix[:, i + 2]) for i, name in enumerate(columns)})
+
+    return data
@@ -0,0 +1,192 @@
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtCore import QTimer
+from pyflora_db import get_engine
+from sensor_columns import SERIES, load_reading_columns
+from sensor_rollups import history_extent, pick_resolution, load_rollup_columns
+from downsampling import MAX_POINTS, minmax_downsample, visible_slice
+
+LEFT_LABEL = '<span style="color:#523D35">Soil pH,</span> <span style="color:#5E9299">Soil Moisture,</span> <span style="color:#E07D54">Temperature(°C)</span> '
+RIGHT_LABEL = '<span style="color:#DB9600">Light Intensity (LUX)</span>'
+
+REDRAW_DELAY = 50 #ms after the last zoom/pan step
+
+
+class SensorGraph:
+    #the plot items are built once; switching pots reloads the data, syncing and watering only append new readings.
+    #The visible range is read at the finest resolution that fits (raw readings, hourly or daily rollups) plus one
+    #view width on each side; curves get the visible part of it, decimated to MAX_POINTS, and zoom/pan re-checks both
+
+    def __init__(self, plot_widget):
+
+        self.plot_widget = plot_widget
+        self.plot_widget.setBackground('#E9E5E3')
+
+        p = self.plot_widget.getPlotItem()
+        p.setContentsMargins(0, 10, 0, 10)
+        p.setTitle("Sensor readings")
+        p.setAxisItems({'bottom': pg.DateAxisItem(orientation='bottom')})
+
+        self.light_view = pg.ViewBox()
+        p.scene().addItem(self.light_view)
+        p.getAxis('right').linkToView(self.light_view)
+        self.light_view.setXLink(p)
+
+        self.curves = {
+            "temperature_celsius": pg.PlotCurveItem(pen=pg.mkPen(color='#E07D54', width=2), name='Temperature'),
+            "light_intensity_lux": pg.PlotCurveItem(pen=pg.mkPen(color='#DB9600', width=2), name='Light Intensity'),
+            "soil_moisture": pg.PlotCurveItem(pen=pg.mkPen(color='#5E9299', width=2), name='Soil Moisture'),
+            "soil_ph": pg.PlotCurveItem(pen=pg.mkPen(color='#523D35', width=2), name='Soil pH')
+        }
+
+        p.addItem(self.curves["temperature_celsius"])
+        p.addItem(self.curves["soil_moisture"])
+        p.addItem(self.curves["soil_ph"])
+        #self.light_view.addItem(self.curves["light_intensity_lux"])
+
+        self.plot_widget.setLabel('left', LEFT_LABEL)
+        self.plot_widget.setLabel('right', RIGHT_LABEL)
+        self.plot_widget.setLabel('bottom', 'Time')
+
+        p.vb.sigResized.connect(self.update_light_view)
+        self.update_light_view()
+
+        self.redraw_timer = QTimer()
+        self.redraw_timer.setSingleShot(True)
+        self.redraw_timer.setInterval(REDRAW_DELAY)
+        self.redraw_timer.timeout.connect(self.update_view)
+        p.vb.sigXRangeChanged.connect(self.redraw_timer.start)
+
+        self.max_points = MAX_POINTS
+        self.pot_id = None
+        self.clear_data()
+
+
+    def clear_data(self):
+
+        self.resolution = None
+        self.loaded_range = None
+        self.extent = None
+        self.last_reading_id = 0
+        self.x_data = np.empty(0)
+        self.y_data = {name: np.empty(0) for name in SERIES}
+
+
+    def update_light_view(self):
+
+        p = self.plot_widget.getPlotItem()
+        self.light_view.setGeometry(p.vb.sceneBoundingRect())
+        self.light_view.linkedViewChanged(p.vb, self.light_view.XAxis)
+
+
+    def fetch_readings(self, pot_id, after_id, start=None, end=None):
+
+        return load_reading_columns(get_engine(), pot_id, after_id, SERIES, start, end)
+
+
+    def show_pot(self, pot_id):
+
+        pot_id = int(pot_id) if pot_id is not None else None
+
+        if pot_id != self.pot_id:
+            self.pot_id = pot_id
+            self.clear_data()
+            self.plot_widget.getPlotItem().enableAutoRange()
+
+        self.append_new_readings()
+
+
+    def view_range(self):
+
+        view_box = self.plot_widget.getPlotItem().vb
+
+        if view_box.autoRangeEnabled()[0] or self.extent is None:
+            return self.extent
+
+        return tuple(view_box.viewRange()[0])
+
+
+    def load_range(self, x_min, x_max):
+
+        self.resolution = pick_resolution(get_engine(), self.pot_id, x_min, x_max)
+
+        padding = max(x_max - x_min, 1.0)
+        start, end = max(x_min - padding, self.extent[0]), min(x_max + padding, self.extent[1])
+
+        #ranges that reach either end of the history are read without that bound
+        start_bound = start if start > self.extent[0] else None
+        end_bound = end if end < self.extent[1] else None
+
+        if self.resolution == "raw":
+            data = self.fetch_readings(self.pot_id, 0, start_bound, end_bound)
+            self.last_reading_id = int(data["id"].max()) if len(data["id"]) else 0
+        else:
+            data = load_rollup_columns(get_engine(), self.pot_id, self.resolution, SERIES, start_bound, end_bound)
+
+        self.loaded_range = (start, end)
+        self.x_data = data["datetime"]
+        self.y_data = {name: data[name] for name in SERIES}
+
+
+    def append_new_readings(self):
+
+        if self.pot_id is None:
+            self.redraw()
+            return
+
+        previous_extent = self.extent
+        self.extent = history_extent(get_engine(), self.pot_id)
+
+        if self.extent is None:
+            self.clear_data()
+            self.redraw()
+            return
+
+        #raw data that already reaches the newest reading only needs what was added since
+        if self.resolution == "raw" and previous_extent is not None and self.loaded_range[1] >= previous_extent[1]:
+            readings = self.fetch_readings(self.pot_id, self.last_reading_id)
+
+            if len(readings["id"]):
+                self.x_data = np.concatenate([self.x_data, readings["datetime"]])
+
+                for name in SERIES:
+                    self.y_data[name] = np.concatenate([self.y_data[name], readings[name]])
+
+                self.last_reading_id = max(self.last_reading_id, int(readings["id"].max()))
+                self.loaded_range = (self.loaded_range[0], self.extent[1])
+                self.redraw()
+
+            return
+
+        self.load_range(*self.view_range())
+        self.redraw()
+
+
+    def update_view(self):
+
+        if self.pot_id is None or self.extent is None:
+            return
+
+        x_min, x_max = self.view_range()
+        covered = self.loaded_range[0] <= max(x_min, self.extent[0]) and min(x_max, self.extent[1]) <= self.loaded_range[1]
+
+        if not covered or pick_resolution(get_engine(), self.pot_id, x_min, x_max) != self.resolution:
+            self.load_range(x_min, x_max)
+
+        self.redraw()
+
+
+    def redraw(self):
+
+        x_data = self.x_data
+        start, stop = 0, len(x_data)
+
+        view_box = self.plot_widget.getPlotItem().vb
+
+        if stop and not view_box.autoRangeEnabled()[0]:
+            x_min, x_max = view_box.viewRange()[0]
+            start, stop = visible_slice(x_data, x_min, x_max, padding=x_max - x_min)
+
+        for name, curve in self.curves.items():
+            x_values, y_values = minmax_downsample(x_data[start:stop], self.y_data[name][start:stop], self.max_points)
+            curve.setData(x_values, y_values)
@@ -17,7 +17,8 @@ def initial_soil_moisture(moisture_option):
 
 def measure_soil_moisture(moisture_option, current_temperature, current_light_intensity, time_delta):
 
-    temperature_coefficient = current_temperature/100
+    #a reading taken while no temperature was known dries the soil by light and time alone
+    temperature_coefficient = current_temperature/100 if current_temperature is not None else 0
     light_coefficient = current_light_intensity/10000
 
     temperature_weight = 0.6 
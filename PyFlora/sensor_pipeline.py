@@ -0,0 +1,287 @@
+from sqlalchemy.orm import Session
+from openweather_temp import API_KEY, CITY, WEATHER_URL, CACHE_TTL, REQUEST_TIMEOUT, CircuitBreaker, ReplayWeatherBackend, place_params, parse_temperature
+from sensor_service import SensorReadingService
+import sensor_sync
+import pyflora_config
+from collections import namedtuple
+import datetime as dt
+import aiohttp
+import asyncio
+import time
+
+# Asynchronous collection for large fleets. Worker tasks take pots from a queue, get the
+# temperature for the pot's place (weather_locations.py) through AsyncWeatherClient (at
+# most max_requests HTTP requests in flight, one request per place and TTL) and compute
+# the reading. Rows go through a bounded queue to a single writer task, which writes
+# batch_size rows per transaction in a thread, so the event loop keeps fetching while
+# SQLite writes and a slow database makes the workers wait instead of piling rows up.
+# A failed write stops the workers and is raised from collect_async.
+# The weather url, api_key and backend come from the [weather] section of pyflora.ini;
+# with backend = replay the recorded responses are served from a thread instead of HTTP.
+# When the weather service fails, pots get their city's last known temperature, or the
+# newest one in the database among the pots of that city; pots with neither get a reading
+# without a temperature and are counted in no_temperature.
+
+MAX_REQUESTS = 100
+WORKERS = 200
+QUEUE_SIZE = 5000
+BATCH_SIZE = 2000
+
+PipelineReport = namedtuple("PipelineReport", ["pots", "readings", "no_temperature", "stale", "requests", "seconds"])
+
+
+class AsyncWeatherClient:
+
+    def __init__(self, http_session, url=WEATHER_URL, api_key=API_KEY, max_requests=MAX_REQUESTS, ttl=CACHE_TTL, breaker=None, backend=None):
+
+        self.http_session = http_session
+        self.url = url
+        self.api_key = api_key
+        self.backend = backend
+        self.ttl = ttl
+        self.semaphore = asyncio.Semaphore(max_requests)
+        self.breaker = breaker or CircuitBreaker()
+
+        self.requests = 0
+        self.stale = 0
+        self._cache = {}
+        self._in_flight = {}
+
+
+    async def current_temperature(self, city):
+        #pots of the same city share one response; callers that arrive while it is on its way wait for it.
+        #a failed request or an open breaker gives the city's last known temperature, however old
+
+        cached = self._cache.get(city)
+
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+
+        task = self._in_flight.get(city)
+
+        if task is None:
+            if not self.breaker.allow_request():
+                return self.last_known(cached)
+
+            task = self._in_flight[city] = asyncio.ensure_future(self.fetch_temperature(city))
+
+        try:
+            temperature_celsius = await asyncio.shield(task)
+        finally:
+            self._in_flight.pop(city, None)
+
+        if temperature_celsius is None:
+            return self.last_known(cached)
+
+        self._cache[city] = (time.monotonic(), temperature_celsius)
+
+        return temperature_celsius
+
+
+    def last_known(self, cached):
+
+        if cached is None:
+            return None
+
+        self.stale += 1
+
+        return cached[1]
+
+
+    async def fetch_temperature(self, city):
+
+        if self.backend is not None:
+            return await self.fetch_from_backend(city)
+
+        params = dict(place_params(city), units='metric', appid=self.api_key)
+
+        async with self.semaphore:
+            self.requests += 1
+
+            try:
+                async with self.http_session.get(self.url, params=params) as response:
+                    data = await response.json(content_type=None)
+                    temperature_celsius = parse_temperature(response.status, data)
+
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as error:
+                print("Failed to retrieve weather data.", error)
+                temperature_celsius = None
+
+        if temperature_celsius is None:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+        return temperature_celsius
+
+
+    async def fetch_from_backend(self, city):
+        #a blocking backend (replay) answers in a thread, the breaker does not apply to recorded responses
+
+        self.requests += 1
+
+        return await asyncio.to_thread(self.backend.fetch_temperature, city)
+
+
+def weather_settings(url=None, api_key=None, backend=None):
+    #(url, api_key, blocking backend or None) with anything not given taken from [weather]
+
+    url = url or pyflora_config.get("weather", "url") or WEATHER_URL
+    api_key = api_key or pyflora_config.get("weather", "api_key") or API_KEY
+    backend = backend or pyflora_config.get("weather", "backend")
+
+    if backend == "replay":
+        return url, api_key, ReplayWeatherBackend(pyflora_config.get_path("weather", "replay_file"))
+
+    if backend != "openweather":
+        raise ValueError(f"Unknown weather backend: {backend}")
+
+    return url, api_key, None
+
+
+class LastKnownTemperatures:
+    #newest temperature in the database among the pots of a city, only looked up for a city whose weather failed, once per city
+
+    def __init__(self, service, pots, city_of):
+
+        self.service = service
+        self.pot_ids = {}
+        self._lookups = {}
+
+        for pot in pots:
+            self.pot_ids.setdefault(city_of(pot), []).append(pot.id)
+
+
+    async def temperature(self, city):
+
+        lookup = self._lookups.get(city)
+
+        if lookup is None:
+            lookup = self._lookups[city] = asyncio.ensure_future(asyncio.to_thread(self.service.last_known_temperature, self.pot_ids.get(city, [])))
+
+        last_known = await asyncio.shield(lookup)
+
+        return last_known[0] if last_known else None
+
+
+def load_pots(service, pot_ids=None):
+    #(pots with a sensor, {pot id: last reading time}, {pot id: weather place})
+
+    with Session(bind=service.engine) as session:
+        _, pots, last_entry_times, places = service.load_pots(session, pot_ids)
+
+    return pots, last_entry_times, places
+
+
+async def reading_worker(pot_queue, row_queue, weather, city_of, last_entry_times, current_time, last_known, no_temperature):
+
+    while True:
+        pot = await pot_queue.get()
+
+        if pot is None:
+            return
+
+        city = city_of(pot)
+        current_temperature = await weather.current_temperature(city)
+
+        if current_temperature is None:
+            #a city that never answered during an outage: like SensorReadingService, go on with the newest temperature of its pots
+            current_temperature = await last_known.temperature(city)
+
+            if current_temperature is not None:
+                weather.stale += 1
+
+        if current_temperature is None:
+            no_temperature.append(pot.id)
+
+        await row_queue.put(sensor_sync.build_reading(pot, current_time, current_temperature, last_entry_times.get(pot.id)))
+
+
+async def batch_writer(service, row_queue, batch_size):
+
+    written = 0
+    batch = []
+
+    while True:
+        row = await row_queue.get()
+
+        if row is not None:
+            batch.append(row)
+
+        if batch and (row is None or len(batch) >= batch_size or row_queue.empty()):
+            written += await asyncio.to_thread(service.write_readings, batch)
+            batch = []
+
+        if row is None:
+            return written
+
+
+async def collect_async(engine, pot_ids=None, url=None, api_key=None, backend=None, city_of=None, current_time=None,
+                        max_requests=MAX_REQUESTS, workers=WORKERS, queue_size=QUEUE_SIZE, batch_size=BATCH_SIZE, ttl=CACHE_TTL):
+
+    started = time.perf_counter()
+
+    url, api_key, weather_backend = weather_settings(url, api_key, backend)
+
+    current_time = current_time or dt.datetime.now()
+
+    service = SensorReadingService(engine, batch_size=batch_size)
+    pots, last_entry_times, places = await asyncio.to_thread(load_pots, service, pot_ids)
+
+    city_of = city_of or (lambda pot: places[pot.id] or CITY)
+    last_known = LastKnownTemperatures(service, pots, city_of)
+
+    pot_queue = asyncio.Queue()
+    for pot in pots:
+        pot_queue.put_nowait(pot)
+    for _ in range(workers):
+        pot_queue.put_nowait(None)
+
+    row_queue = asyncio.Queue(maxsize=queue_size)
+    no_temperature = []
+
+    connector = aiohttp.TCPConnector(limit=max_requests)
+    timeout = aiohttp.ClientTimeout(sock_connect=REQUEST_TIMEOUT[0], sock_read=REQUEST_TIMEOUT[1])
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as http_session:
+        weather = AsyncWeatherClient(http_session, url, api_key, max_requests, ttl, backend=weather_backend)
+        writer = asyncio.create_task(batch_writer(service, row_queue, batch_size))
+        readers = asyncio.gather(*[reading_worker(pot_queue, row_queue, weather, city_of, last_entry_times, current_time, last_known, no_temperature) for _ in range(workers)])
+
+        done, _ = await asyncio.wait([readers, writer], return_when=asyncio.FIRST_COMPLETED)
+
+        if writer in done:
+            #the writer only stops early when a write failed (disk full, database locked); the workers would wait on the full row queue forever
+            readers.cancel()
+            await asyncio.gather(readers, return_exceptions=True)
+            writer.result()
+
+        if readers.exception() is not None:
+            writer.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
+            raise readers.exception()
+
+        await row_queue.put(None)
+
+        written = await writer
+
+    return PipelineReport(len(pots), written, len(no_temperature), weather.stale, weather.requests, time.perf_counter() - started)
+
+
+def run_pipeline(engine, **kwargs):
+
+    return asyncio.run(collect_async(engine, **kwargs))
+
+
+if __name__ == "__main__":
+
+    #python sensor_pipeline.py [weather url]: one asynchronous round over every pot in the configured database,
+    #a url given here asks that OpenWeather compatible service whatever [weather] backend says
+    from pyflora_db import init_db
+    import sys
+
+    if len(sys.argv) > 1:
+        report = run_pipeline(init_db(), url=sys.argv[1], backend="openweather")
+    else:
+        report = run_pipeline(init_db())
+    print(f"{report.readings} readings for {report.pots} pots ({report.no_temperature} without temperature, {report.stale} with a stale one, {report.requests} weather requests) in {report.seconds:.2f} s")
@@ -0,0 +1,219 @@
+from sensor_columns import db_time
+from pyflora_db import SensorReadings, SensorRollupsHourly
+import sensor_rollups
+from collections import namedtuple
+import pyflora_config
+import argparse
+import time
+import os
+
+# Keeps pyflora.db from growing forever: raw readings are kept for raw_days, after that
+# only their hourly rollups are left, and hourly rollups are kept for hourly_days, after
+# that only the daily ones ([retention] in pyflora_config, RAW_DAYS and HOURLY_DAYS
+# when a setting is missing). Watering readings are never deleted, and readings only go
+# once their rollups are built. The app only does this with [retention] enabled = yes.
+# Rows are deleted BATCH_SIZE at a time, each batch in its own short transaction with a
+# pause in between, so a sync never waits long for the write lock.
+
+RAW_DAYS = 30
+HOURLY_DAYS = 365
+BATCH_SIZE = 2000
+BATCH_PAUSE = 0.05 #seconds between batches
+VACUUM_PAGES = 2000 #pages returned to the file system per incremental vacuum step
+
+RetentionReport = namedtuple("RetentionReport", ["readings_deleted", "hourly_deleted", "bytes_freed", "bytes_reclaimed", "seconds"])
+
+
+def database_path(engine):
+
+    return engine.url.database
+
+
+def database_pages(engine):
+    #(page size, page count, free pages)
+
+    with engine.connect() as connection:
+        page_size = connection.exec_driver_sql("PRAGMA page_size").scalar()
+        page_count = connection.exec_driver_sql("PRAGMA page_count").scalar()
+        free_pages = connection.exec_driver_sql("PRAGMA freelist_count").scalar()
+
+    return page_size, page_count, free_pages
+
+
+def file_size(engine):
+
+    path = database_path(engine)
+
+    return os.path.getsize(path) if path and os.path.exists(path) else 0
+
+
+def delete_in_batches(engine, table_name, condition, params, batch_size=BATCH_SIZE, pause=BATCH_PAUSE, should_stop=None):
+    #walks the table in rowid order so every batch is a short index range, not a new scan from the start
+
+    deleted = 0
+    last_rowid = 0
+
+    while not (should_stop and should_stop()):
+
+        with engine.begin() as connection:
+            rowids = [row[0] for row in connection.exec_driver_sql(
+                f"SELECT rowid FROM {table_name} WHERE rowid > ? AND {condition} ORDER BY rowid LIMIT ?",
+                (last_rowid, *params, batch_size))]
+
+            if not rowids:
+                break
+
+            connection.exec_driver_sql(f"DELETE FROM {table_name} WHERE rowid IN ({', '.join('?' * len(rowids))})", tuple(rowids))
+
+        deleted += len(rowids)
+        last_rowid = rowids[-1]
+
+        if len(rowids) < batch_size:
+            break
+
+        time.sleep(pause)
+
+    return deleted
+
+
+def delete_old_readings(engine, cutoff, batch_size=BATCH_SIZE, pause=BATCH_PAUSE, should_stop=None):
+
+    return delete_in_batches(engine, SensorReadings.__tablename__, "datetime < ? AND watering_timestamp IS NULL",
+                             (db_time(cutoff),), batch_size, pause, should_stop)
+
+
+def delete_old_hourly_rollups(engine, cutoff, batch_size=BATCH_SIZE, pause=BATCH_PAUSE, should_stop=None):
+
+    return delete_in_batches(engine, SensorRollupsHourly.__tablename__, "bucket_start < ?",
+                             (db_time(cutoff),), batch_size, pause, should_stop)
+
+
+def enabled():
+
+    return pyflora_config.get("retention", "enabled").lower() in ("1", "yes", "true", "on")
+
+
+def configured_days(key, default):
+    #None keeps that level forever
+
+    value = pyflora_config.get("retention", key)
+
+    if value is None:
+        return default
+
+    return int(value) if value.strip() else None
+
+
+def configured_interval():
+    #seconds between two clean-ups in the app
+
+    return pyflora_config.get_int("retention", "interval_hours", 6) * 3600
+
+
+def configured_vacuum():
+
+    return pyflora_config.get("retention", "vacuum").lower() in ("1", "yes", "true", "on")
+
+
+def incremental_vacuum_enabled(engine):
+
+    with engine.connect() as connection:
+        return connection.exec_driver_sql("PRAGMA auto_vacuum").scalar() == 2
+
+
+def enable_incremental_vacuum(engine):
+    #auto_vacuum can only be switched on an empty database or by a full VACUUM, which rewrites the whole file
+    #and holds the write lock until it is done: minutes on a large database. Only done when asked for (--convert)
+
+    if incremental_vacuum_enabled(engine):
+        return False
+
+    with engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+        connection.exec_driver_sql("VACUUM")
+
+    return True
+
+
+def incremental_vacuum(engine, pages=VACUUM_PAGES, pause=BATCH_PAUSE, should_stop=None):
+    #gives free pages back to the file system a few at a time; False when the database was never converted
+
+    if not incremental_vacuum_enabled(engine):
+        print("The database does not use incremental vacuum yet, run sensor_retention.py --convert once to switch it.")
+        return False
+
+    while not (should_stop and should_stop()):
+        free_pages = database_pages(engine)[2]
+
+        if not free_pages:
+            break
+
+        #sqlite3 steps the pragma once per execute(), which frees a single page; a script runs it to the end
+        connection = engine.raw_connection()
+
+        try:
+            connection.driver_connection.executescript(f"PRAGMA incremental_vacuum({min(free_pages, pages)});")
+        finally:
+            connection.close()
+
+        time.sleep(pause)
+
+    return True
+
+
+def apply_retention(engine, raw_days=RAW_DAYS, hourly_days=HOURLY_DAYS, vacuum=False, now=None,
+                    batch_size=BATCH_SIZE, pause=BATCH_PAUSE, should_stop=None):
+
+    started = time.perf_counter()
+    now = now if now is not None else time.time()
+
+    #raw readings may only go once their rollups exist
+    sensor_rollups.ensure_backfilled(engine)
+
+    size_before = file_size(engine)
+    page_size, _, free_before = database_pages(engine)
+
+    readings_deleted = hourly_deleted = 0
+
+    if raw_days is not None:
+        readings_deleted = delete_old_readings(engine, now - raw_days * 86400, batch_size, pause, should_stop)
+
+    if hourly_days is not None:
+        hourly_deleted = delete_old_hourly_rollups(engine, now - hourly_days * 86400, batch_size, pause, should_stop)
+
+    _, _, free_after = database_pages(engine)
+    bytes_freed = max(free_after - free_before, 0) * page_size
+
+    if vacuum:
+        incremental_vacuum(engine, pause=pause, should_stop=should_stop)
+
+    bytes_reclaimed = max(size_before - file_size(engine), 0)
+
+    return RetentionReport(readings_deleted, hourly_deleted, bytes_freed, bytes_reclaimed, time.perf_counter() - started)
+
+
+def format_report(report):
+
+    return (f"Deleted {report.readings_deleted} readings and {report.hourly_deleted} hourly rollups in {report.seconds:.1f} s, "
+            f"{report.bytes_freed / 1024:.0f} KiB freed inside the database, {report.bytes_reclaimed / 1024:.0f} KiB returned to the disk.")
+
+
+if __name__ == "__main__":
+
+    #python sensor_retention.py [--raw-days N] [--hourly-days N] [--vacuum] [--convert] [--database PATH], e.g. from a scheduled task
+    parser = argparse.ArgumentParser(description="Delete old sensor readings from pyflora.db, keeping their rollups.")
+    parser.add_argument("--raw-days", type=int, default=configured_days("raw_days", RAW_DAYS), help="days of raw readings to keep")
+    parser.add_argument("--hourly-days", type=int, default=configured_days("hourly_days", HOURLY_DAYS), help="days of hourly rollups to keep")
+    parser.add_argument("--vacuum", action="store_true", default=configured_vacuum(), help="give freed pages back to the file system")
+    parser.add_argument("--convert", action="store_true", help="switch the database to incremental vacuum first; a full VACUUM that locks the database while it runs")
+    parser.add_argument("--database", help="database file (default: the configured one)")
+    args = parser.parse_args()
+
+    from pyflora_db import init_db
+
+    engine = init_db(args.database)
+
+    if args.convert and enable_incremental_vacuum(engine):
+        print("Switched the database to incremental vacuum.")
+
+    print(format_report(apply_retention(engine, args.raw_days, args.hourly_days, args.vacuum)))
@@ -0,0 +1,367 @@
+import sqlalchemy as db
+from sqlalchemy.orm import Session
+from pyflora_db import SensorReadings, SensorRollupsHourly, SensorRollupsDaily
+from sensor_columns import SERIES, DB_TIME_FORMAT, epoch_seconds, time_range_filter, fetch_matrix
+import datetime as dt
+
+# Hourly and daily min/max/mean/count per pot, so long histories are read from a few
+# hundred rollup rows instead of millions of readings.
+# add_readings folds new readings into their buckets in the same transaction that
+# inserts them; backfill_rollups rebuilds the buckets from SensorReadings (hourly)
+# and from the hourly rollups (daily). Once sensor_retention has deleted old readings,
+# only the buckets after the oldest reading left are rebuilt, the older ones are all
+# that remains of those readings.
+
+RESOLUTIONS = {
+    "hourly": (SensorRollupsHourly, 3600, "%Y-%m-%d %H:00:00.000000"),
+    "daily": (SensorRollupsDaily, 86400, "%Y-%m-%d 00:00:00.000000")
+}
+
+#the graph reads raw readings up to this many, hourly rollups up to ROLLUP_POINTS buckets, daily rollups beyond that
+RAW_LIMIT = 20000
+ROLLUP_POINTS = 2000
+
+MERGE_SQL = {} #table: upsert statement, see merge_sql
+
+
+def bucket_start(value, resolution):
+
+    if resolution == "hourly":
+        return value.replace(minute=0, second=0, microsecond=0)
+
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def reading_value(reading, name):
+
+    return reading[name] if isinstance(reading, dict) else getattr(reading, name)
+
+
+def empty_bucket(pot_id, start):
+
+    bucket = {"pot_id": pot_id, "bucket_start": start, "reading_count": 0}
+
+    for name in SERIES:
+        bucket.update({f"{name}_count": 0, f"{name}_sum": 0.0, f"{name}_min": None, f"{name}_max": None})
+
+    return bucket
+
+
+def aggregate_readings(readings, resolution):
+
+    buckets = {}
+
+    for reading in readings:
+        reading_time = reading_value(reading, "datetime")
+
+        if reading_time is None:
+            continue
+
+        pot_id = reading_value(reading, "pot_id")
+        start = bucket_start(reading_time, resolution)
+        bucket = buckets.get((pot_id, start))
+
+        if bucket is None:
+            bucket = buckets[(pot_id, start)] = empty_bucket(pot_id, start)
+
+        bucket["reading_count"] += 1
+
+        for name in SERIES:
+            value = reading_value(reading, name)
+
+            if value is None:
+                continue
+
+            bucket[f"{name}_count"] += 1
+            bucket[f"{name}_sum"] += value
+            bucket[f"{name}_min"] = value if bucket[f"{name}_min"] is None else min(bucket[f"{name}_min"], value)
+            bucket[f"{name}_max"] = value if bucket[f"{name}_max"] is None else max(bucket[f"{name}_max"], value)
+
+    return list(buckets.values())
+
+
+def bucket_columns():
+
+    columns = ["pot_id", "bucket_start", "reading_count"]
+
+    for name in SERIES:
+        columns += [f"{name}_count", f"{name}_sum", f"{name}_min", f"{name}_max"]
+
+    return columns
+
+
+def merge_sql(table):
+    #adds a bucket to an existing one; SQLite's min()/max() with a NULL argument return NULL, hence the coalesce.
+    #Plain SQL, built once per table: SQLAlchemy does not cache ON CONFLICT statements and compiled it again for every write
+
+    sql = MERGE_SQL.get(table)
+
+    if sql is not None:
+        return sql
+
+    columns = bucket_columns()
+    merged = ["reading_count = reading_count + excluded.reading_count"]
+
+    for name in SERIES:
+        count, total, low, high = f"{name}_count", f"{name}_sum", f"{name}_min", f"{name}_max"
+
+        merged += [f"{count} = {count} + excluded.{count}",
+                   f"{total} = coalesce({total}, 0.0) + coalesce(excluded.{total}, 0.0)",
+                   f"{low} = min(coalesce({low}, excluded.{low}), coalesce(excluded.{low}, {low}))",
+                   f"{high} = max(coalesce({high}, excluded.{high}), coalesce(excluded.{high}, {high}))"]
+
+    sql = MERGE_SQL[table] = (f"INSERT INTO {table.__tablename__} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+                              f"ON CONFLICT (pot_id, bucket_start) DO UPDATE SET {', '.join(merged)}")
+
+    return sql
+
+
+def add_readings(session, readings):
+    #readings are dicts or SensorReadings objects; the caller commits together with the readings themselves
+
+    count = 0
+    columns = bucket_columns()
+
+    for resolution, (table, _, _) in RESOLUTIONS.items():
+        buckets = aggregate_readings(readings, resolution)
+
+        if buckets:
+            rows = [tuple(bucket[column] if column != "bucket_start" else bucket[column].strftime(DB_TIME_FORMAT) for column in columns) for bucket in buckets]
+            session.connection().exec_driver_sql(merge_sql(table), rows)
+            count += len(buckets)
+
+    return count
+
+
+def delete_rollups(session, pot_ids=None, since=None):
+
+    for table, _, _ in RESOLUTIONS.values():
+        query = db.delete(table)
+
+        if pot_ids is not None:
+            query = query.where(table.pot_id.in_(pot_ids))
+
+        if since is not None:
+            query = query.where(table.bucket_start >= since)
+
+        session.execute(query)
+
+
+def rebuild_start(session, pot_ids=None):
+    #None when the readings are all still there; otherwise the first whole day after the oldest reading retention left,
+    #or False when no readings are left at all. Kept watering readings do not count, they are older than the rest
+
+    oldest_query = db.select(db.func.min(SensorReadings.datetime)).where(SensorReadings.watering_timestamp.is_(None))
+
+    if pot_ids is not None:
+        oldest_query = oldest_query.where(SensorReadings.pot_id.in_(pot_ids))
+
+    oldest = session.execute(oldest_query).scalar()
+
+    for resolution, (table, _, _) in RESOLUTIONS.items():
+        older_query = db.select(table.pot_id).limit(1)
+
+        if oldest is not None:
+            older_query = older_query.where(table.bucket_start < bucket_start(oldest, resolution))
+
+        if pot_ids is not None:
+            older_query = older_query.where(table.pot_id.in_(pot_ids))
+
+        if session.execute(older_query).first() is not None:
+            return bucket_start(oldest, "daily") + dt.timedelta(days=1) if oldest is not None else False
+
+    return None
+
+
+def backfill_query(resolution, pot_ids=None, since=None):
+
+    table, _, bucket_format = RESOLUTIONS[resolution]
+
+    if resolution == "hourly":
+        source = SensorReadings
+        bucket = db.func.strftime(bucket_format, SensorReadings.datetime)
+        columns = [db.func.count()]
+
+        for name in SERIES:
+            value = getattr(SensorReadings, name)
+            columns += [db.func.count(value), db.func.total(value), db.func.min(value), db.func.max(value)]
+
+        query = db.select(SensorReadings.pot_id, bucket, *columns).where(SensorReadings.datetime.is_not(None))
+
+        if since is not None:
+            query = query.where(SensorReadings.datetime >= since)
+
+    else:
+        source = SensorRollupsHourly
+        bucket = db.func.strftime(bucket_format, SensorRollupsHourly.bucket_start)
+        columns = [db.func.sum(SensorRollupsHourly.reading_count)]
+
+        for name in SERIES:
+            columns += [db.func.sum(getattr(SensorRollupsHourly, f"{name}_count")), db.func.total(getattr(SensorRollupsHourly, f"{name}_sum")),
+                        db.func.min(getattr(SensorRollupsHourly, f"{name}_min")), db.func.max(getattr(SensorRollupsHourly, f"{name}_max"))]
+
+        query = db.select(SensorRollupsHourly.pot_id, bucket, *columns)
+
+        if since is not None:
+            query = query.where(SensorRollupsHourly.bucket_start >= since)
+
+    if pot_ids is not None:
+        query = query.where(source.pot_id.in_(pot_ids))
+
+    query = query.group_by(source.pot_id, bucket)
+
+    return db.insert(table).from_select(bucket_columns(), query)
+
+
+def backfill_rollups(session, pot_ids=None):
+    #rebuilds the rollups of the given pots (all pots by default) from the readings in the database;
+    #returns the time it rebuilt from (None: everything, False: nothing, no readings are left)
+
+    since = rebuild_start(session, pot_ids)
+
+    if since is False:
+        return since
+
+    delete_rollups(session, pot_ids, since)
+
+    session.execute(backfill_query("hourly", pot_ids, since))
+    session.execute(backfill_query("daily", pot_ids, since))
+    session.commit()
+
+    return since
+
+
+def ensure_backfilled(engine):
+    #databases that had readings before the rollup tables existed get them built once
+
+    with Session(bind=engine) as session:
+        has_rollups = session.execute(db.select(SensorRollupsHourly.pot_id).limit(1)).first() is not None
+        has_readings = session.execute(db.select(SensorReadings.id).limit(1)).first() is not None
+
+        if has_readings and not has_rollups:
+            print("Building sensor reading rollups...")
+            backfill_rollups(session)
+            return True
+
+    return False
+
+
+def history_extent(engine, pot_id):
+    #(first, last) reading time of a pot as epoch seconds, or None when it has no readings
+
+    import numpy as np
+
+    readings = SensorReadings.__tablename__
+    daily = SensorRollupsDaily.__tablename__
+
+    #older readings may only be left as daily rollups; those are placed at the middle of their day
+    query = (f"SELECT (SELECT {epoch_seconds('min(datetime)')} FROM {readings} WHERE pot_id = ?), "
+             f"(SELECT {epoch_seconds('max(datetime)')} FROM {readings} WHERE pot_id = ?), "
+             f"(SELECT {epoch_seconds('min(bucket_start)')} FROM {daily} WHERE pot_id = ?), "
+             f"(SELECT {epoch_seconds('max(bucket_start)')} + 43200 FROM {daily} WHERE pot_id = ?)")
+
+    raw_first, raw_last, first_day, daily_last = fetch_matrix(engine, query, [int(pot_id)] * 4)[0]
+
+    first = raw_first if np.isnan(first_day) or raw_first < first_day + 86400 else first_day + 43200
+    last = raw_last if not np.isnan(raw_last) else daily_last
+
+    if np.isnan(first) or np.isnan(last):
+        return None
+
+    return float(first), float(last)
+
+
+def day_bounds(start, end):
+    #[start, end] widened to whole local days, the granularity every level has in common
+
+    first_day = dt.datetime.fromtimestamp(start).replace(hour=0, minute=0, second=0, microsecond=0)
+    last_day = dt.datetime.fromtimestamp(end).replace(hour=0, minute=0, second=0, microsecond=0) + dt.timedelta(days=1)
+
+    return first_day.strftime(DB_TIME_FORMAT), last_day.strftime(DB_TIME_FORMAT)
+
+
+def reading_count(engine, pot_id, level, day_start, day_end):
+
+    if level == "raw":
+        query = f"SELECT count(*) FROM {SensorReadings.__tablename__} WHERE pot_id = ? AND datetime >= ? AND datetime < ?"
+    else:
+        query = f"SELECT total(reading_count) FROM {RESOLUTIONS[level][0].__tablename__} WHERE pot_id = ? AND bucket_start >= ? AND bucket_start < ?"
+
+    return int(fetch_matrix(engine, query, [int(pot_id), day_start, day_end])[0, 0])
+
+
+def pick_resolution(engine, pot_id, start, end):
+    #the finest level that fits over [start, end]: raw readings while there are at most RAW_LIMIT of them,
+    #then hourly buckets up to ROLLUP_POINTS of them, then daily ones (a few hundred rows for a multi-year range).
+    #A level only counts if it still has every reading of the range, retention thins out raw and hourly data
+
+    day_start, day_end = day_bounds(start, end)
+    total = reading_count(engine, pot_id, "daily", day_start, day_end)
+
+    if total <= RAW_LIMIT and reading_count(engine, pot_id, "raw", day_start, day_end) >= total:
+        return "raw"
+
+    if (end - start) / RESOLUTIONS["hourly"][1] <= ROLLUP_POINTS and reading_count(engine, pot_id, "hourly", day_start, day_end) >= total:
+        return "hourly"
+
+    return "daily"
+
+
+def load_rollup_columns(engine, pot_id, resolution, columns=SERIES, start=None, end=None):
+    #{"datetime": bucket centres, "count": readings per bucket, <column>: mean, <column>_min, <column>_max}
+
+    import numpy as np
+
+    table, bucket_seconds, _ = RESOLUTIONS[resolution]
+
+    if start is not None:
+        start -= bucket_seconds
+
+    range_filter, range_params = time_range_filter("bucket_start", start, end)
+
+    selected = [f"{epoch_seconds('bucket_start')} + {bucket_seconds / 2}", "reading_count"]
+    for name in columns:
+        selected += [f"{name}_sum / nullif({name}_count, 0)", f"{name}_min", f"{name}_max"]
+
+    query = (f"SELECT {', '.join(selected)} FROM {table.__tablename__} "
+             f"WHERE pot_id = ?{range_filter} ORDER BY bucket_start")
+
+    matrix = fetch_matrix(engine, query, [int(pot_id)] + range_params)
+
+    data = {"datetime": np.empty(0), "count": np.empty(0)}
+    for name in columns:
+        data.update({name: np.empty(0), f"{name}_min": np.empty(0), f"{name}_max": np.empty(0)})
+
+    if matrix is None:
+        return data
+
+    data["datetime"] = np.ascontiguousarray(matrix[:, 0])
+    data["count"] = np.ascontiguousarray(matrix[:, 1])
+
+    for i, name in enumerate(columns):
+        data[name] = np.ascontiguousarray(matrix[:, 2 + 3 * i])
+        data[f"{name}_min"] = np.ascontiguousarray(matrix[:, 3 + 3 * i])
+        data[f"{name}_max"] = np.ascontiguousarray(matrix[:, 4 + 3 * i])
+
+    return data
+
+
+if __name__ == "__main__":
+
+    #python sensor_rollups.py [database]: rebuild the rollups from the readings in pyflora.db (or the given file),
+    #the ones older than the readings retention left are kept
+    from pyflora_db import init_db
+    import sys
+
+    with Session(bind=init_db(sys.argv[1] if len(sys.argv) > 1 else None)) as session:
+        since = backfill_rollups(session)
+
+        hourly = session.execute(db.select(db.func.count()).select_from(SensorRollupsHourly)).scalar()
+        daily = session.execute(db.select(db.func.count()).select_from(SensorRollupsDaily)).scalar()
+
+    if since is False:
+        print("No readings left to rebuild rollups from, kept the existing ones.")
+    elif since is not None:
+        print(f"Rebuilt the rollups from {since:%Y-%m-%d} on, older readings were deleted by retention. {hourly} hourly and {daily} daily rollups in total.")
+    else:
+        print(f"Rebuilt {hourly} hourly and {daily} daily rollups.")
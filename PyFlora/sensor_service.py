@@ -0,0 +1,246 @@
+from sqlalchemy.orm import Session
+import sqlalchemy as db
+from pyflora_db import Pots, SensorReadings
+from openweather_temp import current_temperature_ow, temperatures_for
+from weather_locations import LocationMap
+import sensor_sync
+from collections import namedtuple
+import datetime as dt
+
+# Taking sensor readings and recording waterings without any Qt in the way, for the GUI
+# worker, the collector service, the pipeline and the benchmarks alike.
+# take_reading() is take_readings() for a single pot, found by its key and one index seek
+# instead of the list queries (load_pot, load_pots). Both skip pots without a sensor,
+# continue the soil moisture from the pot's last reading, look the temperature up once per
+# weather place (weather_locations.py) and call, and keep the rollups in the same
+# transaction as the readings.
+# Without a current temperature a place gets the newest one recorded for a pot of that same
+# place; a place none of whose pots has one gets readings without a temperature (None),
+# so soil moisture, light and pH are still recorded.
+
+BATCH_SIZE = 500 #readings per transaction
+WATERING_STEP = 1.0 #soil moisture points added by one watering
+
+#record_watering() results
+WATERED = "watered"
+NO_SENSOR = "no sensor"
+NO_READING = "no reading"
+NOT_FOUND = "not found"
+
+ReadingsResult = namedtuple("ReadingsResult", ["readings", "pots", "cancelled"])
+WateringResult = namedtuple("WateringResult", ["status", "pot_name", "plant_name", "soil_moisture"])
+
+
+class SensorReadingService:
+
+    def __init__(self, engine, temperature=current_temperature_ow, batch_size=BATCH_SIZE, locations=None):
+
+        self.engine = engine
+        self.temperature = temperature
+        self.batch_size = batch_size
+        self.locations = locations or LocationMap()
+
+
+    def current_temperatures(self, places):
+        #{place: temperature}, one lookup per distinct place, all of them at the same time;
+        #during a weather outage readings go on with the place's last temperature in the database instead of being dropped
+
+        temperatures = temperatures_for(self.temperature, places)
+        missing = [place for place, temperature_celsius in temperatures.items() if temperature_celsius is None]
+
+        if missing:
+            last_known = self.last_known_temperatures(missing)
+            unavailable = [place for place in missing if place not in last_known]
+
+            if unavailable:
+                print(f"No temperature available for {', '.join(str(place) for place in unavailable)}, the readings are taken without one.")
+
+            for place, (temperature_celsius, measured_at) in last_known.items():
+                print(f"No current temperature for {place}, using {temperature_celsius} °C from {measured_at:%Y-%m-%d %H:%M}.")
+                temperatures[place] = temperature_celsius
+
+        return temperatures
+
+
+    def last_known_temperatures(self, places):
+        #{place: (temperature, time of the reading)} of the newest reading among the pots mapped to each place,
+        #places whose pots never had one are left out
+
+        places = set(places)
+        pot_ids = {}
+
+        with Session(bind=self.engine) as session:
+            pots = session.execute(db.select(Pots.id, Pots.location, Pots.user_id)).all()
+
+            for pot_id, place in self.locations.places(session, pots).items():
+                if place in places:
+                    pot_ids.setdefault(place, []).append(pot_id)
+
+        last_known = {}
+
+        for place, ids in pot_ids.items():
+            newest = self.last_known_temperature(ids)
+
+            if newest is not None:
+                last_known[place] = newest
+
+        return last_known
+
+
+    def last_known_temperature(self, pot_ids=None):
+        #(temperature, time of the reading) of the newest reading that has one, of the given pots or of any pot, or None
+
+        query = (db.select(SensorReadings.temperature_celsius, SensorReadings.datetime)
+                 .where(SensorReadings.temperature_celsius.is_not(None))
+                 .order_by(SensorReadings.datetime.desc(), SensorReadings.id.desc()).limit(1))
+
+        with Session(bind=self.engine) as session:
+            if pot_ids is None:
+                return session.execute(query).first()
+
+            newest = None
+
+            for start in range(0, len(pot_ids), sensor_sync.IN_LIST_LIMIT):
+                row = session.execute(query.where(SensorReadings.pot_id.in_(pot_ids[start:start + sensor_sync.IN_LIST_LIMIT]))).first()
+
+                if row is not None and (newest is None or row.datetime > newest.datetime):
+                    newest = row
+
+            return newest
+
+
+    def load_pots(self, session, pot_ids=None):
+        #(pots in id order, pots with a sensor, {pot id: last reading time}, {pot id: weather place})
+
+        query = session.query(Pots)
+
+        if pot_ids is not None:
+            query = query.filter(Pots.id.in_(pot_ids))
+
+        pots = query.order_by(Pots.id).all()
+        sensor_pots = [pot for pot in pots if sensor_sync.pot_has_sensor(pot)]
+
+        sensor_ids = [pot.id for pot in sensor_pots] if len(sensor_pots) <= sensor_sync.IN_LIST_LIMIT else None
+        last_entry_times = sensor_sync.latest_reading_times(session, sensor_ids) if sensor_pots else {}
+
+        return pots, sensor_pots, last_entry_times, self.locations.places(session, sensor_pots)
+
+
+    def load_pot(self, session, pot_id):
+        #(pot, last reading time, weather place) of a single pot: its primary key and one index seek instead of
+        #load_pots' list queries; None for a pot that does not exist or has no sensor
+
+        pot = session.get(Pots, pot_id)
+
+        if pot is None or not sensor_sync.pot_has_sensor(pot):
+            return None
+
+        last_entry_time = session.execute(db.select(db.func.max(SensorReadings.datetime)).where(SensorReadings.pot_id == pot.id)).scalar()
+
+        return pot, last_entry_time, self.locations.places(session, [pot])[pot.id]
+
+
+    def write_readings(self, new_readings):
+
+        with Session(bind=self.engine) as session:
+            return sensor_sync.write_readings(session, new_readings)
+
+
+    def take_reading(self, pot_id, current_time=None):
+        #the written reading, or None for a pot that does not exist or has no sensor
+
+        current_time = current_time or dt.datetime.now()
+
+        with Session(bind=self.engine) as session:
+            loaded = self.load_pot(session, pot_id)
+
+            if loaded is None:
+                return None
+
+            pot, last_entry_time, place = loaded
+            new_reading = sensor_sync.build_reading(pot, current_time, self.current_temperatures([place])[place], last_entry_time)
+
+            sensor_sync.write_readings(session, [new_reading])
+
+        return new_reading
+
+
+    def take_readings(self, pot_ids=None, current_time=None, reading_times=None, progress=None, should_stop=None):
+        #every pot (or the given ones) gets its readings, written batch_size readings per transaction;
+        #reading_times(last entry time, current time) gives the times to read a pot at, by default just current_time;
+        #progress(pots done, pots) is called and should_stop() checked after every pot; a stop writes what was already built
+
+        current_time = current_time or dt.datetime.now()
+        reading_times = reading_times or (lambda last_entry_time, now: [now])
+
+        written = 0
+        cancelled = False
+
+        with Session(bind=self.engine) as session:
+            pots, sensor_pots, last_entry_times, places = self.load_pots(session, pot_ids)
+            total = len(pots)
+
+            if not sensor_pots:
+                if progress:
+                    progress(total, total)
+                return ReadingsResult(0, total, False)
+
+            temperatures = self.current_temperatures(places.values())
+            batch = []
+
+            for done, pot in enumerate(pots, 1):
+
+                if sensor_sync.pot_has_sensor(pot):
+                    last_entry_time = last_entry_times.get(pot.id)
+                    batch += sensor_sync.build_readings(pot, reading_times(last_entry_time, current_time), temperatures[places[pot.id]], last_entry_time)
+
+                stopping = should_stop is not None and done < total and should_stop()
+
+                if batch and (len(batch) >= self.batch_size or done == total or stopping):
+                    written += sensor_sync.write_readings(session, batch)
+                    batch = []
+
+                if progress:
+                    progress(done, total)
+
+                if stopping:
+                    cancelled = True
+                    break
+
+        return ReadingsResult(written, total, cancelled)
+
+
+    def record_watering(self, pot_id, current_time=None):
+        #a watering is a reading with watering_timestamp set and the last soil moisture raised by WATERING_STEP
+
+        current_time = current_time or dt.datetime.now()
+
+        with Session(bind=self.engine) as session:
+            pot = session.get(Pots, pot_id)
+
+            if pot is None:
+                return WateringResult(NOT_FOUND, None, None, None)
+
+            if not sensor_sync.pot_has_sensor(pot):
+                return WateringResult(NO_SENSOR, pot.name, pot.plant_name, None)
+
+            last_reading = (session.query(SensorReadings.datetime, SensorReadings.soil_moisture).filter_by(pot_id=pot.id)
+                            .order_by(SensorReadings.datetime.desc(), SensorReadings.id.desc()).first())
+
+            if last_reading is None:
+                return WateringResult(NO_READING, pot.name, pot.plant_name, None)
+
+            place = self.locations.places(session, [pot])[pot.id]
+            new_reading = sensor_sync.build_reading(pot, current_time, self.current_temperatures([place])[place], last_reading.datetime)
+            new_reading["watering_timestamp"] = current_time
+            new_reading["soil_moisture"] = max(1, min(10, last_reading.soil_moisture + WATERING_STEP))
+
+            sensor_sync.write_readings(session, [new_reading])
+
+            return WateringResult(WATERED, pot.name, pot.plant_name, new_reading["soil_moisture"])
+
+
+    def last_watering(self, pot_id):
+
+        with Session(bind=self.engine) as session:
+            return session.execute(db.select(db.func.max(SensorReadings.watering_timestamp)).where(SensorReadings.pot_id == pot_id)).scalar()
@@ -0,0 +1,75 @@
+import sqlalchemy as db
+from pyflora_db import Pots, SensorReadings
+from sensor_light import calculate_intensity
+from sensor_moisture import initial_soil_moisture, measure_soil_moisture
+from sensor_ph import measure_soil_ph
+import sensor_rollups
+
+#above this many pots the latest-reading query reads every pot instead of binding a long IN list
+IN_LIST_LIMIT = 500
+
+
+def pot_has_sensor(pot):
+
+    pot_name = pot.name.lower()
+
+    return not ('empty' in pot_name or 'broken' in pot_name)
+
+
+def latest_reading_times(session, pot_ids=None):
+    #one query for every pot instead of an order_by(...).first() per pot. A correlated max() per pot, not a GROUP BY:
+    #SQLite answers each max() with a single seek on the (pot_id, datetime) index, the GROUP BY walks every reading
+
+    latest = db.select(db.func.max(SensorReadings.datetime)).where(SensorReadings.pot_id == Pots.id).scalar_subquery()
+    query = db.select(Pots.id, latest)
+
+    if pot_ids is not None:
+        query = query.where(Pots.id.in_(pot_ids))
+
+    return {pot_id: last_entry_time for pot_id, last_entry_time in session.execute(query) if last_entry_time is not None}
+
+
+def build_reading(pot, current_time, current_temperature, last_entry_time):
+
+    #light for the reading's own time of day, so catch-up readings for past times look like they were taken then
+    light_intensity = round(calculate_intensity(pot.light_intensity, current_time.time()), 2)
+
+    if last_entry_time:
+        time_delta = (current_time - last_entry_time).total_seconds()/3600
+        soil_moisture_calc = measure_soil_moisture(pot.soil_moisture, current_temperature, light_intensity, time_delta)
+    else:
+        soil_moisture_calc = initial_soil_moisture(pot.soil_moisture)
+
+    return {
+        "pot_id": pot.id,
+        "datetime": current_time,
+        "watering_timestamp": None,
+        "temperature_celsius": current_temperature,
+        "light_intensity_lux": light_intensity,
+        "soil_moisture": soil_moisture_calc,
+        "soil_ph": measure_soil_ph(pot.soil_ph)
+    }
+
+
+def build_readings(pot, reading_times, current_temperature, last_entry_time):
+    #several readings of one pot in time order, each one continuing from the one before
+
+    new_readings = []
+
+    for reading_time in reading_times:
+        new_readings.append(build_reading(pot, reading_time, current_temperature, last_entry_time))
+        last_entry_time = reading_time
+
+    return new_readings
+
+
+def write_readings(session, new_readings):
+
+    if not new_readings:
+        return 0
+
+    session.execute(db.insert(SensorReadings), new_readings)
+    sensor_rollups.add_readings(session, new_readings)
+    session.commit()
+
+    return len(new_readings)
@@ -0,0 +1,143 @@
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+from pyflora_db import init_db, get_engine
+from sensor_service import SensorReadingService
+import sensor_retention
+import sensor_rollups
+import threading
+import traceback
+
+CHUNK_SIZE = 25 #readings per transaction; progress and cancelling go pot by pot
+
+
+class SensorSyncSignals(QObject):
+
+    progress = pyqtSignal(int, int) #pots processed, total pots
+    finished = pyqtSignal(int, bool) #readings written, cancelled
+    failed = pyqtSignal(str)
+
+
+class SensorSyncWorker(QRunnable):
+    #collects sensor readings off the GUI thread; results come back through queued Qt signals
+
+    def __init__(self, pot_ids=None, chunk_size=CHUNK_SIZE):
+        super(SensorSyncWorker, self).__init__()
+
+        self.pot_ids = pot_ids
+        self.chunk_size = chunk_size
+        self.signals = SensorSyncSignals()
+
+        self._cancelled = threading.Event()
+
+
+    def cancel(self):
+
+        self._cancelled.set()
+
+
+    def is_cancelled(self):
+
+        return self._cancelled.is_set()
+
+
+    def run(self):
+
+        try:
+            service = SensorReadingService(get_engine(), batch_size=self.chunk_size)
+
+            if self.pot_ids is not None and len(self.pot_ids) == 1:
+                #a single pot is found by its key (take_reading) instead of going through the list queries and batches
+                reading = service.take_reading(self.pot_ids[0])
+                self.signals.progress.emit(1, 1)
+                self.signals.finished.emit(0 if reading is None else 1, False)
+                return
+
+            result = service.take_readings(self.pot_ids, progress=self.signals.progress.emit, should_stop=self.is_cancelled)
+
+        except Exception:
+            traceback.print_exc()
+            self.signals.failed.emit("Sensor synchronization failed.")
+            return
+
+        self.signals.finished.emit(result.readings, result.cancelled)
+
+
+class WateringSignals(QObject):
+
+    finished = pyqtSignal(object) #sensor_service.WateringResult
+    failed = pyqtSignal(str)
+
+
+class WateringWorker(QRunnable):
+    #records a watering off the GUI thread: the weather lookup and the write can take seconds
+
+    def __init__(self, service, pot_id):
+        super(WateringWorker, self).__init__()
+
+        self.service = service
+        self.pot_id = pot_id
+        self.signals = WateringSignals()
+
+
+    def run(self):
+
+        try:
+            result = self.service.record_watering(self.pot_id)
+
+        except Exception:
+            traceback.print_exc()
+            self.signals.failed.emit("Watering failed.")
+            return
+
+        self.signals.finished.emit(result)
+
+
+class RetentionSignals(QObject):
+
+    finished = pyqtSignal(object) #sensor_retention.RetentionReport
+    failed = pyqtSignal(str)
+
+
+class RetentionWorker(QRunnable):
+    #deletes old readings in small batches while the app keeps running; stops between batches when cancelled.
+    #How long readings are kept and whether to vacuum comes from the [retention] settings
+
+    def __init__(self):
+        super(RetentionWorker, self).__init__()
+
+        self.raw_days = sensor_retention.configured_days("raw_days", sensor_retention.RAW_DAYS)
+        self.hourly_days = sensor_retention.configured_days("hourly_days", sensor_retention.HOURLY_DAYS)
+        self.vacuum = sensor_retention.configured_vacuum()
+        self.signals = RetentionSignals()
+
+        self._cancelled = threading.Event()
+
+
+    def cancel(self):
+
+        self._cancelled.set()
+
+
+    def run(self):
+
+        try:
+            report = sensor_retention.apply_retention(get_engine(), self.raw_days, self.hourly_days, self.vacuum, should_stop=self._cancelled.is_set)
+
+        except Exception:
+            traceback.print_exc()
+            self.signals.failed.emit("Cleaning up old sensor readings failed.")
+            return
+
+        self.signals.finished.emit(report)
+
+
+class BackfillWorker(QRunnable):
+    #opens the database and builds the rollups of old readings once, while the login screen stays responsive
+
+    def run(self):
+
+        try:
+            sensor_rollups.ensure_backfilled(init_db())
+
+        except Exception:
+            traceback.print_exc()
+            print("Building sensor reading rollups failed.")
@@ -0,0 +1,128 @@
+import sys
+import time
+
+# Start-up profiling: python startup_profile.py [--login USER:PASSWORD] [--json FILE]
+# Runs the app under python -X importtime with --profile-startup. The app then writes a
+# marker to stderr at the end of every phase (imports done, login screen shown, waiting
+# for the login, home screen shown, first tab ready), and the imports Python reports
+# between two markers are counted to that phase. With --login the app logs in by itself
+# and quits once the first tab is ready, so runs can be compared over time.
+
+MARKER = "pyflora startup phase:"
+TOP_IMPORTS = 8 #slowest imports listed per phase
+
+STARTED = time.perf_counter()
+
+ENABLED = "--profile-startup" in sys.argv
+AUTO_LOGIN = next((arg.split("=", 1)[1] for arg in sys.argv if arg.startswith("--profile-login=")), None)
+
+
+def mark(phase):
+
+    if ENABLED:
+        print(f"{MARKER} {phase} {time.perf_counter() - STARTED:.6f}", file=sys.stderr, flush=True)
+
+
+def login_screen_shown(login_screen):
+
+    mark("login screen shown")
+
+    if ENABLED and AUTO_LOGIN:
+        username, password = AUTO_LOGIN.split(":", 1)
+        login_screen.username_input.setText(username)
+        login_screen.password_input.setText(password)
+        login_screen.authenticate()
+
+
+def first_tab_ready():
+
+    mark("first tab ready")
+
+    if ENABLED and AUTO_LOGIN:
+        from PyQt5.QtWidgets import QApplication
+        QApplication.quit()
+
+
+def parse(stderr):
+    #[(phase, seconds, [(module, cumulative seconds), ...])] from the app's stderr; only top-level imports, nested ones are part of them
+
+    phases = []
+    imports = []
+
+    for line in stderr.splitlines():
+        #interpreter start-up imports (site, encodings, ...) come before this module, the clock starts with it
+        if line.rstrip().endswith("| startup_profile"):
+            imports = []
+            continue
+
+        if line.startswith(MARKER):
+            phase, _, seconds = line[len(MARKER):].strip().rpartition(" ")
+            phases.append((phase, float(seconds), imports))
+            imports = []
+
+        elif line.startswith("import time:") and not line.rstrip().endswith("imported package"):
+            _, cumulative, name = line[len("import time:"):].split("|")
+
+            if not name[1:].startswith(" "):
+                imports.append((name.strip(), int(cumulative) / 1e6))
+
+    return phases
+
+
+def report(phases):
+
+    rows = []
+    previous = 0.0
+
+    for phase, seconds, imports in phases:
+        import_seconds = sum(cumulative for _, cumulative in imports)
+        slowest = sorted(imports, key=lambda item: item[1], reverse=True)[:TOP_IMPORTS]
+
+        rows.append({"phase": phase, "at": seconds, "seconds": seconds - previous, "imports": import_seconds,
+                     "other": seconds - previous - import_seconds, "slowest_imports": slowest})
+        previous = seconds
+
+    return rows
+
+
+def print_report(rows):
+
+    print(f"{'phase':<20} | {'at':>8} | {'phase':>8} | {'imports':>8} | {'other':>8}")
+
+    for row in rows:
+        print(f"{row['phase']:<20} | {row['at'] * 1000:6.0f}ms | {row['seconds'] * 1000:6.0f}ms | {row['imports'] * 1000:6.0f}ms | {row['other'] * 1000:6.0f}ms")
+
+        for name, cumulative in row["slowest_imports"]:
+            print(f"{'':<20}   {cumulative * 1000:6.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+
+    import subprocess
+    import argparse
+    import json
+    import os
+
+    parser = argparse.ArgumentParser(description="Time the start-up of PyFlora phase by phase.")
+    parser.add_argument("--login", help="USER:PASSWORD to log in with automatically, then quit")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    command = [sys.executable, "-X", "importtime", os.path.join(app_dir, "1_pyflora_main.py"), "--profile-startup"]
+
+    if args.login:
+        command.append(f"--profile-login={args.login}")
+
+    stderr = subprocess.run(command, cwd=app_dir, stderr=subprocess.PIPE, text=True).stderr
+    rows = report(parse(stderr))
+
+    if not rows:
+        print(stderr)
+        sys.exit("The app ended before the first phase.")
+
+    print_report(rows)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump(rows, json_file, indent=2)
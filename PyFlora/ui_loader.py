@@ -0,0 +1,75 @@
+from PyQt5 import QtWidgets
+import pyflora_config
+import importlib
+import hashlib
+import os
+import re
+
+# load_ui() builds a screen from the module build_ui.py generated for its .ui file, which
+# skips parsing the XML with uic on every start and login. When the module is missing,
+# was built from an older version of the .ui file, or [ui] precompiled is off, it falls
+# back to loadUi. Like loadUi, every named child ends up as an attribute of the widget.
+
+UI_FILES = ["pyflora_login.ui", "pyflora_app.ui", "plants_info.ui", "plants_add.ui", "pots_info.ui", "pots_add.ui", "profile_info.ui"]
+
+TOP_WIDGET = re.compile(rb'<widget class="(\w+)"')
+
+
+def module_name(ui_file):
+
+    return os.path.splitext(os.path.basename(ui_file))[0] + "_ui"
+
+
+def source_hash(path):
+    #line endings left out, so a checkout with CRLF files still matches
+
+    with open(path, "rb") as ui_source:
+        return hashlib.sha1(ui_source.read().replace(b"\r", b"")).hexdigest()
+
+
+def widget_class(path):
+
+    with open(path, "rb") as ui_source:
+        return TOP_WIDGET.search(ui_source.read()).group(1).decode("ascii")
+
+
+def use_precompiled():
+
+    return pyflora_config.get("ui", "precompiled").lower() in ("1", "yes", "true", "on")
+
+
+def compiled_module(ui_file):
+    #the generated module for ui_file, or None when it has to be loaded with loadUi
+
+    if not use_precompiled():
+        return None
+
+    try:
+        module = importlib.import_module(module_name(ui_file))
+    except ImportError:
+        return None
+
+    if module.SOURCE_HASH != source_hash(os.path.join(pyflora_config.APP_DIR, ui_file)):
+        print(f"{ui_file} changed since it was built, loading it with loadUi. Run build_ui.py to update {module.__name__}.py.")
+        return None
+
+    return module
+
+
+def load_ui(ui_file, baseinstance=None):
+
+    module = compiled_module(ui_file)
+
+    if module is None:
+        from PyQt5.uic import loadUi
+        return loadUi(os.path.join(pyflora_config.APP_DIR, ui_file), baseinstance)
+
+    widget = baseinstance if baseinstance is not None else getattr(QtWidgets, module.WIDGET_CLASS)()
+
+    ui = module.UI_CLASS()
+    ui.setupUi(widget)
+
+    for name, child in vars(ui).items():
+        setattr(widget, name, child)
+
+    return widget
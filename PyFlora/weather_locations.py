@@ -0,0 +1,52 @@
+from pyflora_db import Users
+import pyflora_config
+
+# Which weather a pot gets, for pots spread over several sites. The [locations] section of
+# pyflora.ini maps a pot location or a user to a city or to "latitude,longitude":
+#
+#   [locations]
+#   balcony = Split
+#   greenhouse = 45.815,15.982
+#   user.marta = Zagreb
+#
+# A pot takes the entry for its own location, else the one for its owner, else the
+# [weather] city. Keys are not case sensitive.
+
+USER_PREFIX = "user."
+
+
+class LocationMap:
+
+    def __init__(self, locations=None, default=None):
+
+        if locations is None:
+            locations = pyflora_config.items("locations")
+
+        self.locations = {key.strip().lower(): place.strip() for key, place in locations.items() if place.strip()}
+        self.default = default or pyflora_config.get("weather", "city") or None
+
+        self.by_user = any(key.startswith(USER_PREFIX) for key in self.locations)
+
+
+    def place_for(self, pot, username=None):
+
+        place = self.locations.get((pot.location or "").strip().lower())
+
+        if place is None and username:
+            place = self.locations.get(USER_PREFIX + username.lower())
+
+        return place or self.default
+
+
+    def places(self, session, pots):
+        #{pot id: place}, owners are only looked up when some user has an entry
+
+        usernames = {}
+
+        if self.by_user:
+            user_ids = {pot.user_id for pot in pots if pot.user_id is not None}
+
+            if user_ids:
+                usernames = dict(session.query(Users.id, Users.username).filter(Users.id.in_(user_ids)))
+
+        return {pot.id: self.place_for(pot, usernames.get(pot.user_id)) for pot in pots}
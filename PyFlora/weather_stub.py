@@ -0,0 +1,72 @@
+from aiohttp import web
+from openweather_temp import ReplayWeatherBackend
+import argparse
+import asyncio
+import random
+import zlib
+
+# Local stand-in for the OpenWeather current weather endpoint, for benchmarks and for
+# running the app without an API key:
+# python weather_stub.py [--port 8765] [--latency 0.05] [--jitter 0.02] [--error-rate 0.1] [--seed 1] [--replay FILE]
+# GET /data/2.5/weather?q=<city> (or ?lat=..&lon=..) answers with a temperature that is
+# stable per place, or with the responses recorded in FILE (see openweather_temp.py).
+# A share of the requests (error_rate) fails with one of ERROR_STATUSES; with a seed the
+# failures repeat run to run.
+
+DEFAULT_PORT = 8765
+ERROR_STATUSES = (429, 500, 502, 503)
+
+
+def city_temperature(city):
+
+    return round(5 + zlib.crc32(city.lower().encode("utf-8")) % 2500 / 100, 2)
+
+
+def create_app(latency=0.0, jitter=0.0, error_rate=0.0, seed=None, replay=None):
+
+    rng = random.Random(seed)
+    replay_backend = ReplayWeatherBackend(replay) if replay else None
+
+    async def current_weather(request):
+
+        if "lat" in request.query:
+            city = f"{request.query['lat']},{request.query.get('lon', '')}"
+        else:
+            city = request.query.get("q", "")
+
+        delay = latency + (rng.uniform(0, jitter) if jitter else 0)
+        failing = error_rate and rng.random() < error_rate
+
+        if delay:
+            await asyncio.sleep(delay)
+
+        if failing:
+            status = rng.choice(ERROR_STATUSES)
+            return web.json_response({"cod": str(status), "message": "stub error"}, status=status)
+
+        if replay_backend:
+            status, body = replay_backend.response(city)
+            return web.json_response(body, status=status)
+
+        return web.json_response({"name": city, "main": {"temp": city_temperature(city)}})
+
+    app = web.Application()
+    app.router.add_get("/data/2.5/weather", current_weather)
+
+    return app
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Serve fake OpenWeather current weather responses.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many random seconds added on top of the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with an error status (0-1)")
+    parser.add_argument("--seed", type=int, help="random seed for reproducible jitter and errors")
+    parser.add_argument("--replay", help="serve the responses recorded in this file instead of generated ones")
+    args = parser.parse_args()
+
+    web.run_app(create_app(args.latency, args.jitter, args.error_rate, args.seed, args.replay),
+                host=args.host, port=args.port, print=None, access_log=None)